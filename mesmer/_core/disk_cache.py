@@ -0,0 +1,136 @@
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+from collections.abc import Callable
+
+import numpy as np
+
+from mesmer._core.options import OPTIONS
+
+# size of the content hash in bytes
+_DIGEST_SIZE = 20
+
+# files written by the cache: "{name}-{key}.npy" - other files are never removed
+_CACHE_FILE_PATTERN = re.compile(rf"[a-z0-9_]+-[0-9a-f]{{{2 * _DIGEST_SIZE}}}\.npy")
+
+
+def _disk_cache_enabled() -> bool:
+    return OPTIONS["disk_cache_dir"] is not None
+
+
+def _cache_key(*arrays: np.ndarray, **params) -> str:
+    """content hash of the input arrays and parameters of a cached computation"""
+
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    h.update(repr(sorted(params.items())).encode())
+
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+
+        h.update(str((arr.dtype.str, arr.shape)).encode())
+        h.update(arr.view(np.uint8).data)
+
+    return h.hexdigest()
+
+
+def _cached_array(name: str, compute: Callable[[], np.ndarray], key: str) -> np.ndarray:
+    """load the result of ``compute()`` from the on-disk cache or compute and store it
+
+    The cache is enabled by the ``disk_cache_dir`` option (see
+    :class:`mesmer.set_options`). The results are stored as ``.npy`` files named by
+    ``name`` and ``key``, which must be the content hash of all inputs of ``compute``
+    (see ``_cache_key``). They are returned as copy-on-write memory maps (modifying them
+    does not change the cache). The least recently used files are removed once the
+    total size exceeds the ``disk_cache_size`` option.
+
+    Parameters
+    ----------
+    name : str
+        Name of the computation, used as prefix of the file name.
+    compute : callable
+        Function without arguments returning a numpy array.
+    key : str
+        Content hash of the inputs of ``compute``.
+    """
+
+    cache_dir = OPTIONS["disk_cache_dir"]
+
+    if cache_dir is None:
+        return compute()
+
+    cache_dir = pathlib.Path(cache_dir)
+    filename = cache_dir / f"{name}-{key}.npy"
+
+    try:
+        out = np.load(filename, mmap_mode="c")
+    except FileNotFoundError:
+        pass
+    else:
+        # mark as recently used
+        os.utime(filename)
+        return out
+
+    out = compute()
+
+    max_nbytes = OPTIONS["disk_cache_size"]
+
+    if out.nbytes > max_nbytes:
+        return out
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # write to a temporary file first such that other processes never see a partial file
+    with tempfile.NamedTemporaryFile(
+        dir=cache_dir, prefix=f".{name}-", suffix=".npy.tmp", delete=False
+    ) as f:
+        try:
+            np.save(f, out)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+
+    try:
+        os.replace(f.name, filename)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+    _evict(cache_dir, max_nbytes, keep=filename)
+
+    return np.load(filename, mmap_mode="c")
+
+
+def _evict(cache_dir: pathlib.Path, max_nbytes: int, keep: pathlib.Path):
+    """remove the least recently used files until the cache is smaller than
+    ``max_nbytes``
+
+    Only files named like the cache entries are considered, other files in
+    ``cache_dir`` are neither counted nor removed.
+    """
+
+    files = []
+    for filename in cache_dir.glob("*.npy"):
+        if not _CACHE_FILE_PATTERN.fullmatch(filename.name):
+            continue
+
+        try:
+            stat = filename.stat()
+        except FileNotFoundError:
+            # removed by another process
+            continue
+        files.append((stat.st_mtime, stat.st_size, filename))
+
+    total = sum(size for __, size, __ in files)
+
+    for __, size, filename in sorted(files):
+        if total <= max_nbytes:
+            break
+
+        if filename == keep:
+            continue
+
+        filename.unlink(missing_ok=True)
+        total -= size
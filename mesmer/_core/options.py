@@ -1,15 +1,30 @@
 # adapted from xarray under the terms of its license - see licences/XARRAY_LICENSE
 from __future__ import annotations
 
+import os
 from typing import Literal, TypedDict, Unpack
 
 
 class _OPTIONS(TypedDict, total=False):
     threads: Literal["default"] | int | None
+    covariance_cache_size: int
+    draw_workers: int
+    crossvalidation_cache_size: int
+    crossvalidation_workers: int
+    geodist_workers: int
+    disk_cache_dir: str | os.PathLike | None
+    disk_cache_size: int
 
 
 OPTIONS: _OPTIONS = {
     "threads": "default",
+    "covariance_cache_size": 2**30,
+    "draw_workers": 1,
+    "crossvalidation_cache_size": 2**30,
+    "crossvalidation_workers": 1,
+    "geodist_workers": 1,
+    "disk_cache_dir": None,
+    "disk_cache_size": 2**33,
 }
 
 
@@ -24,8 +39,36 @@ def _assert_valid_threads_option(name, threads):
         raise ValueError(msg)
 
 
+def _assert_non_negative_int(name, value):
+
+    if not (isinstance(value, int) and not isinstance(value, bool) and value >= 0):
+        msg = f"'{name}' must be a non-negative integer, got '{value}'"
+        raise ValueError(msg)
+
+
+def _assert_positive_int(name, value):
+
+    if not (isinstance(value, int) and not isinstance(value, bool) and value > 0):
+        msg = f"'{name}' must be a positive integer, got '{value}'"
+        raise ValueError(msg)
+
+
+def _assert_path_or_none(name, value):
+
+    if not (value is None or isinstance(value, str | os.PathLike)):
+        msg = f"'{name}' must be a path or None, got '{value}'"
+        raise ValueError(msg)
+
+
 _VALIDATORS = {
     "threads": _assert_valid_threads_option,
+    "covariance_cache_size": _assert_non_negative_int,
+    "draw_workers": _assert_positive_int,
+    "crossvalidation_cache_size": _assert_non_negative_int,
+    "crossvalidation_workers": _assert_positive_int,
+    "geodist_workers": _assert_positive_int,
+    "disk_cache_dir": _assert_path_or_none,
+    "disk_cache_size": _assert_non_negative_int,
 }
 
 
@@ -45,6 +88,47 @@ class set_options:
 
         * int: sets the maximum number of threads to `threads`
 
+    covariance_cache_size : int, default: 2**30
+        Maximum size (in bytes) of the cache for the factors of covariance matrices
+        used to draw spatially-correlated innovations. The cache avoids decomposing the
+        same covariance matrix repeatedly (e.g., for several scenarios). The least
+        recently used factors are discarded first. Set to 0 to disable the cache.
+
+    draw_workers : int, default: 1
+        Number of threads used to draw realisations for several scenarios concurrently
+        (i.e., if ``seed`` is a ``DataTree``). The number of threads for matrix
+        operations (see ``threads``) is divided between the workers.
+
+    crossvalidation_cache_size : int, default: 2**30
+        Maximum size (in bytes) of the covariance matrices of the cross validation folds
+        kept in memory by :func:`mesmer.stats.find_localized_empirical_covariance`. The
+        matrices do not depend on the localization radius and are reused for all radii
+        if they fit. Set to 0 to recompute them for every radius.
+
+    crossvalidation_workers : int, default: 1
+        Number of threads used to evaluate the cross validation folds of
+        :func:`mesmer.stats.find_localized_empirical_covariance` concurrently, or the
+        months of :func:`mesmer.stats.find_localized_empirical_covariance_monthly`. The
+        number of threads for matrix operations (see ``threads``) is divided between the
+        workers.
+
+    geodist_workers : int, default: 1
+        Number of threads used to compute the blocks of the distance matrix in
+        :func:`mesmer.geospatial.geodist_exact` concurrently.
+
+    disk_cache_dir : str | os.PathLike | None, default: None
+        Directory to cache constants that only depend on the grid on disk, i.e., the
+        results of :func:`mesmer.geospatial.geodist_exact`,
+        :func:`mesmer.stats.gaspari_cohn_correlation_matrices` (for dense distances) and
+        the land fraction of :func:`mesmer.mask.mask_ocean_fraction`. The entries are
+        keyed by a hash of the coordinates and parameters and are returned as
+        memory-mapped arrays. The directory can be shared between processes. None
+        disables the cache.
+
+    disk_cache_size : int, default: 2**33
+        Maximum total size (in bytes) of the on-disk cache, see ``disk_cache_dir``. The
+        least recently used entries are removed first.
+
     Examples
     --------
     >>> import mesmer
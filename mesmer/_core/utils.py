@@ -110,6 +110,129 @@ def _minimize_local_discrete(func: Callable, sequence: Iterable, **kwargs):
     return element
 
 
+class _BracketingSearch:
+    """find the local minimum for a unimodal function that consumes discrete input
+
+    Alternative to ``_minimize_local_discrete`` that does not evaluate ``func`` for all
+    elements up to the local minimum but narrows down a bracket around the minimum with
+    a golden-section search over the positions of ``sequence``. Each element is
+    evaluated at most once.
+
+    The search assumes that ``func`` is unimodal over ``sequence``. It falls back to the
+    linear scan of ``_minimize_local_discrete`` (reusing all evaluations) if the
+    evaluated values contradict this assumption, in which case the results agree. The
+    number of evaluations and the number of evaluations saved compared to the linear
+    scan (which can be negative if the minimum is at the start of ``sequence``) are
+    stored in the ``n_evaluations`` and ``n_evaluations_saved`` attributes after each
+    call.
+    """
+
+    def __init__(self):
+
+        self.n_evaluations = None
+        self.n_evaluations_saved = None
+
+    def __call__(self, func: Callable, sequence: Iterable, **kwargs):
+        """find the local minimum, see ``_minimize_local_discrete``"""
+
+        sequence = list(sequence)
+        n = len(sequence)
+
+        values: dict[int, float] = {}
+
+        def _func(i):
+            if i not in values:
+                values[i] = func(sequence[i], **kwargs)
+            return values[i]
+
+        # positions of the bracket which contains the minimum
+        lower, upper = 0, n - 1
+
+        while upper - lower > 2:
+            left = lower + round((upper - lower) * 0.381966)
+            right = max(lower + upper - left, left + 1)
+
+            if np.isneginf(_func(left)) or np.isneginf(_func(right)):
+                # let the linear scan raise the error
+                break
+
+            if _func(left) <= _func(right):
+                upper = right
+            else:
+                lower = left
+
+        pos = self._find_local_minimum(_func, values, lower, upper, n)
+
+        if pos is None:
+            pos = _minimize_local_discrete(_func, range(n))
+        else:
+            self._warn_like_linear_scan(values, pos, n)
+
+        n_evaluations_linear = min(pos + 2, n)
+
+        self.n_evaluations = len(values)
+        self.n_evaluations_saved = n_evaluations_linear - len(values)
+
+        return sequence[pos]
+
+    @staticmethod
+    def _find_local_minimum(func, values, lower, upper, n):
+        """position of the local minimum in the bracket, None if the values are not
+        unimodal"""
+
+        if any(np.isneginf(value) for value in values.values()):
+            return None
+
+        pos = upper
+        for i in range(upper, lower - 1, -1):
+            if func(i) < func(pos):
+                pos = i
+
+        # the linear scan continues as long as the values do not increase
+        while pos < n - 1 and func(pos + 1) <= func(pos):
+            pos += 1
+
+        if pos > 0:
+            func(pos - 1)
+
+        if np.isinf(values[pos]):
+            return None
+
+        # the evaluated values must decrease up to the minimum and increase afterwards
+        evaluated = [values[i] for i in sorted(values)]
+        n_left = sorted(values).index(pos)
+        left, right = evaluated[: n_left + 1], evaluated[n_left:]
+
+        if any(a < b for a, b in zip(left[:-1], left[1:])):
+            return None
+        if any(a > b for a, b in zip(right[:-1], right[1:])):
+            return None
+
+        return pos
+
+    @staticmethod
+    def _warn_like_linear_scan(values, pos, n):
+
+        if pos == n - 1:
+            warnings.warn(
+                "No local minimum found, returning the last element", OptimizeWarning
+            )
+            return
+
+        if pos == 0:
+            warnings.warn("First element is local minimum.", OptimizeWarning)
+
+        # the linear scan evaluates the elements up to pos + 1
+        posinf_positions = [
+            str(i) for i in sorted(values) if i <= pos + 1 and np.isinf(values[i])
+        ]
+
+        if posinf_positions:
+            positions = "', '".join(posinf_positions)
+            msg = f"`fun` returned `inf` at position(s) '{positions}'"
+            warnings.warn(msg, OptimizeWarning)
+
+
 def _to_set(arg) -> set:
 
     if arg is None:
@@ -264,22 +387,48 @@ def _assert_required_coords(
         raise ValueError(f"{name} is missing the required coords: {missing_coords}")
 
 
-@contextmanager
-def _set_threads_from_options():
+def _get_threads_from_options() -> int | None:
 
     from mesmer._core.options import OPTIONS
 
     threads_option = OPTIONS["threads"]
 
     if threads_option == "default":
-        threads = min(os.cpu_count() // 2, 16)
-    else:
-        threads = threads_option
+        return min(os.cpu_count() // 2, 16)
+
+    return threads_option
+
+
+@contextmanager
+def _set_threads_from_options():
+
+    threads = _get_threads_from_options()
 
     with threadpoolctl.threadpool_limits(limits=threads):
         yield
 
 
+@contextmanager
+def _divide_threads_between_workers(workers, **options):
+    """divide the ``threads`` option between ``workers`` concurrent workers
+
+    threadpoolctl limits are process-wide - they are set once for all workers, and
+    ``threads=None`` keeps the workers from changing them. Additional ``options`` are
+    set for the workers as well, e.g., to run nested calls sequentially.
+    """
+
+    from mesmer._core.options import set_options
+
+    threads = _get_threads_from_options()
+    limits = None if threads is None else max(1, threads // workers)
+
+    with (
+        threadpoolctl.threadpool_limits(limits=limits),
+        set_options(threads=None, **options),
+    ):
+        yield
+
+
 def _ignore_warnings(messages: list[str] | None = None):
 
     if messages is None:
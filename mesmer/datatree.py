@@ -1,5 +1,6 @@
 import functools
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import ParamSpec, TypeVar, overload
 
 import pandas as pd
@@ -71,6 +72,42 @@ def map_over_datasets(func, *args, kwargs=None):
     return xr.map_over_datasets(_skip_empty_nodes(func), *args, kwargs=kwargs)
 
 
+def _map_over_datasets_concurrently(func, dt, *args, kwargs=None, max_workers=None):
+    """
+    Applies a function to every dataset in a DataTree using a pool of threads
+
+    Like ``map_over_datasets(func, dt, *args, kwargs=kwargs)`` but only supports one
+    DataTree, which must be the first argument. Empty nodes are skipped.
+
+    Parameters
+    ----------
+    func : callable
+        Function to apply to datasets with signature
+        ``func(ds: Dataset, *args, **kwargs) -> Dataset``. Must be thread-safe.
+    dt : DataTree
+        DataTree whose datasets are passed to ``func``.
+    *args : tuple, optional
+        Further positional arguments passed on to `func`.
+    kwargs : dict, optional
+        Optional keyword arguments passed directly to ``func``.
+    max_workers : int, optional
+        Maximum number of threads.
+    """
+
+    kwargs = {} if kwargs is None else kwargs
+    func = _skip_empty_nodes(func)
+
+    nodes = {node.path: node for node in dt.subtree}
+
+    def _func(node):
+        return func(node.to_dataset(inherit=False), *args, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_func, nodes.values()))
+
+    return xr.DataTree.from_dict(dict(zip(nodes, results, strict=True)))
+
+
 def _extract_single_dataarray_from_dt(
     dt: xr.DataTree, name: str = "node"
 ) -> xr.DataArray:
@@ -3,11 +3,17 @@
 # Licensed under the GNU General Public License v3.0 or later see LICENSE or
 # https://www.gnu.org/licenses/
 
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pyproj
+import scipy.sparse
 import xarray as xr
-from sklearn.metrics.pairwise import haversine_distances
+from sklearn.neighbors import BallTree
 
+from mesmer._core.disk_cache import _cache_key, _cached_array, _disk_cache_enabled
+from mesmer._core.options import OPTIONS
 from mesmer._core.utils import _create_equal_dim_names
 
 
@@ -16,6 +22,8 @@ def geodist_exact(
     lat: xr.DataArray | np.ndarray,
     *,
     equal_dim_suffixes: tuple[str, str] = ("_i", "_j"),
+    dtype: str | np.dtype | None = None,
+    out: np.ndarray | None = None,
 ):
     """exact great circle distance based on WSG 84
 
@@ -28,11 +36,26 @@ def geodist_exact(
     equal_dim_suffixes : tuple of str, default: ("_i", "_j")
         Suffixes to add to the the name of ``dim`` for the geodist array (xr.DataArray
         cannot have two dimensions with the same name).
+    dtype : str | np.dtype | None, default: None
+        Floating point type of the distances, e.g., "float32" to halve the memory
+        requirement. Defaults to "float64" or the dtype of ``out``.
+    out : np.ndarray, optional
+        Array of shape (n_points, n_points) to write the distances to, e.g., a
+        memory-mapped array (``np.memmap``, ``np.lib.format.open_memmap``) for grids
+        whose distance matrix does not fit into memory.
 
     Returns
     -------
     geodist : xr.DataArray, np.ndarray
-        2D array of great circle distances.
+        2D array of great circle distances (in km). Wraps ``out`` if passed.
+
+    Notes
+    -----
+    The distances are computed in square blocks of the upper triangle, which are
+    evaluated concurrently if the ``geodist_workers`` option of
+    :class:`mesmer.set_options` is larger than 1. If the ``disk_cache_dir`` option is
+    set (and ``out`` is not passed), the distances are loaded from the on-disk cache
+    for known coordinates.
     """
 
     # TODO: allow Dataset (e.g. using cf_xarray)
@@ -41,7 +64,7 @@ def geodist_exact(
 
     # handle numpy arrays
     if not isinstance(lon, xr.DataArray) or not isinstance(lat, xr.DataArray):
-        return _geodist_exact(np.asarray(lon), np.asarray(lat))
+        return _geodist_exact_cached(np.asarray(lon), np.asarray(lat), dtype, out)
 
     # TODO: allow differently named lon and lat dims?
     if lon.dims != lat.dims:
@@ -50,7 +73,7 @@ def geodist_exact(
             "equally named dimensions from a stacked array"
         )
 
-    geodist = _geodist_exact(lon.values, lat.values)
+    geodist = _geodist_exact_cached(lon.values, lat.values, dtype, out)
 
     (dim,) = lon.dims
     dims = _create_equal_dim_names(dim, equal_dim_suffixes)
@@ -61,46 +84,191 @@ def geodist_exact(
     return geodist
 
 
-def _geodist_exact(lon, lat):
+def _geodist_exact_cached(lon, lat, dtype, out):
+
+    if out is not None or not _disk_cache_enabled():
+        return _geodist_exact(lon, lat, dtype=dtype, out=out)
+
+    dtype = np.dtype("float64" if dtype is None else dtype)
+    key = _cache_key(lon, lat, dtype=dtype.str)
+
+    return _cached_array(
+        "geodist", lambda: _geodist_exact(lon, lat, dtype=dtype), key=key
+    )
+
+
+# number of points per side of the blocks in _geodist_exact
+_GEODIST_BLOCK_SIZE = 512
+
+
+def _geodist_exact(lon, lat, dtype=None, out=None, block_size=_GEODIST_BLOCK_SIZE):
 
     # ensure correct shape
     if lon.shape != lat.shape or lon.ndim != 1:
         raise ValueError("lon and lat must be 1D arrays of the same shape")
 
+    n_points = lon.size
+
+    if out is None:
+        out = np.empty(
+            (n_points, n_points), dtype="float64" if dtype is None else dtype
+        )
+    elif out.shape != (n_points, n_points):
+        raise ValueError(
+            f"'out' must have shape {(n_points, n_points)}, got {out.shape}"
+        )
+    elif dtype is not None and out.dtype != np.dtype(dtype):
+        raise ValueError(f"'out' must have dtype {dtype}, got {out.dtype}")
+
+    if not np.issubdtype(out.dtype, np.floating):
+        raise ValueError(f"Expected a floating point dtype, got {out.dtype}")
+
     geod = pyproj.Geod(ellps="WGS84")
 
+    starts = range(0, n_points, block_size)
+
+    def _block(starts):
+
+        i, j = starts
+        rows, cols = slice(i, i + block_size), slice(j, j + block_size)
+        lon_i, lat_i, lon_j, lat_j = lon[rows], lat[rows], lon[cols], lat[cols]
+
+        if i == j:
+            # calculate only the upper right half of the triangle
+            row, col = np.triu_indices(lon_i.size, k=1)
+        else:
+            row, col = np.indices((lon_i.size, lon_j.size)).reshape(2, -1)
+
+        # convert m to km
+        dist = geod.inv(lon_i[row], lat_i[row], lon_j[col], lat_j[col])[2] / 1000
+
+        block = np.zeros((lon_i.size, lon_j.size), dtype=out.dtype)
+        block[row, col] = dist
+
+        if i == j:
+            # fill the lower left half of the triangle
+            block += block.T
+
+        out[rows, cols] = block
+        out[cols, rows] = block.T
+
+    # blocks of the upper right half of the triangle
+    blocks = [(i, j) for i, j in itertools.product(starts, repeat=2) if i <= j]
+
+    workers = OPTIONS["geodist_workers"]
+
+    if workers == 1:
+        for block in blocks:
+            _block(block)
+    else:
+        # pyproj releases the GIL, the blocks are disjoint
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_block, blocks))
+
+    return out
+
+
+def geodist_sparse(
+    lon: xr.DataArray | np.ndarray,
+    lat: xr.DataArray | np.ndarray,
+    *,
+    max_distance: float,
+) -> scipy.sparse.csr_array:
+    """exact great circle distance based on WSG 84 for all pairs of nearby points
+
+    Parameters
+    ----------
+    lon : xr.DataArray, np.ndarray
+        1D array of longitudes
+    lat : xr.DataArray, np.ndarray
+        1D array of latitudes
+    max_distance : float
+        Only distances smaller than ``max_distance`` (in km) are stored, e.g., 2 x the
+        largest localisation radius for the Gaspari-Cohn correlation function.
+
+    Returns
+    -------
+    geodist : scipy.sparse.csr_array
+        Sparse 2D array of great circle distances (in km). The distance of each point to
+        itself (0) is stored explicitly.
+
+    Notes
+    -----
+    The candidate pairs are found with a ball tree on the sphere, the distances are then
+    computed on the ellipsoid as in :func:`geodist_exact`. This requires memory
+    proportional to the number of stored pairs instead of n_points x n_points.
+
+    See Also
+    --------
+    geodist_exact, mesmer.stats.gaspari_cohn_correlation_matrices
+    """
+
+    if isinstance(lon, xr.Dataset) or isinstance(lat, xr.Dataset):
+        raise TypeError("Dataset is not supported, please pass a DataArray")
+
+    if isinstance(lon, xr.DataArray) and isinstance(lat, xr.DataArray):
+        if lon.dims != lat.dims:
+            raise AssertionError(
+                f"lon and lat have different dims: {lon.dims} vs. {lat.dims}. Expected "
+                "equally named dimensions from a stacked array"
+            )
+
+    return _geodist_sparse(np.asarray(lon), np.asarray(lat), max_distance)
+
+
+# mean earth radius in km
+_EARTH_RADIUS = 6371.0088
+
+
+def _geodist_sparse(lon, lat, max_distance):
+
+    # ensure correct shape
+    if lon.shape != lat.shape or lon.ndim != 1:
+        raise ValueError("lon and lat must be 1D arrays of the same shape")
+
+    if max_distance <= 0:
+        raise ValueError(f"'max_distance' must be positive, got {max_distance}")
+
+    lon, lat = lon.astype(float), lat.astype(float)
     n_points = lon.size
 
-    geodist = np.zeros([n_points, n_points])
+    # find candidates on the sphere - distances on the ellipsoid differ by less than 1 %
+    coords = np.deg2rad(np.column_stack([lat, lon]))
+    tree = BallTree(coords, metric="haversine")
+    neighbors = tree.query_radius(coords, r=max_distance * 1.01 / _EARTH_RADIUS)
 
-    # calculate only the upper right half of the triangle
-    for i in range(n_points - 1):
+    rows = np.repeat(np.arange(n_points), [nb.size for nb in neighbors])
+    cols = np.concatenate(neighbors)
 
-        # need to duplicate gridpoint (required by geod.inv)
-        lt = np.repeat(lat[i : i + 1], n_points - (i + 1))
-        ln = np.repeat(lon[i : i + 1], n_points - (i + 1))
+    # calculate only the upper right half of the triangle
+    sel = rows < cols
+    rows, cols = rows[sel], cols[sel]
 
-        geodist[i, i + 1 :] = geod.inv(
-            ln.squeeze(),
-            lt.squeeze(),
-            lon[i + 1 :].squeeze(),
-            lat[i + 1 :].squeeze(),
-        )[2]
+    geod = pyproj.Geod(ellps="WGS84")
 
     # convert m to km
-    geodist /= 1000
-    # fill the lower left half of the triangle (in-place)
-    geodist += np.transpose(geodist)
+    dist = geod.inv(lon[rows], lat[rows], lon[cols], lat[cols])[2] / 1000
 
-    return geodist
+    sel = dist < max_distance
+    rows, cols, dist = rows[sel], cols[sel], dist[sel]
+
+    # fill the lower left half of the triangle and the diagonal
+    diag = np.arange(n_points)
+    row_ind = np.concatenate([rows, cols, diag])
+    col_ind = np.concatenate([cols, rows, diag])
+    data = np.concatenate([dist, dist, np.zeros(n_points)])
+
+    return scipy.sparse.csr_array(
+        (data, (row_ind, col_ind)), shape=(n_points, n_points)
+    )
 
 
 def closest_neighbors(lon: xr.DataArray, lat: xr.DataArray, n_closest: int):
     """n closest neighbors based on spherical distance
 
-    Given an array of (lat, lon) coordinates, this function computes the pairwise
-    distance between all coordinate locations in the array and then returns an array
-    of indices that gives the indices of the n_closest locations
+    Given an array of (lat, lon) coordinates, this function returns an array of
+    indices that gives the indices of the n_closest locations for each location,
+    ordered by their distance.
 
     Parameters
     ----------
@@ -118,6 +286,12 @@ def closest_neighbors(lon: xr.DataArray, lat: xr.DataArray, n_closest: int):
         for the location with index i, i.e. coords[i], the coordinates of the n_closest
         locations are given by coords[selected_loc_[i]]
 
+
+    Notes
+    -----
+    The neighbors are found with a k-nearest-neighbor query on a BallTree, which
+    avoids computing and sorting the full matrix of pairwise distances. Locations
+    with equal distance are ordered by their index.
     """
 
     if lon.dims != lat.dims:
@@ -129,12 +303,7 @@ def closest_neighbors(lon: xr.DataArray, lat: xr.DataArray, n_closest: int):
     if lon.ndim != 1:
         raise ValueError("Expected 1D data - i.e. stacked longitude and latitude")
 
-    coords = np.column_stack([lat.values, lon.values])
-    coords = np.deg2rad(coords)
-
-    # multiply by 6371000 / 1000 to convert to km
-    dist = haversine_distances(coords, coords)
-    selected_loc = np.argsort(dist, axis=1)[:, :n_closest]
+    selected_loc = _closest_neighbors(lon.values, lat.values, n_closest)
 
     (dim,) = lon.dims
 
@@ -149,3 +318,17 @@ def closest_neighbors(lon: xr.DataArray, lat: xr.DataArray, n_closest: int):
     )
 
     return closest_neighbors
+
+
+def _closest_neighbors(lon, lat, n_closest):
+
+    coords = np.column_stack([lat, lon])
+    coords = np.deg2rad(coords)
+
+    tree = BallTree(coords, metric="haversine")
+    dist, selected_loc = tree.query(coords, k=n_closest)
+
+    # ensure a deterministic order for equal distances
+    order = np.lexsort((selected_loc, dist), axis=-1)
+
+    return np.take_along_axis(selected_loc, order, axis=-1)
@@ -2,6 +2,7 @@ import numpy as np
 import regionmask
 import xarray as xr
 
+from mesmer._core.disk_cache import _cache_key, _cached_array, _disk_cache_enabled
 from mesmer._core.types import T_DataArraySetTree
 from mesmer.datatree import _datatree_wrapper
 
@@ -55,16 +56,15 @@ def mask_ocean_fraction(
     - The fractional overlap of individual grid points and the land mask can only be
       computed for regularly-spaced 1D x- and y-coordinates. For irregularly spaced
       coordinates use :py:func:`mesmer.mask.mask_land`.
+    - The fractional overlap is loaded from the on-disk cache if the
+      ``disk_cache_dir`` option of :class:`mesmer.set_options` is set.
     """
 
     if np.ndim(threshold) != 0 or (threshold < 0) or (threshold > 1):
         raise ValueError("`threshold` must be a scalar between 0 and 1 (inclusive).")
 
-    # TODO: allow other masks?
-    land_110 = regionmask.defined_regions.natural_earth_v5_0_0.land_110
-
     try:
-        mask_fraction = land_110.mask_3D_frac_approx(data[x_coords], data[y_coords])
+        mask_fraction = _land_fraction(data[x_coords], data[y_coords])
     except regionmask.core.mask.InvalidCoordsError as e:
         raise ValueError(
             "Cannot calculate fractional mask for irregularly-spaced coords - use "
@@ -80,6 +80,27 @@ def mask_ocean_fraction(
     return _where_if_coords(data, mask_bool, [y_coords, x_coords])
 
 
+def _land_fraction(lon, lat):
+    """fractional overlap with the 1:110m land mask, using the on-disk cache"""
+
+    def _mask_fraction():
+        # TODO: allow other masks?
+        land_110 = regionmask.defined_regions.natural_earth_v5_0_0.land_110
+        return land_110.mask_3D_frac_approx(lon, lat)
+
+    if not _disk_cache_enabled():
+        return _mask_fraction()
+
+    key = _cache_key(lon.values, lat.values, regions="natural_earth_v5_0_0.land_110")
+    values = _cached_array("land_fraction", lambda: _mask_fraction().values, key=key)
+
+    # same coords and dims as regionmask (region coords are dropped by the caller)
+    coords = lat.coords.merge(lon.coords).coords
+    dims = ("region",) + xr.broadcast(lat, lon)[0].dims
+
+    return xr.DataArray(values, dims=dims, coords=coords)
+
+
 @_datatree_wrapper
 def mask_ocean(
     data: T_DataArraySetTree, *, x_coords: str = "lon", y_coords: str = "lat"
@@ -1,15 +1,22 @@
 from mesmer.stats._auto_regression import (
     draw_auto_regression_correlated,
+    draw_auto_regression_correlated_chunked,
     draw_auto_regression_monthly,
     draw_auto_regression_uncorrelated,
     fit_auto_regression,
     fit_auto_regression_monthly,
     fit_auto_regression_scen_ens,
+    select_and_fit_auto_regression_scen_ens,
     select_ar_order,
     select_ar_order_scen_ens,
 )
-from mesmer.stats._gaspari_cohn import gaspari_cohn, gaspari_cohn_correlation_matrices
+from mesmer.stats._gaspari_cohn import (
+    GaspariCohnLocalizer,
+    gaspari_cohn,
+    gaspari_cohn_correlation_matrices,
+)
 from mesmer.stats._harmonic_model import HarmonicModel
+from mesmer.stats._innovations import factorize_covariance
 from mesmer.stats._linear_regression import LinearRegression
 from mesmer.stats._localized_covariance import (
     adjust_covariance_ar1,
@@ -23,15 +30,19 @@ __all__ = [
     # auto regression
     "fit_auto_regression_scen_ens",
     "select_ar_order_scen_ens",
+    "select_and_fit_auto_regression_scen_ens",
     "draw_auto_regression_correlated",
+    "draw_auto_regression_correlated_chunked",
     "draw_auto_regression_uncorrelated",
     "fit_auto_regression",
     "select_ar_order",
     "fit_auto_regression_monthly",
     "draw_auto_regression_monthly",
+    "factorize_covariance",
     # gaspari cohn
     "gaspari_cohn_correlation_matrices",
     "gaspari_cohn",
+    "GaspariCohnLocalizer",
     # linear regression
     "LinearRegression",
     # localized covariance
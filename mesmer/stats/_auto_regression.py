@@ -1,23 +1,39 @@
-import warnings
-from collections.abc import Callable, Sequence
+import functools
+from collections.abc import Callable, Iterator, Sequence
 from typing import Literal
 
 import numpy as np
 import pandas as pd
-import scipy
 import xarray as xr
 
+from mesmer._core.options import OPTIONS
 from mesmer._core.utils import (
-    LinAlgWarning,
     _check_dataarray_form,
     _check_dataset_form,
+    _divide_threads_between_workers,
     _set_threads_from_options,
 )
 from mesmer.datatree import (
     _datatree_wrapper,
+    _map_over_datasets_concurrently,
     collapse_datatree_into_dataset,
     map_over_datasets,
 )
+from mesmer.stats._banded import _banded_from_dataarray, _BandedMatrix, _is_banded
+from mesmer.stats._innovations import (
+    _check_rng_streams,
+    _check_sampler_and_dtype,
+    _dense_factor_lower,
+    _draw_innovations_direct_np,
+    _get_covariance_factor_np,
+    _is_low_rank,
+    _low_rank_from_dataarray,
+    _LowRankFactor,
+    _realisation_stream_keys,
+    _stream_rng,
+    _TiledInnovations,
+    factorize_covariance,
+)
 
 
 def _scen_ens_inputs_to_dt(objs: Sequence) -> xr.DataTree:
@@ -154,6 +170,14 @@ def _select_ar_order_scen_ens_dt(
         kwargs={"dim": dim, "maxlag": maxlag, "ic": ic},
     )
 
+    return _median_ar_order_scen_ens(ar_order_scen, ens_dim)
+
+
+def _median_ar_order_scen_ens(
+    ar_order_scen: xr.DataTree, ens_dim: str | None
+) -> xr.DataArray:
+    """median of the selected order, first over ensemble members, then scenarios"""
+
     # TODO: think about weighting?
     def _ens_quantile(ds, ens_dim):
         if ens_dim in ds.dims:
@@ -263,6 +287,14 @@ def _fit_auto_regression_scen_ens_dt(
         kwargs={"dim": dim, "lags": int(lags)},
     )
 
+    return _mean_ar_params_scen_ens(ar_params_scen, ens_dim)
+
+
+def _mean_ar_params_scen_ens(
+    ar_params_scen: xr.DataTree, ens_dim: str | None
+) -> xr.Dataset:
+    """mean of the AR parameters, first over ensemble members, then scenarios"""
+
     # TODO: think about weighting! see https://github.com/MESMER-group/mesmer/issues/307
     def _ens_mean(ds, ens_dim):
         if ens_dim in ds.dims:
@@ -279,6 +311,146 @@ def _fit_auto_regression_scen_ens_dt(
     return ar_params
 
 
+def select_and_fit_auto_regression_scen_ens(
+    *objs: xr.DataArray | dict[str, xr.DataArray] | xr.DataTree,
+    dim: str,
+    ens_dim: str | None,
+    maxlag: int,
+    ic: Literal["bic", "aic", "hqic"] = "bic",
+) -> xr.Dataset:
+    """
+    select the order of and fit an auto regression in one pass over the data and
+    potentially calculate the median order and mean parameters over ensemble members and
+    scenarios
+
+    Parameters
+    ----------
+    *objs : DataTree, xr.DataArrays or dict of DataArrays
+        A ``DataTree`` holding one or several ``xr.Dataset``, ``xr.DataArray`` objects,
+        or dict of ``xr.DataArray`` objects to estimate the auto regression over, each
+        representing one scenario, potentially with several ensemble members along
+        `ens_dim`. If a ``DataTree``, each ``xr.Dataset`` should only hold one variable,
+        the one for which to estimate the autoregression.
+    dim : str
+        Dimension along which to fit the auto regression (often time).
+    ens_dim : str
+        Dimension name of the ensemble members, None if no ensemble is provided. Must
+        be the same for all scenarios and have coordinates if not None.
+    maxlag : int
+        The maximum lag to consider.
+    ic : {'aic', 'hqic', 'bic'}, default 'bic'
+        The information criterion to use in the selection.
+
+    Returns
+    -------
+    :obj:`xr.Dataset`
+        Dataset containing the ``selected_ar_order``, and the estimated parameters of
+        the ``intercept``, the AR ``coeffs``, the ``variance`` of the residuals and the
+        number of observations ``nobs``.
+
+    Notes
+    -----
+    Equivalent to calling :func:`select_ar_order_scen_ens` followed by
+    :func:`fit_auto_regression_scen_ens` with the selected order, but the data is only
+    traversed once. The lagged cross products of each time series are computed once and
+    reused for the selection and the fit.
+
+    If the selected order differs between the gridpoints, each gridpoint is fitted
+    with its own order and ``coeffs`` is padded with zeros up to the largest selected
+    order. If no lag is selected (``selected_ar_order`` is NaN) all ``coeffs`` are zero.
+    """
+    dt = _scen_ens_inputs_to_dt(objs)
+    return _select_and_fit_auto_regression_scen_ens_dt(dt, dim, ens_dim, maxlag, ic)
+
+
+def _select_and_fit_auto_regression_scen_ens_dt(
+    dt: xr.DataTree,
+    dim: str,
+    ens_dim: str | None,
+    maxlag: int,
+    ic: Literal["bic", "aic", "hqic"] = "bic",
+) -> xr.Dataset:
+
+    # the only pass over the data
+    ar_stats = map_over_datasets(
+        _extract_and_apply_to_da(_ar_sufficient_stats),
+        dt,
+        kwargs={"dim": dim, "maxlag": maxlag},
+    )
+
+    ar_order_scen = map_over_datasets(
+        _select_ar_order_from_stats, ar_stats, kwargs={"ic": ic}
+    )
+    ar_order = _median_ar_order_scen_ens(ar_order_scen, ens_dim)
+    ar_order = ar_order.drop_vars("quantile")
+
+    # at least one lag so coeffs is never empty
+    n_lags = max(int(np.nan_to_num(ar_order.max(), nan=0)), 1)
+
+    ar_params_scen = map_over_datasets(
+        _fit_auto_regression_from_stats,
+        ar_stats,
+        kwargs={"ar_order": ar_order, "n_lags": n_lags},
+    )
+    ar_params = _mean_ar_params_scen_ens(ar_params_scen, ens_dim)
+
+    ar_params["selected_ar_order"] = ar_order
+
+    return ar_params
+
+
+def _ar_sufficient_stats(data: xr.DataArray, dim: str, maxlag: int) -> xr.Dataset:
+    """lagged cross products of a time series - xarray wrapper"""
+
+    shift, head, sums = xr.apply_ufunc(
+        _ar_sufficient_stats_np,
+        data,
+        input_core_dims=[[dim]],
+        output_core_dims=((), ("__head__",), ("__lag_i__", "__lag_j__")),
+        kwargs={"maxlag": maxlag},
+    )
+
+    return xr.Dataset({"offset": shift, "head": head, "sums": sums})
+
+
+def _select_ar_order_from_stats(ar_stats: xr.Dataset, ic: str) -> xr.Dataset:
+
+    selected_ar_order = xr.apply_ufunc(
+        _select_ar_order_from_stats_np,
+        ar_stats["sums"],
+        input_core_dims=[("__lag_i__", "__lag_j__")],
+        kwargs={"ic": ic},
+    )
+
+    return selected_ar_order.rename("selected_ar_order").to_dataset()
+
+
+def _fit_auto_regression_from_stats(
+    ar_stats: xr.Dataset, ar_order: xr.DataArray, n_lags: int
+) -> xr.Dataset:
+
+    intercept, coeffs, variance, nobs = xr.apply_ufunc(
+        _fit_auto_regression_from_stats_np,
+        ar_stats["offset"],
+        ar_stats["head"],
+        ar_stats["sums"],
+        ar_order,
+        input_core_dims=[(), ("__head__",), ("__lag_i__", "__lag_j__"), ()],
+        output_core_dims=((), ("lags",), (), ()),
+        kwargs={"n_lags": n_lags},
+    )
+
+    data_vars = {
+        "intercept": intercept,
+        "coeffs": coeffs,
+        "variance": variance,
+        "lags": np.arange(1, n_lags + 1),
+        "nobs": nobs,
+    }
+
+    return xr.Dataset(data_vars)
+
+
 # ======================================================================================
 
 
@@ -288,6 +460,7 @@ def select_ar_order(
     *,
     maxlag: int,
     ic: Literal["bic", "aic", "hqic"] = "bic",
+    method: Literal["numpy", "statsmodels"] = "numpy",
 ) -> xr.DataArray:
     """Select the order of an autoregressive process
 
@@ -301,6 +474,13 @@ def select_ar_order(
         The maximum lag to consider.
     ic : {'aic', 'hqic', 'bic'}, default 'bic'
         The information criterion to use in the selection.
+    method : {"numpy", "statsmodels"}, default: "numpy"
+        Method used to select the order.
+
+        - "numpy": computes the information criteria of all lags for all time series
+          at once.
+        - "statsmodels": calls ``statsmodels.tsa.ar_model.ar_select_order`` for each
+          time series individually. Considerably slower, mostly kept as reference.
 
     Returns
     -------
@@ -310,19 +490,34 @@ def select_ar_order(
 
     Notes
     -----
-    Thin wrapper around ``statsmodels.tsa.ar_model.ar_select_order``. Only full models
-    can be selected.
+    Follows the conventions of ``statsmodels.tsa.ar_model.ar_select_order``, i.e., all
+    lags are evaluated on the same sample (the first ``maxlag`` time steps are held
+    back) and a constant is included. Only full models can be selected.
     """
 
-    selected_ar_order = xr.apply_ufunc(
-        _select_ar_order_np,
-        data,
-        input_core_dims=[[dim]],
-        output_core_dims=((),),
-        vectorize=True,
-        output_dtypes=[float],
-        kwargs={"maxlag": maxlag, "ic": ic},
-    )
+    if method == "numpy":
+        selected_ar_order = xr.apply_ufunc(
+            _select_ar_order_batched_np,
+            data,
+            input_core_dims=[[dim]],
+            output_core_dims=((),),
+            output_dtypes=[float],
+            kwargs={"maxlag": maxlag, "ic": ic},
+        )
+    elif method == "statsmodels":
+        selected_ar_order = xr.apply_ufunc(
+            _select_ar_order_np,
+            data,
+            input_core_dims=[[dim]],
+            output_core_dims=((),),
+            vectorize=True,
+            output_dtypes=[float],
+            kwargs={"maxlag": maxlag, "ic": ic},
+        )
+    else:
+        raise ValueError(
+            f"'method' must be one of 'numpy' or 'statsmodels', got '{method}'"
+        )
 
     # remove zeros
     selected_ar_order.data[selected_ar_order.data == 0] = np.nan
@@ -332,6 +527,257 @@ def select_ar_order(
     return selected_ar_order
 
 
+def _ar_information_criteria_np(gram, nobs, ic="bic"):
+    """information criteria of nested auto regressive models
+
+    Parameters
+    ----------
+    gram : np.array
+        Centered cross products of the target (index 0) and the lagged regressors
+        (index 1 to maxlag) of shape ``(..., maxlag + 1, maxlag + 1)``. All lags must
+        be estimated on the same sample.
+    nobs : int
+        Number of observations of the common sample.
+    ic : {'aic', 'hqic', 'bic'}, default 'bic'
+        The information criterion to compute.
+
+    Returns
+    -------
+    ics : np.array
+        Information criterion for the models with 0 to maxlag lags, along the last
+        axis.
+
+    Notes
+    -----
+    Uses the same definitions as ``statsmodels.tsa.ar_model.ar_select_order``, the
+    number of parameters includes the constant.
+    """
+
+    penalties = {"aic": 2, "bic": np.log(nobs), "hqic": 2 * np.log(np.log(nobs))}
+
+    if ic not in penalties:
+        raise ValueError(f"'ic' must be one of 'aic', 'bic' or 'hqic', got '{ic}'")
+
+    maxlag = gram.shape[-1] - 1
+
+    # sum of squared residuals - the model without lags only has a constant
+    ssr = np.empty(gram.shape[:-2] + (maxlag + 1,))
+    ssr[..., 0] = gram[..., 0, 0]
+
+    for n_lags in range(1, maxlag + 1):
+        xtx = gram[..., 1 : n_lags + 1, 1 : n_lags + 1]
+        xty = gram[..., 1 : n_lags + 1, 0]
+
+        coeffs = (np.linalg.pinv(xtx, hermitian=True) @ xty[..., np.newaxis])[..., 0]
+        ssr[..., n_lags] = gram[..., 0, 0] - np.sum(coeffs * xty, axis=-1)
+
+    # guard against round off
+    sigma2 = np.maximum(ssr, 0.0) / nobs
+
+    with np.errstate(divide="ignore"):
+        llf = -nobs * (np.log(2 * np.pi * sigma2) + 1) / 2
+
+    n_params = np.arange(1, maxlag + 2)
+
+    return -2 * llf + penalties[ic] * n_params
+
+
+def _select_ar_order_batched_np(data, maxlag, ic="bic"):
+    """Select the order of an autoregressive AR(p) process for many time series at
+    once - numpy wrapper
+
+    Parameters
+    ----------
+    data : array_like
+        A numpy array to estimate the auto regression order. The time series must be
+        along the last axis.
+    maxlag : int
+        The maximum lag to consider.
+    ic : {'aic', 'hqic', 'bic'}, default 'bic'
+        The information criterion to use in the selection.
+
+    Returns
+    -------
+    selected_ar_order : np.array
+        The selected order, NaN if no lag is selected.
+
+    Notes
+    -----
+    Yields the same order as :func:`_select_ar_order_np`, but builds the lagged
+    regressors only once and computes the information criteria of all lags for all
+    time series in one pass.
+    """
+
+    _, _, sums = _ar_sufficient_stats_np(data, maxlag)
+
+    return _select_ar_order_from_stats_np(sums, ic)
+
+
+def _ar_sufficient_stats_np(data, maxlag):
+    """lagged cross products of time series for auto regressions up to maxlag
+
+    Parameters
+    ----------
+    data : array_like
+        A numpy array of time series, which must be along the last axis.
+    maxlag : int
+        The maximum lag to consider.
+
+    Returns
+    -------
+    shift : np.array
+        Mean of each time series, which is subtracted before computing the cross
+        products to keep them well conditioned.
+    head : np.array
+        The first ``maxlag`` (shifted) values of each time series. Needed to extend the
+        sums to the sample of models with fewer lags.
+    sums : np.array
+        Cross products of ``[1, y_t, y_{t-1}, ..., y_{t-maxlag}]`` summed over the
+        common sample ``t = maxlag, ..., n_ts - 1``. Has shape
+        ``(..., maxlag + 2, maxlag + 2)``.
+    """
+
+    # a contiguous copy ensures the result for each time series does not depend on
+    # the memory layout of data (i.e., on the batch it is estimated in)
+    data = np.ascontiguousarray(data, dtype=float)
+
+    shift = data.mean(axis=-1)
+    data = data - shift[..., np.newaxis]
+
+    target, regressors = _lagged_design_np(data, maxlag)
+
+    design = np.concatenate([target[..., np.newaxis, :], regressors], axis=-2)
+
+    sums = np.empty(data.shape[:-1] + (maxlag + 2, maxlag + 2))
+    sums[..., 0, 0] = target.shape[-1]
+    sums[..., 0, 1:] = sums[..., 1:, 0] = design.sum(axis=-1)
+    sums[..., 1:, 1:] = design @ design.swapaxes(-1, -2)
+
+    head = data[..., :maxlag].copy()
+
+    return shift, head, sums
+
+
+def _extend_ar_sums_np(head, sums, ar_order):
+    """cross products of the AR(ar_order) model summed over its maximal sample
+
+    The sums of the common sample of all lags (starting at ``maxlag``) are extended by
+    the time steps ``ar_order, ..., maxlag - 1``.
+    """
+
+    maxlag = head.shape[-1]
+    size = ar_order + 2
+
+    sums = sums[..., :size, :size].copy()
+
+    for t in range(ar_order, maxlag):
+        vec = np.empty(head.shape[:-1] + (size,))
+        vec[..., 0] = 1
+        # y_t, y_{t-1}, ..., y_{t - ar_order}
+        vec[..., 1:] = head[..., t - ar_order : t + 1][..., ::-1]
+
+        sums += vec[..., :, np.newaxis] * vec[..., np.newaxis, :]
+
+    return sums
+
+
+def _centered_gram_np(sums):
+    """number of observations, means and centered cross products from raw sums"""
+
+    nobs = sums[..., 0, 0]
+    mean = sums[..., 0, 1:] / nobs[..., np.newaxis]
+
+    gram = sums[..., 1:, 1:] - nobs[..., np.newaxis, np.newaxis] * (
+        mean[..., :, np.newaxis] * mean[..., np.newaxis, :]
+    )
+
+    return nobs, mean, gram
+
+
+def _select_ar_order_from_stats_np(sums, ic="bic"):
+    """select the order of an auto regression from its lagged cross products"""
+
+    maxlag = sums.shape[-1] - 2
+
+    nobs, _, gram = _centered_gram_np(sums)
+
+    # the pseudo-inverse cannot handle non-finite values
+    valid = np.isfinite(gram).all(axis=(-1, -2))
+    gram[~valid] = np.eye(maxlag + 1)
+
+    # nobs is the same for all time series
+    nobs = int(nobs.flat[0]) if nobs.size else 0
+    ics = _ar_information_criteria_np(gram, nobs, ic)
+
+    # first minimum, i.e., smaller orders are preferred for ties (as in statsmodels)
+    selected_ar_order = np.argmin(ics, axis=-1)
+
+    # no lag is selected or invalid data
+    return np.where((selected_ar_order == 0) | ~valid, np.nan, selected_ar_order)
+
+
+def _fit_auto_regression_from_stats_np(shift, head, sums, ar_order, n_lags):
+    """fit auto regressions from their lagged cross products
+
+    Parameters
+    ----------
+    shift, head, sums : np.array
+        Output of :func:`_ar_sufficient_stats_np`.
+    ar_order : np.array
+        Order of the auto regression to fit for each time series, broadcast against
+        ``shift``. NaN is treated as zero lags.
+    n_lags : int
+        Number of coefficients to return, must be at least ``max(ar_order)``. Missing
+        coefficients are set to zero.
+
+    Returns
+    -------
+    intercept, coeffs, variance, nobs : np.array
+        Estimated parameters, see :func:`_fit_auto_regression_batched_np`.
+    """
+
+    maxlag = head.shape[-1]
+
+    ar_order = np.nan_to_num(np.asarray(ar_order, dtype=float), nan=0).astype(int)
+    ar_order = np.broadcast_to(ar_order, shift.shape)
+
+    if ar_order.size and (ar_order.max() > min(maxlag, n_lags) or ar_order.min() < 0):
+        raise ValueError("'ar_order' must be between 0 and maxlag and n_lags")
+
+    intercept = np.full(shift.shape, np.nan)
+    coeffs = np.zeros(shift.shape + (n_lags,))
+    variance = np.full(shift.shape, np.nan)
+    nobs = np.zeros(shift.shape, dtype=int)
+
+    for order in np.unique(ar_order):
+        sel = ar_order == order
+
+        nobs_order, mean, gram = _centered_gram_np(
+            _extend_ar_sums_np(head[sel], sums[sel], order)
+        )
+
+        xtx, xty = gram[..., 1:, 1:], gram[..., 1:, 0]
+
+        # the pseudo-inverse cannot handle non-finite values
+        valid = np.isfinite(xtx).all(axis=(-1, -2)) & np.isfinite(xty).all(axis=-1)
+        xtx[~valid] = np.eye(order)
+        xty[~valid] = np.nan
+
+        coeffs_order = np.linalg.pinv(xtx, hermitian=True) @ xty[..., np.newaxis]
+        coeffs_order = coeffs_order[..., 0]
+
+        intercept_order = mean[..., 0] - np.sum(coeffs_order * mean[..., 1:], axis=-1)
+        ssr = gram[..., 0, 0] - np.sum(coeffs_order * xty, axis=-1)
+
+        # undo the shift of the data
+        intercept[sel] = intercept_order + shift[sel] * (1 - coeffs_order.sum(axis=-1))
+        coeffs[sel, :order] = coeffs_order
+        variance[sel] = np.maximum(ssr, 0.0) / nobs_order
+        nobs[sel] = nobs_order
+
+    return intercept, coeffs, variance, nobs
+
+
 def _select_ar_order_np(data, maxlag, ic="bic"):
     """Select the order of an autoregressive AR(p) process - numpy wrapper
 
@@ -397,6 +843,8 @@ def draw_auto_regression_uncorrelated(
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
 ) -> xr.Dataset:
     """draw time series of an auto regression process
 
@@ -410,6 +858,11 @@ def draw_auto_regression_uncorrelated(
         - coeffs
         - variance
 
+        The parameters can be scalars or have any number of dimensions (e.g., gridpoints)
+        in which case an independent process is drawn for each point. ``variance``
+        must have the same dimensions as ``intercept`` and ``coeffs`` additionally a
+        "lags" dimension. The innovations are scaled by ``sqrt(variance)``.
+
     time : int | DataArray | Index
         Defines the number of auto-correlated samples to draw and possibly its
         coordinates.
@@ -437,11 +890,20 @@ def draw_auto_regression_uncorrelated(
     realisation_dim : str, default: "realisation"
         Name of the realisation dimension.
 
+    rng_streams : "sequential" | "realisation", default: "sequential"
+        How the random numbers are derived from ``seed``. "realisation" uses
+        independent random number streams for each realisation and block of time
+        steps, such that any subset of realisations can be drawn independently. See
+        :func:`draw_auto_regression_correlated`.
+
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process. See :func:`draw_auto_regression_correlated`.
+
     Returns
     -------
     out : Dataset
-        Drawn realizations of the specified autoregressive process. The array has shape
-        n_time x n_coeffs x n_realisations.
+        Drawn realizations of the specified autoregressive process. The array has the
+        dimensions of ``intercept`` between the time and the realisation dimension.
 
     """
 
@@ -453,6 +915,8 @@ def draw_auto_regression_uncorrelated(
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        rng_streams=rng_streams,
+        init=init,
     )
 
 
@@ -466,60 +930,94 @@ def _draw_auto_regression_uncorrelated(
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
 ) -> xr.Dataset:
 
-    # NOTE: we use variance and not std since we use multivariate normal
-    # also to draw univariate realizations
+    # independent streams require the direct sampler
+    sampler = "direct" if rng_streams == "realisation" else "compat"
+    _check_rng_streams(rng_streams, sampler)
+    _check_init(init)
+
     # check the input
     _check_dataset_form(
         ar_params, "ar_params", required_vars={"intercept", "coeffs", "variance"}
     )
 
+    intercept = ar_params.intercept
+    dims = intercept.dims
+
     if (
-        ar_params.intercept.ndim != 0
-        or ar_params.coeffs.ndim != 1
-        or ar_params.variance.ndim != 0
+        "lags" in dims
+        or set(ar_params.coeffs.dims) != {"lags", *dims}
+        or set(ar_params.variance.dims) != set(dims)
     ):
         msg = (
-            "``draw_auto_regression_uncorrelated`` can currently only handle single "
-            "points"
+            "'coeffs' must have the dimensions of 'intercept' and 'lags' and "
+            "'variance' the dimensions of 'intercept'"
         )
         raise ValueError(msg)
 
-    # _draw_ar_corr_xr_internal expects 2D arrays
-    ar_params = ar_params.expand_dims("__gridpoint__")
+    # _draw_ar_corr_xr_internal expects 2D arrays - stack all points
+    if dims:
+        ar_params = ar_params.transpose("lags", *dims)
+        ar_params = ar_params.stack(__gridpoint__=dims, create_index=False)
+    else:
+        ar_params = ar_params.expand_dims("__gridpoint__")
 
     if isinstance(seed, xr.Dataset):
         seed = int(seed.seed.item())
 
+    # independent innovations are scaled by the standard deviation
     result = _draw_ar_corr_xr_internal(
         intercept=ar_params.intercept,
         coeffs=ar_params.coeffs,
-        covariance=ar_params.variance,
+        covariance=np.sqrt(ar_params.variance),
         time=time,
         realisation=realisation,
         seed=seed,
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        is_factor=True,
+        sampler=sampler,
+        rng_streams=rng_streams,
+        init=init,
     )
 
-    # remove the "__gridpoint__" dim again
-    result = result.squeeze(dim="__gridpoint__", drop=True)
+    # unstack the "__gridpoint__" dim again
+    coords = {
+        name: coord
+        for name, coord in result.coords.items()
+        if "__gridpoint__" not in coord.dims
+    }
+    n_ts, _, n_realisations = result.shape
+
+    result = xr.DataArray(
+        result.values.reshape(n_ts, *intercept.shape, n_realisations),
+        dims=(time_dim, *dims, realisation_dim),
+        coords=coords,
+    ).assign_coords(intercept.coords)
 
     return result.rename("samples").to_dataset()
 
 
 def draw_auto_regression_correlated(
     ar_params: xr.Dataset,
-    covariance: xr.DataArray,
+    covariance: xr.DataArray | None,
     *,
     time: int | xr.DataArray | pd.Index,
     realisation: int | xr.DataArray | pd.Index,
-    seed: int | xr.DataTree,
+    seed: int | xr.Dataset | xr.DataTree,
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    covariance_factor: xr.DataArray | None = None,
+    sampler: Literal["compat", "direct"] = "compat",
+    dtype: str | np.dtype = "float64",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
+    return_state: bool = False,
 ) -> xr.Dataset:
     """
     draw time series of an auto regression process with spatially-correlated innovations
@@ -533,8 +1031,11 @@ def draw_auto_regression_correlated(
         - intercept
         - coeffs
 
-    covariance : DataArray
-        The (co-)variance array. Must be symmetric and positive-semidefinite.
+    covariance : DataArray | None
+        The (co-)variance array. Must be symmetric and positive-semidefinite. Must be
+        None if ``covariance_factor`` is passed. Can also be a banded covariance
+        matrix (see :func:`find_localized_empirical_covariance`), which requires
+        ``sampler="direct"`` and ``init="buffer"``.
 
     time : int | DataArray | Index
         Defines the number of auto-correlated samples to draw and possibly its
@@ -548,10 +1049,12 @@ def draw_auto_regression_correlated(
         Defines the number of uncorrelated samples to draw and possibly its coordinates.
         See ``time`` for details.
 
-    seed : int | xr.DataTree
+    seed : int | xr.Dataset | xr.DataTree
         Seed used to initialize the pseudo-random number generator. Can be an int or a
         xr.DataTree that contains Datasets with a single variable "seed" with the seed
-        value, used to draw samples for multiple scenarios.
+        value, used to draw samples for multiple scenarios. Can also be the result of a
+        draw with ``return_state=True`` (or a DataTree thereof) to continue this draw,
+        see ``return_state``.
 
     buffer : int
         Buffer to initialize the autoregressive process (ensures that start at 0 does
@@ -563,6 +1066,58 @@ def draw_auto_regression_correlated(
     realisation_dim : str, default: "realisation"
         Name of the realisation dimension.
 
+    covariance_factor : DataArray, default: None
+        Precomputed factor of the covariance matrix, see
+        :func:`factorize_covariance`. Avoids factorizing ``covariance`` for every call.
+        Can also be an approximate low-rank factor (see ``explained_variance`` in
+        :func:`factorize_covariance`), which requires ``sampler="direct"`` and
+        ``init="buffer"``.
+
+    sampler : "compat" | "direct", default: "compat"
+        How to draw the innovations.
+
+        - "compat": uses ``scipy.stats.multivariate_normal.rvs``, reproduces the
+          realisations of previous versions for a given seed.
+        - "direct": draws standard normal numbers directly into the output buffer
+          and multiplies them in-place with the factor of the covariance matrix.
+          Faster and requires less memory, but yields different realisations.
+
+    dtype : str | np.dtype, default: "float64"
+        Data type of the drawn realisations, "float32" or "float64". "float32" requires
+        ``sampler="direct"``.
+
+    rng_streams : "sequential" | "realisation", default: "sequential"
+        How the random numbers are derived from ``seed``.
+
+        - "sequential": all realisations are drawn one after another from one random
+          number generator.
+        - "realisation": every realisation and block of time steps uses an
+          independent random number generator initialized from
+          ``np.random.SeedSequence(seed, spawn_key=...)``. The coordinates of
+          ``realisation`` (which must be non-negative integers) are used as keys.
+          Therefore, any subset of realisations can be drawn independently (e.g., in
+          parallel or on other nodes) with identical results. Requires
+          ``sampler="direct"``.
+
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process.
+
+        - "buffer": starts the process from zero and discards the first ``buffer``
+          time steps.
+        - "stationary": draws the initial state from the stationary distribution of
+          the process, which is computed from ``ar_params`` and the covariance. No
+          spin-up is required, i.e., ``buffer`` can be set to 0. Requires a stationary
+          process.
+
+    return_state : bool, default: False
+        If True, the returned Dataset additionally contains the last ``ar_order``
+        time steps ("state", ordered by "lags"), the "seed", and the position in the
+        random number streams ("stream_position", "stream_key"). Passing it as
+        ``seed`` continues the draw, e.g., to extend an emulation in time. The
+        continued realisations are identical to drawing all time steps at once.
+        Requires ``rng_streams="realisation"``. ``buffer`` must be 0 when continuing a
+        draw and ``init`` is ignored.
+
     Returns
     -------
     out : Dataset
@@ -575,9 +1130,17 @@ def draw_auto_regression_correlated(
     (``n_coeffs``, i.e. the number of gridpoints) and ``covariance`` (which must be
     equal).
 
+    The factors of recently used covariance matrices are cached, see the
+    ``covariance_cache_size`` option of :class:`mesmer.set_options`.
+
+    If ``seed`` is a ``DataTree``, the covariance matrix is factorized once for all
+    scenarios, which can be drawn concurrently, see the ``draw_workers`` option of
+    :class:`mesmer.set_options`.
+
     """
 
-    return _draw_auto_regression_correlated(
+    return _draw_scenarios(
+        _draw_auto_regression_correlated,
         seed,
         ar_params,
         covariance,
@@ -586,6 +1149,52 @@ def draw_auto_regression_correlated(
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        covariance_factor=covariance_factor,
+        sampler=sampler,
+        dtype=dtype,
+        rng_streams=rng_streams,
+        init=init,
+        return_state=return_state,
+    )
+
+
+def _draw_scenarios(func, seed, ar_params, covariance, *, covariance_factor, **kwargs):
+    """draw realisations for one or several scenarios
+
+    If ``seed`` is a DataTree (i.e., for several scenarios), the covariance matrix is
+    factorized only once and, if the ``draw_workers`` option is larger than 1, the
+    scenarios are drawn concurrently. The results do not depend on the number of
+    workers.
+    """
+
+    if not isinstance(seed, xr.DataTree):
+        return func(
+            seed, ar_params, covariance, covariance_factor=covariance_factor, **kwargs
+        )
+
+    if covariance_factor is None and _is_stack_of_square_matrices(covariance):
+        covariance_factor = factorize_covariance(covariance)
+        covariance = None
+
+    kwargs = kwargs | {"covariance_factor": covariance_factor}
+
+    workers = OPTIONS["draw_workers"]
+
+    if workers == 1:
+        return func(seed, ar_params, covariance, **kwargs)
+
+    with _divide_threads_between_workers(workers):
+        return _map_over_datasets_concurrently(
+            func, seed, ar_params, covariance, kwargs=kwargs, max_workers=workers
+        )
+
+
+def _is_stack_of_square_matrices(covariance):
+
+    return _is_banded(covariance) or (
+        isinstance(covariance, xr.DataArray)
+        and covariance.ndim in (2, 3)
+        and covariance.shape[-1] == covariance.shape[-2]
     )
 
 
@@ -593,13 +1202,19 @@ def draw_auto_regression_correlated(
 def _draw_auto_regression_correlated(
     seed: int | xr.DataTree,
     ar_params: xr.Dataset,
-    covariance: xr.DataArray,
+    covariance: xr.DataArray | None,
     *,
     time: int | xr.DataArray | pd.Index,
     realisation: int | xr.DataArray | pd.Index,
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    covariance_factor: xr.DataArray | None = None,
+    sampler: Literal["compat", "direct"] = "compat",
+    dtype: str | np.dtype = "float64",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
+    return_state: bool = False,
 ) -> xr.Dataset:
 
     # check the input
@@ -610,10 +1225,17 @@ def _draw_auto_regression_correlated(
     _check_dataarray_form(
         ar_params.coeffs, "coeffs", ndim=2, required_dims={"lags", dim}
     )
-    _check_dataarray_form(covariance, "covariance", ndim=2, shape=(size, size))
+    covariance, name = _covariance_or_factor(covariance, covariance_factor)
+    dtype = _check_sampler_and_dtype(sampler, dtype)
+    _check_rng_streams(rng_streams, sampler)
+    _check_init(init)
 
-    if isinstance(seed, xr.Dataset):
-        seed = int(seed.seed.item())
+    _check_covariance_2D(covariance, name, dim, size, sampler=sampler, init=init)
+
+    seed, previous = _seed_and_previous_draw(seed)
+    _check_continuation(
+        previous, return_state=return_state, rng_streams=rng_streams, buffer=buffer
+    )
 
     result = _draw_ar_corr_xr_internal(
         intercept=ar_params.intercept,
@@ -625,22 +1247,488 @@ def _draw_auto_regression_correlated(
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        is_factor=name == "covariance_factor",
+        sampler=sampler,
+        dtype=dtype,
+        rng_streams=rng_streams,
+        init=init,
+        previous=previous,
+        return_state=return_state,
     )
 
+    if return_state:
+        result, state = result
+        return result.rename("samples").to_dataset().merge(state)
+
     return result.rename("samples").to_dataset()
 
 
-def _draw_ar_corr_xr_internal(
-    intercept,
-    coeffs,
-    covariance,
+def draw_auto_regression_correlated_chunked(
+    ar_params: xr.Dataset,
+    covariance: xr.DataArray | None,
     *,
-    time,
-    realisation,
-    seed,
+    time: int | xr.DataArray | pd.Index,
+    realisation: int | xr.DataArray | pd.Index,
+    seed: int,
+    buffer: int,
+    realisation_chunk_size: int | None = None,
+    time_chunk_size: int | None = None,
+    time_dim: str = "time",
+    realisation_dim: str = "realisation",
+    covariance_factor: xr.DataArray | None = None,
+    dtype: str | np.dtype = "float64",
+    init: Literal["buffer", "stationary"] = "buffer",
+) -> Iterator[xr.Dataset]:
+    """
+    draw time series of an auto regression process with spatially-correlated
+    innovations in chunks
+
+    Yields blocks of realisations and/ or time windows such that the memory footprint
+    is bounded by the chunk sizes. The state of the process is carried over between
+    time windows.
+
+    Parameters
+    ----------
+    ar_params : Dataset
+        Dataset containing the estimated parameters of the AR process. Must contain the
+        following DataArray objects:
+
+        - intercept
+        - coeffs
+
+    covariance : DataArray | None
+        The (co-)variance array. Must be symmetric and positive-semidefinite. Must be
+        None if ``covariance_factor`` is passed. Can also be a banded covariance
+        matrix (see :func:`find_localized_empirical_covariance`), which requires
+        ``init="buffer"``.
+
+    time : int | DataArray | Index
+        Defines the number of auto-correlated samples to draw and possibly its
+        coordinates. See :func:`draw_auto_regression_correlated` for details.
+
+    realisation : int | DataArray
+        Defines the number of uncorrelated samples to draw and possibly its coordinates.
+        See ``time`` for details. The coordinates must be non-negative integers, which
+        are used as keys of the random number streams.
+
+    seed : int
+        Seed used to initialize the pseudo-random number generators.
+
+    buffer : int
+        Buffer to initialize the autoregressive process (ensures that start at 0 does
+        not influence overall result).
+
+    realisation_chunk_size : int, default: None
+        Number of realisations per chunk. If None, all realisations are drawn at once.
+
+    time_chunk_size : int, default: None
+        Number of time steps per chunk. If None, all time steps are drawn at once.
+
+    time_dim : str, default: "time"
+        Name of the time dimension.
+
+    realisation_dim : str, default: "realisation"
+        Name of the realisation dimension.
+
+    covariance_factor : DataArray, default: None
+        Precomputed factor of the covariance matrix, see
+        :func:`factorize_covariance`. Can also be banded or an approximate low-rank
+        factor, which require ``init="buffer"``.
+
+    dtype : str | np.dtype, default: "float64"
+        Data type of the drawn realisations, "float32" or "float64".
+
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process. See :func:`draw_auto_regression_correlated`.
+
+    Yields
+    ------
+    out : Dataset
+        Drawn realizations for one chunk. The array has shape n_time_chunk x n_coeffs
+        x n_realisation_chunk. For each realisation block all time windows are yielded
+        before moving on to the next block of realisations.
+
+    Notes
+    -----
+    Uses independent random number streams for each realisation and block of time
+    steps (see ``rng_streams="realisation"`` in
+    :func:`draw_auto_regression_correlated`). Therefore, the drawn realisations are
+    identical, independent of the chunk sizes, and equal to the realisations drawn by
+    :func:`draw_auto_regression_correlated` with ``sampler="direct"`` and
+    ``rng_streams="realisation"``.
+    """
+
+    # check the input
+    _check_dataset_form(ar_params, "ar_params", required_vars={"intercept", "coeffs"})
+    _check_dataarray_form(ar_params.intercept, "intercept", ndim=1)
+
+    (dim,), size = ar_params.intercept.dims, ar_params.intercept.size
+    _check_dataarray_form(
+        ar_params.coeffs, "coeffs", ndim=2, required_dims={"lags", dim}
+    )
+
+    covariance, name = _covariance_or_factor(covariance, covariance_factor)
+
+    dtype = _check_sampler_and_dtype("direct", dtype)
+    _check_init(init)
+
+    _check_covariance_2D(covariance, name, dim, size, sampler="direct", init=init)
+
+    for chunk_size, chunk_name in (
+        (realisation_chunk_size, "realisation_chunk_size"),
+        (time_chunk_size, "time_chunk_size"),
+    ):
+        if chunk_size is not None and not (
+            isinstance(chunk_size, int) and chunk_size > 0
+        ):
+            msg = f"'{chunk_name}' must be a positive integer or None, got {chunk_size}"
+            raise ValueError(msg)
+
+    # get the size and coords of the new dimensions
+    n_ts, time_coords = _get_size_and_coord_dict(time, time_dim, "time")
+    n_realisations, realisation_coords = _get_size_and_coord_dict(
+        realisation, realisation_dim, "realisation"
+    )
+
+    # make sure non-dimension coords are properly caught
+    gridpoint_coords = dict(ar_params.coeffs[dim].coords)
+
+    is_factor = name == "covariance_factor"
+
+    if _is_banded(covariance):
+        factor = _banded_from_dataarray(covariance, triangular=is_factor)
+        factor, lower = factor if is_factor else factor.cholesky(), None
+    elif _is_low_rank(covariance):
+        factor, lower = _low_rank_from_dataarray(covariance), None
+    elif is_factor:
+        factor, lower = covariance.values, None
+    else:
+        factor, lower = _get_covariance_factor_np(covariance.values, return_lower=True)
+
+    chunks = _draw_auto_regression_correlated_chunked_np(
+        intercept=ar_params.intercept.values,
+        coeffs=ar_params.coeffs.transpose(..., dim).values,
+        factor=factor,
+        lower=lower,
+        sample_keys=_realisation_stream_keys(realisation, n_realisations),
+        n_ts=n_ts,
+        seed=seed,
+        buffer=buffer,
+        sample_chunk_size=realisation_chunk_size or max(n_realisations, 1),
+        time_chunk_size=time_chunk_size or max(n_ts, 1),
+        dtype=dtype,
+        init=init,
+    )
+
+    def _to_dataset(chunks):
+
+        for samples, time_slice, out in chunks:
+
+            coords = dict(gridpoint_coords)
+            coords.update({k: v[time_slice] for k, v in time_coords.items()})
+            coords.update({k: v[samples] for k, v in realisation_coords.items()})
+
+            da = xr.DataArray(out, dims=(realisation_dim, time_dim, dim), coords=coords)
+
+            # for consistency we transpose to time x gridpoint x realisation
+            da = da.transpose(time_dim, dim, realisation_dim)
+
+            yield da.rename("samples").to_dataset()
+
+    return _to_dataset(chunks)
+
+
+def _draw_auto_regression_correlated_chunked_np(
+    *,
+    intercept,
+    coeffs,
+    factor,
+    sample_keys,
+    n_ts,
+    seed,
+    buffer,
+    sample_chunk_size,
+    time_chunk_size,
+    dtype=np.float64,
+    init="buffer",
+    lower=None,
+):
+    """
+    Draw time series of an auto regression process with spatially-correlated
+    innovations in chunks
+
+    Parameters
+    ----------
+    intercept : float or ndarray of length n_coeffs
+        Intercept of the model.
+    coeffs : ndarray of shape ar_order x n_coeffs
+        The coefficients of the autoregressive process.
+    factor : ndarray of shape n_coeffs x n_coeffs or _BandedMatrix or _LowRankFactor
+        The factor of the covariance matrix, see ``_factorize_covariance_np``.
+    sample_keys : ndarray of int
+        Key of the random number streams of each sample (see ``_TiledInnovations``).
+        Its length determines the number of samples to draw.
+    n_ts : int
+        Number of time steps to draw.
+    seed : int
+        Seed used to initialize the pseudo-random number generators.
+    buffer : int
+        Buffer to initialize the autoregressive process.
+    sample_chunk_size : int
+        Number of samples per chunk.
+    time_chunk_size : int
+        Number of time steps per chunk.
+    dtype : np.dtype, default: np.float64
+        Data type of the output.
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process, see ``_draw_auto_regression_correlated_np``.
+    lower : bool, default: None
+        Whether the factor is lower triangular, determined once if not given.
+
+    Yields
+    ------
+    samples : slice
+        The samples of this chunk.
+    time : slice
+        The time steps of this chunk.
+    out : ndarray of shape (n_samples_chunk, n_ts_chunk, n_coeffs)
+        Drawn realizations of this chunk.
+    """
+
+    ar_order, n_coeffs = coeffs.shape
+    n_samples = len(sample_keys)
+
+    # determine once, not for every chunk
+    lower = _dense_factor_lower(factor, lower)
+
+    if init == "stationary":
+        moments = _stationary_state_factor_np(intercept, coeffs, factor)
+
+    intercept = np.broadcast_to(intercept, (1, n_coeffs))
+    coeffs = coeffs[np.newaxis, :, :]
+
+    # the buffer is drawn in chunks as well but not returned - the buffer boundary is
+    # also a chunk boundary
+    bounds = [
+        (start, min(start + time_chunk_size, stop))
+        for (begin, stop) in ((-buffer, 0), (0, n_ts))
+        for start in range(begin, stop, time_chunk_size)
+    ]
+
+    for sample_start in range(0, n_samples, sample_chunk_size):
+        samples = slice(sample_start, min(sample_start + sample_chunk_size, n_samples))
+
+        # independent streams per sample and tile - independent of the chunks
+        keys = [(key,) for key in sample_keys[samples]]
+        innovations = _TiledInnovations(factor, seed, keys, dtype, lower=lower)
+
+        if init == "stationary":
+            state = _draw_stationary_state_np(
+                *moments, len(keys), dtype, rng=None, seed=seed, keys=keys
+            )
+        else:
+            # the process starts from zero
+            state = np.zeros((len(keys), ar_order, n_coeffs), dtype)
+
+        for start, stop in bounds:
+            out = np.empty((len(keys), ar_order + stop - start, n_coeffs), dtype)
+            out[:, :ar_order] = state
+
+            innovations.fill(out[:, ar_order:])
+
+            _ar_recursion_inplace(
+                out, intercept=intercept, coeffs=coeffs, start=ar_order
+            )
+
+            # carry over the last ar_order time steps
+            state = out[:, stop - start :].copy()
+
+            if start >= 0:
+                yield samples, slice(start, stop), out[:, ar_order:]
+
+
+def _check_covariance_2D(covariance, name, dim, size, *, sampler, init):
+    """check a dense, banded or low-rank covariance matrix or factor"""
+
+    if _is_banded(covariance):
+        _check_banded_covariance(covariance, name, dim, sampler=sampler, init=init)
+    elif _is_low_rank(covariance):
+        if name != "covariance_factor":
+            raise ValueError(
+                "A low-rank factor (with an 'eof' dimension) must be passed as "
+                "'covariance_factor'"
+            )
+        _check_low_rank_factor(covariance, size, sampler=sampler, init=init)
+    else:
+        _check_dataarray_form(covariance, name, ndim=2, shape=(size, size))
+
+
+def _check_banded_covariance(covariance, name, dim, *, sampler, init):
+
+    _check_dataarray_form(
+        covariance,
+        name,
+        ndim=2,
+        required_dims={"band", dim},
+        required_coords="band_order",
+    )
+
+    _check_direct_sampler_and_buffer_init(f"A banded '{name}'", sampler, init)
+
+
+def _check_low_rank_factor(covariance_factor, size, *, sampler, init):
+
+    _check_dataarray_form(
+        covariance_factor,
+        "covariance_factor",
+        ndim=2,
+        required_coords="residual_std",
+    )
+
+    (dim,) = set(covariance_factor.dims) - {"eof"}
+    if covariance_factor.sizes[dim] != size:
+        raise ValueError(
+            f"covariance_factor has wrong size - expected {size} gridpoints, got "
+            f"{covariance_factor.sizes[dim]}"
+        )
+
+    _check_direct_sampler_and_buffer_init(
+        "A low-rank 'covariance_factor'", sampler, init
+    )
+
+
+def _check_direct_sampler_and_buffer_init(what, sampler, init):
+
+    if sampler != "direct":
+        raise ValueError(f"{what} requires sampler='direct'")
+
+    if init != "buffer":
+        raise ValueError(f"{what} requires init='buffer'")
+
+
+def _covariance_or_factor(covariance, covariance_factor):
+    # returns the passed argument and its name
+
+    if (covariance is None) == (covariance_factor is None):
+        raise ValueError(
+            "Must pass exactly one of 'covariance' and 'covariance_factor'"
+        )
+
+    if covariance_factor is not None:
+        return covariance_factor, "covariance_factor"
+
+    return covariance, "covariance"
+
+
+def _seed_and_previous_draw(seed):
+    # returns the seed and the previous draw, if seed is the result of a draw with
+    # ``return_state=True``
+
+    if not isinstance(seed, xr.Dataset):
+        return seed, None
+
+    previous = seed if "state" in seed.data_vars else None
+
+    return int(seed.seed.item()), previous
+
+
+def _check_continuation(previous, *, return_state, rng_streams, buffer):
+
+    if (previous is not None or return_state) and rng_streams != "realisation":
+        raise ValueError(
+            "Continuing a draw (and returning its state) requires "
+            "rng_streams='realisation'"
+        )
+
+    if previous is not None and buffer != 0:
+        raise ValueError(f"'buffer' must be 0 to continue a draw, got {buffer}")
+
+
+def _initial_state_from_previous_draw(
+    previous, sample_keys, *, n_lags, gridpoint_dim, realisation_dim
+):
+    """extract the last states and the position in the random number streams
+
+    Returns
+    -------
+    initial_state : ndarray of shape (n_samples, n_lags, n_gridpoints)
+        The last states of the samples in chronological order.
+    stream_start : int
+        Position in the random number streams.
+    """
+
+    _check_dataset_form(
+        previous,
+        "seed",
+        required_vars={"state", "seed", "stream_position", "stream_key"},
+    )
+
+    state = previous.state
+    if state.sizes.get("lags") != n_lags:
+        raise ValueError(
+            f"The state of the previous draw must have {n_lags} lag(s), got "
+            f"{state.sizes.get('lags')}"
+        )
+
+    index = {int(key): i for i, key in enumerate(previous.stream_key.values)}
+
+    missing = [str(key) for key in sample_keys if key not in index]
+    if missing:
+        missing_keys = "', '".join(missing)
+        raise ValueError(
+            f"The previous draw contains no realisation(s) with key(s) '{missing_keys}'"
+        )
+
+    state = state.transpose(realisation_dim, "lags", gridpoint_dim).values
+    state = state[[index[key] for key in sample_keys]]
+
+    # lags are ordered from the most recent state
+    return state[:, ::-1, :], int(previous.stream_position.item())
+
+
+def _state_to_dataset(
+    state, *, seed, stream_position, sample_keys, gridpoint_dim, realisation_dim, coords
+):
+    """the last states of a draw and the position in the random number streams
+
+    ``state`` has shape (n_samples, n_lags, n_gridpoints) in chronological order.
+    """
+
+    n_lags = state.shape[1]
+
+    ds = xr.Dataset(
+        {
+            # lags are ordered from the most recent state (as the coeffs)
+            "state": ((realisation_dim, "lags", gridpoint_dim), state[:, ::-1, :]),
+            "seed": seed,
+            "stream_position": stream_position,
+            "stream_key": (realisation_dim, sample_keys),
+        },
+        coords=coords | {"lags": np.arange(1, n_lags + 1)},
+    )
+
+    # for consistency we transpose to lags x gridpoint x realisation
+    return ds.transpose("lags", gridpoint_dim, realisation_dim)
+
+
+def _draw_ar_corr_xr_internal(
+    intercept,
+    coeffs,
+    covariance,
+    *,
+    time,
+    realisation,
+    seed,
     buffer,
     time_dim="time",
     realisation_dim="realisation",
+    is_factor=False,
+    sampler="compat",
+    dtype=np.float64,
+    rng_streams="sequential",
+    init="buffer",
+    previous=None,
+    return_state=False,
 ):
 
     # get the size and coords of the new dimensions
@@ -649,137 +1737,642 @@ def _draw_ar_corr_xr_internal(
         realisation, realisation_dim, "realisation"
     )
 
+    sample_keys = None
+    if rng_streams == "realisation":
+        sample_keys = _realisation_stream_keys(realisation, n_realisations)
+
     # the dimension name of the gridpoints
     (gridpoint_dim,) = set(intercept.dims)
     # make sure non-dimension coords are properly caught
     gridpoint_coords = dict(coeffs[gridpoint_dim].coords)
 
+    initial_state, stream_start = None, 0
+    if previous is not None:
+        initial_state, stream_start = _initial_state_from_previous_draw(
+            previous,
+            sample_keys,
+            n_lags=coeffs.sizes["lags"],
+            gridpoint_dim=gridpoint_dim,
+            realisation_dim=realisation_dim,
+        )
+
+    if _is_banded(covariance):
+        covariance = _banded_from_dataarray(covariance, triangular=is_factor)
+    elif _is_low_rank(covariance):
+        covariance = _low_rank_from_dataarray(covariance)
+    else:
+        covariance = covariance.values
+
     out = _draw_auto_regression_correlated_np(
         intercept=intercept.values,
         coeffs=coeffs.transpose(..., gridpoint_dim).values,
-        covariance=covariance.values,
+        covariance=covariance,
         n_samples=n_realisations,
         n_ts=n_ts,
         seed=seed,
         buffer=buffer,
+        is_factor=is_factor,
+        sampler=sampler,
+        dtype=dtype,
+        sample_keys=sample_keys,
+        init=init,
+        initial_state=initial_state,
+        stream_start=stream_start,
+        return_state=return_state,
+    )
+
+    if return_state:
+        out, state = out
+
+    dims = (realisation_dim, time_dim, gridpoint_dim)
+
+    coords = gridpoint_coords | time_coords | realisation_coords
+
+    out = xr.DataArray(out, dims=dims, coords=coords)
+
+    # for consistency we transpose to time x gridpoint x realisation
+    out = out.transpose(time_dim, gridpoint_dim, realisation_dim)
+
+    if return_state:
+        state = _state_to_dataset(
+            state,
+            seed=seed,
+            stream_position=stream_start + buffer + n_ts,
+            sample_keys=sample_keys,
+            gridpoint_dim=gridpoint_dim,
+            realisation_dim=realisation_dim,
+            coords=gridpoint_coords | realisation_coords,
+        )
+        return out, state
+
+    return out
+
+
+def _draw_auto_regression_correlated_np(
+    *,
+    intercept,
+    coeffs,
+    covariance,
+    n_samples,
+    n_ts,
+    seed,
+    buffer,
+    is_factor=False,
+    sampler="compat",
+    dtype=np.float64,
+    sample_keys=None,
+    init="buffer",
+    initial_state=None,
+    stream_start=0,
+    return_state=False,
+):
+    """
+    Draw time series of an auto regression process with possibly spatially-correlated
+    innovations
+
+    Creates `n_samples` auto-correlated time series of order `ar_order` and length
+    `n_ts` for each set of `n_coeffs` coefficients (typically one set for each grid
+    point), the resulting array has shape n_samples x n_ts x n_coeffs. The innovations
+    can be spatially correlated.
+
+    Parameters
+    ----------
+    intercept : float or ndarray of length n_coeffs
+        Intercept of the model.
+    coeffs : ndarray of shape ar_order x n_coeffs
+        The coefficients of the autoregressive process. Must be a 2D array with the
+        autoregressive coefficients along axis=0, while axis=1 contains all independent
+        coefficients.
+    covariance : float or ndarray of shape n_coeffs x n_coeffs
+        The (co-)variance array. Must be symmetric and positive-semidefinite. Can be a
+        ``_BandedMatrix`` or a ``_LowRankFactor`` (only as factor) for sampler="direct".
+    n_samples : int
+        Number of samples to draw for each set of coefficients.
+    n_ts : int
+        Number of time steps to draw.
+    seed : int
+        Seed used to initialize the pseudo-random number generator.
+    buffer : int
+        Buffer to initialize the autoregressive process (ensures that start at 0 does
+        not influence overall result).
+    is_factor : bool, default: False
+        If True, ``covariance`` is the factor of the covariance matrix (see
+        ``_factorize_covariance_np``). A 1D factor of length n_coeffs contains the
+        standard deviations of independent innovations.
+    sampler : "compat" | "direct", default: "compat"
+        How to draw the innovations: "compat" reproduces the realisations of previous
+        versions, "direct" draws them in-place (see ``_draw_innovations_direct_np``).
+    dtype : np.dtype, default: np.float64
+        Data type of the output, float32 requires ``sampler="direct"``.
+    sample_keys : ndarray of int, default: None
+        If given, uses independent random number streams for each sample and block of
+        time steps, with the given keys (see ``_TiledInnovations``). Requires
+        ``sampler="direct"``. Otherwise, all samples are drawn from one stream.
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process. "buffer" starts the process from zero,
+        "stationary" draws the first ``ar_order`` states from the stationary
+        distribution of the process (see ``_stationary_state_factor_np``).
+    initial_state : ndarray of shape n_samples x ar_order x n_coeffs, default: None
+        The last ``ar_order`` states of a previous draw in chronological order. If
+        given, continues this draw and ``init`` is ignored. Requires ``sample_keys``.
+    stream_start : int, default: 0
+        Position of the first innovation in the random number streams, i.e., the
+        number of time steps drawn previously (including the buffer). Requires
+        ``sample_keys``.
+    return_state : bool, default: False
+        If True, also returns the last ``ar_order`` states.
+
+    Returns
+    -------
+    out : ndarray
+        Drawn realizations of the specified autoregressive process. The array has shape
+        n_samples x n_ts x n_coeffs.
+    state : ndarray
+        The last ``ar_order`` states in chronological order, only returned if
+        ``return_state`` is True. Pass as ``initial_state`` together with
+        ``stream_start=stream_start + buffer + n_ts`` to continue the draw.
+
+    Notes
+    -----
+    As this is not a deterministic function it is not called `predict`. "Predicting"
+    an autoregressive process does not include the innovations and therefore asymptotes
+    towards a certain value (in contrast to this function).
+    """
+    intercept = np.asarray(intercept)
+
+    # coeffs assumed to be ar_order x n_coeffs
+    ar_order, n_coeffs = coeffs.shape
+
+    # arbitrary lags? no, see: https://github.com/MESMER-group/mesmer/issues/164
+
+    # whether a dense factor is lower triangular, determined later if unknown
+    lower = None
+
+    if isinstance(covariance, _LowRankFactor):
+        factor = covariance
+    elif isinstance(covariance, _BandedMatrix):
+        factor = covariance if is_factor else _get_covariance_factor_np(covariance)
+    elif is_factor:
+        # can be 1D for independent innovations
+        factor = np.asarray(covariance)
+    else:
+        factor, lower = _get_covariance_factor_np(
+            np.atleast_2d(covariance), return_lower=True
+        )
+
+    resume = initial_state is not None or stream_start != 0 or return_state
+    if resume and sample_keys is None:
+        raise ValueError("Continuing a draw requires independent random number streams")
+
+    if init == "stationary" and initial_state is None:
+        moments = _stationary_state_factor_np(intercept, coeffs, factor)
+
+    if sample_keys is not None:
+        keys = [(key,) for key in sample_keys]
+
+        # prepend ar_order states as initial state
+        out = np.empty((n_samples, ar_order + buffer + n_ts, n_coeffs), dtype=dtype)
+
+        if initial_state is not None:
+            out[:, :ar_order, :] = initial_state
+        elif init == "stationary":
+            out[:, :ar_order, :] = _draw_stationary_state_np(
+                *moments, n_samples, dtype, rng=None, seed=seed, keys=keys
+            )
+        else:
+            # the process starts from zero
+            out[:, :ar_order, :] = 0.0
+
+        innovations = _TiledInnovations(
+            factor, seed, keys, dtype, start=stream_start, lower=lower
+        )
+        innovations.fill(out[:, ar_order:, :])
+
+        _ar_recursion_inplace(
+            out,
+            intercept=np.broadcast_to(intercept, (1, n_coeffs)),
+            coeffs=coeffs[np.newaxis, :, :],
+            start=ar_order,
+        )
+
+        if return_state:
+            return out[:, ar_order + buffer :, :], out[:, buffer + n_ts :, :]
+
+        return out[:, ar_order + buffer :, :]
+
+    # ensure reproducibility
+    rng = np.random.default_rng(seed)
+
+    if sampler == "compat":
+        innovations = _draw_innovations_correlated_np(
+            factor, rng, n_coeffs, n_samples, n_ts, buffer
+        )
+    else:
+        innovations = np.empty((n_samples, n_ts + buffer, n_coeffs), dtype=dtype)
+        _draw_innovations_direct_np(factor, rng, innovations, lower=lower)
+
+    # copy-by-reference: use innovations as out param to save on memory
+    out = innovations
+
+    if init == "stationary":
+        out[:, :ar_order, :] = _draw_stationary_state_np(
+            *moments, n_samples, dtype, rng=rng, seed=None, keys=None
+        )
+        start = ar_order
+    else:
+        # the process starts from zero
+        out[:, : ar_order + 1, :] = 0.0
+        start = ar_order + 1
+
+    _ar_recursion_inplace(
+        out,
+        intercept=np.broadcast_to(intercept, (1, n_coeffs)),
+        coeffs=coeffs[np.newaxis, :, :],
+        start=start,
     )
 
-    dims = (realisation_dim, time_dim, gridpoint_dim)
+    return out[:, buffer:, :]
+
+
+def _ar_recursion_inplace(out, *, intercept, coeffs, start):
+    """compute an auto regressive process in-place from its innovations
+
+    Parameters
+    ----------
+    out : np.array of shape (n_samples, n_ts, n_coeffs)
+        Must contain the innovations on entry and is overwritten with the auto
+        regressive process for ``t >= start``.
+    intercept : np.array of shape (n_periods, n_coeffs)
+        Intercept of the process for each period.
+    coeffs : np.array of shape (n_periods, ar_order, n_coeffs)
+        Coefficients of the process for each period.
+    start : int
+        First time step to compute. Must be larger or equal to ``ar_order``.
+
+    Notes
+    -----
+    The parameters of time step ``t`` are taken from period ``t % n_periods``, which
+    allows cyclo-stationary processes (e.g., ``n_periods=12`` for monthly data). Uses a
+    compiled kernel if numba is installed. Both implementations perform the same
+    floating point operations in the same order and yield identical results.
+    """
+
+    if start < coeffs.shape[1]:
+        raise ValueError("'start' must be larger or equal to the order of the process")
+
+    # compute in the precision of out (e.g., float32)
+    intercept = np.ascontiguousarray(intercept, dtype=out.dtype)
+    coeffs = np.ascontiguousarray(coeffs, dtype=out.dtype)
+
+    kernel = _get_ar_recursion_numba()
+
+    if kernel is None or out.dtype not in (np.float32, np.float64):
+        return _ar_recursion_inplace_np(out, intercept, coeffs, start)
+
+    kernel(out, intercept, coeffs, start)
+
+
+def _ar_recursion_inplace_np(out, intercept, coeffs, start):
+
+    n_periods, ar_order, _ = coeffs.shape
+    n_ts = out.shape[1]
+
+    # scratch buffers of shape (n_samples, n_coeffs), reused for every time step
+    ar = np.empty_like(out[:, 0, :])
+    tmp = np.empty_like(ar)
+
+    for t in range(start, n_ts):
+        period = t % n_periods
+
+        # NOTE: same order of operations as ``intercept + sum(coeffs * out)``
+        np.multiply(coeffs[period, 0], out[:, t - 1, :], out=ar)
+
+        for lag in range(1, ar_order):
+            np.multiply(coeffs[period, lag], out[:, t - 1 - lag, :], out=tmp)
+            ar += tmp
+
+        ar += intercept[period]
+        out[:, t, :] += ar
+
+
+def _ar_recursion_inplace_loops(out, intercept, coeffs, start):
+    # plain loops compiled with numba, see _get_ar_recursion_numba
+
+    n_samples, n_ts, n_coeffs = out.shape
+    n_periods, ar_order, _ = coeffs.shape
+
+    for sample in range(n_samples):
+        for t in range(start, n_ts):
+            period = t % n_periods
+            for i in range(n_coeffs):
+                ar = coeffs[period, 0, i] * out[sample, t - 1, i]
+                for lag in range(1, ar_order):
+                    ar += coeffs[period, lag, i] * out[sample, t - 1 - lag, i]
+
+                out[sample, t, i] += ar + intercept[period, i]
+
+
+@functools.cache
+def _get_ar_recursion_numba():
+    """compile the AR recursion with numba if it is installed"""
+
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    return numba.njit(_ar_recursion_inplace_loops)
+
+
+def _check_init(init):
+
+    if init not in ("buffer", "stationary"):
+        raise ValueError(
+            f"'init' must be one of 'buffer' or 'stationary', got '{init}'"
+        )
+
+
+def _stationary_moments_ar_np(intercept, coeffs, factor):
+    """mean and covariance of ``ar_order`` consecutive states of a stationary AR process
+
+    Parameters
+    ----------
+    intercept : ndarray of length n_coeffs
+        Intercept of the process.
+    coeffs : ndarray of shape ar_order x n_coeffs
+        The coefficients of the process.
+    factor : ndarray of shape n_coeffs x n_coeffs or of length n_coeffs
+        Factor of the covariance matrix of the innovations or, if 1D, the standard
+        deviation of independent innovations.
+
+    Returns
+    -------
+    mean : ndarray of shape (ar_order, n_coeffs)
+        Stationary mean of the states.
+    covariance : ndarray of shape (ar_order * n_coeffs, ar_order * n_coeffs)
+        Stationary covariance of the flattened states. The states are in chronological
+        order, i.e., the last state is the most recent one. If ``factor`` is 1D, only
+        the independent blocks of each gridpoint are returned, with shape
+        (n_coeffs, ar_order, ar_order).
+
+    Notes
+    -----
+    The states follow ``s_t = A s_{t-1} + e_t``, where ``A`` contains the companion
+    matrix ``C_i`` of each gridpoint. Because the innovations only enter the most
+    recent state, the stationary covariance between gridpoints ``i`` and ``j`` is
+    ``covariance_ij * G_ij``, where ``G_ij`` solves the Stein equation
+    ``G_ij = C_i G_ij C_j^T + E_11``. It is computed with the doubling algorithm.
+    """
+
+    ar_order, n_coeffs = coeffs.shape
+
+    # companion matrices (n_coeffs, ar_order, ar_order)
+    companion = np.zeros((n_coeffs, ar_order, ar_order))
+    companion[:, 0, :] = coeffs.T
+    companion[:, np.arange(1, ar_order), np.arange(ar_order - 1)] = 1.0
+
+    if (np.abs(np.linalg.eigvals(companion)) >= 1.0).any():
+        raise ValueError(
+            "The auto regression process is not stationary - cannot use "
+            "init='stationary'"
+        )
+
+    mean = np.asarray(intercept) / (1.0 - coeffs.sum(axis=0))
+    mean = np.broadcast_to(mean, (ar_order, n_coeffs))
+
+    if factor.ndim == 1:
+        # independent innovations: only G_ii is required
+        stein = _solve_stein_doubling_np(companion, pairwise=False)
+
+        # reversed to chronological order
+        covariance = stein[:, ::-1, ::-1] * (factor**2)[:, np.newaxis, np.newaxis]
+
+        return mean, covariance
+
+    stein = _solve_stein_doubling_np(companion, pairwise=True)
+
+    covariance = factor @ factor.T
+
+    # (lag, gridpoint, lag, gridpoint), reversed to chronological order
+    covariance = stein.transpose(2, 0, 3, 1) * covariance[np.newaxis, :, np.newaxis, :]
+    covariance = covariance[::-1, :, ::-1, :].reshape(ar_order * n_coeffs, -1)
+
+    return mean, covariance
+
+
+def _stationary_state_factor_np(intercept, coeffs, factor):
+    """mean and factor of the covariance of the stationary states of an AR process
+
+    Parameters
+    ----------
+    intercept : ndarray of length n_coeffs
+        Intercept of the process.
+    coeffs : ndarray of shape ar_order x n_coeffs
+        The coefficients of the process.
+    factor : ndarray of shape n_coeffs x n_coeffs or of length n_coeffs
+        Factor of the covariance matrix of the innovations or, if 1D, the standard
+        deviation of independent innovations.
+
+    Returns
+    -------
+    mean : ndarray of shape (ar_order, n_coeffs)
+        Stationary mean of the states.
+    factor : ndarray
+        Factor of the stationary covariance of the states, see
+        ``_stationary_moments_ar_np`` for the shape. Pass to
+        ``_draw_stationary_state_np``.
+
+    Notes
+    -----
+    Computed once per draw and not per chunk. For an AR(1) process with the same
+    coefficient ``phi`` for all gridpoints the stationary covariance is the covariance
+    of the innovations divided by ``1 - phi**2``, so the factor of the innovations is
+    rescaled. Independent gridpoints only require the factors of small blocks.
+    Otherwise, the stationary covariance is factorized using the cache of
+    ``_get_covariance_factor_np``.
+    """
+
+    ar_order, n_coeffs = coeffs.shape
+
+    if factor.ndim == 1:
+        # independent gridpoints: factorize the blocks for unit innovations
+        mean, blocks = _stationary_moments_ar_np(intercept, coeffs, np.ones(n_coeffs))
+        return mean, np.linalg.cholesky(blocks) * factor[:, np.newaxis, np.newaxis]
+
+    if ar_order != 1 or (coeffs != coeffs[0, 0]).any():
+        mean, covariance = _stationary_moments_ar_np(intercept, coeffs, factor)
+        return mean, _get_covariance_factor_np(covariance)
+
+    phi = coeffs[0, 0]
+
+    if abs(phi) >= 1.0:
+        raise ValueError(
+            "The auto regression process is not stationary - cannot use "
+            "init='stationary'"
+        )
+
+    mean = np.asarray(intercept) / (1.0 - phi)
+    mean = np.broadcast_to(mean, (ar_order, n_coeffs))
 
-    coords = gridpoint_coords | time_coords | realisation_coords
+    return mean, factor / np.sqrt(1.0 - phi**2)
 
-    out = xr.DataArray(out, dims=dims, coords=coords)
 
-    # for consistency we transpose to time x gridpoint x realisation
-    out = out.transpose(time_dim, gridpoint_dim, realisation_dim)
+def _solve_stein_doubling_np(companion, pairwise):
+    """solve ``G_ij = C_i G_ij C_j^T + E_11`` with the doubling algorithm
 
-    return out
+    Returns G of shape (n, n, p, p) if ``pairwise`` is True, else only the diagonal
+    G_ii of shape (n, p, p).
+    """
 
+    n_coeffs, ar_order, _ = companion.shape
 
-def _draw_auto_regression_correlated_np(
-    *, intercept, coeffs, covariance, n_samples, n_ts, seed, buffer
-):
-    """
-    Draw time series of an auto regression process with possibly spatially-correlated
-    innovations
+    if pairwise:
+        shape = (n_coeffs, n_coeffs, ar_order, ar_order)
+        subscripts = "iab,ijbc,jdc->ijad"
+    else:
+        shape = (n_coeffs, ar_order, ar_order)
+        subscripts = "iab,ibc,idc->iad"
 
-    Creates `n_samples` auto-correlated time series of order `ar_order` and length
-    `n_ts` for each set of `n_coeffs` coefficients (typically one set for each grid
-    point), the resulting array has shape n_samples x n_ts x n_coeffs. The innovations
-    can be spatially correlated.
+    stein = np.zeros(shape)
+    stein[..., 0, 0] = 1.0
+
+    # after k iterations stein contains the first 2**k terms of the series
+    power = companion
+    for _ in range(64):
+        stein += np.einsum(subscripts, power, stein, power)
+        power = power @ power
+
+        if np.abs(power).max() < np.finfo(float).eps:
+            break
+
+    return stein
+
+
+def _stationary_moments_monthly_np(intercept, slope, factors):
+    """mean and covariance of the first month of a stationary cyclo-stationary AR(1)
 
     Parameters
     ----------
-    intercept : float or ndarray of length n_coeffs
-        Intercept of the model.
-    coeffs : ndarray of shape ar_order x n_coeffs
-        The coefficients of the autoregressive process. Must be a 2D array with the
-        autoregressive coefficients along axis=0, while axis=1 contains all independent
-        coefficients.
-    covariance : float or ndarray of shape n_coeffs x n_coeffs
-        The (co-)variance array. Must be symmetric and positive-semidefinite.
-    n_samples : int
-        Number of samples to draw for each set of coefficients.
-    n_ts : int
-        Number of time steps to draw.
-    seed : int
-        Seed used to initialize the pseudo-random number generator.
-    buffer : int
-        Buffer to initialize the autoregressive process (ensures that start at 0 does
-        not influence overall result).
+    intercept : np.array of shape (12, n_gridpoints)
+        The intercept of the AR(1) process for each month.
+    slope : np.array of shape (12, n_gridpoints)
+        The slope of the AR(1) process for each month.
+    factors : np.array of shape (12, n_gridpoints, n_gridpoints)
+        Factors of the covariance matrices of the innovations for each month.
 
     Returns
     -------
-    out : ndarray
-        Drawn realizations of the specified autoregressive process. The array has shape
-        n_samples x n_ts x n_coeffs.
+    mean : ndarray of shape (1, n_gridpoints)
+        Stationary mean of the first month.
+    covariance : ndarray of shape (n_gridpoints, n_gridpoints)
+        Stationary covariance of the first month.
 
     Notes
     -----
-    As this is not a deterministic function it is not called `predict`. "Predicting"
-    an autoregressive process does not include the innovations and therefore asymptotes
-    towards a certain value (in contrast to this function).
+    Propagates the process over one year, which yields ``x = alpha + beta * x + r``
+    with ``r ~ N(0, R)``. Thus, the stationary mean is ``alpha / (1 - beta)`` and the
+    covariance is ``R / (1 - beta beta^T)`` (element-wise).
     """
-    intercept = np.asarray(intercept)
-    covariance = np.atleast_2d(covariance)
 
-    # coeffs assumed to be ar_order x n_coeffs
-    ar_order, n_coeffs = coeffs.shape
+    n_months, n_gridcells = intercept.shape
 
-    # arbitrary lags? no, see: https://github.com/MESMER-group/mesmer/issues/164
-    ar_lags = np.arange(1, ar_order + 1, dtype=int)
+    alpha = np.zeros(n_gridcells)
+    beta = np.ones(n_gridcells)
+    covariance = np.zeros((n_gridcells, n_gridcells))
 
-    # ensure reproducibility
-    rng = np.random.default_rng(seed)
+    # from the second month of the first year to the first month of the next year
+    for month in [*range(1, n_months), 0]:
+        alpha = intercept[month] + slope[month] * alpha
+        beta = slope[month] * beta
+        covariance *= np.outer(slope[month], slope[month])
+        covariance += factors[month] @ factors[month].T
 
-    innovations = _draw_innovations_correlated_np(
-        covariance, rng, n_coeffs, n_samples, n_ts, buffer
-    )
+    if (np.abs(beta) >= 1.0).any():
+        raise ValueError(
+            "The auto regression process is not stationary - cannot use "
+            "init='stationary'"
+        )
 
-    out = np.zeros([n_samples, n_ts + buffer, n_coeffs])
-    for t in range(ar_order + 1, n_ts + buffer):
+    mean = alpha / (1.0 - beta)
+    covariance /= 1.0 - np.outer(beta, beta)
 
-        ar = np.sum(coeffs * out[:, t - ar_lags, :], axis=1)
+    return mean[np.newaxis, :], covariance
 
-        out[:, t, :] = intercept + ar + innovations[:, t, :]
 
-    return out[:, buffer:, :]
+def _draw_stationary_state_np(mean, factor, n_samples, dtype, *, rng, seed, keys):
+    """draw the initial states of an AR process from its stationary distribution
+
+    Parameters
+    ----------
+    mean : ndarray of shape (n_states, n_coeffs)
+        Stationary mean of the states.
+    factor : ndarray of shape (n_states * n_coeffs, n_states * n_coeffs)
+        Factor of the stationary covariance of the flattened states, see
+        ``_stationary_state_factor_np``. Can also be of shape
+        (n_coeffs, n_states, n_states) for independent gridpoints.
+    n_samples : int
+        Number of samples to draw.
+    dtype : np.dtype
+        Data type of the states.
+    rng : np.random.Generator | None
+        Random number generator used for all samples. Used if ``keys`` is None.
+    seed : int | None
+        Seed of the random number streams, see ``_stream_rng``.
+    keys : list of tuple of int | None
+        Keys of the random number streams of each sample.
+
+    Returns
+    -------
+    states : ndarray of shape (n_samples, n_states, n_coeffs)
+    """
+
+    factor = factor.astype(dtype, copy=False)
+
+    if keys is None:
+        states = rng.standard_normal((n_samples, mean.size), dtype=dtype)
+    else:
+        states = np.empty((n_samples, mean.size), dtype)
+        for i, key in enumerate(keys):
+            _stream_rng(seed, key).standard_normal(out=states[i], dtype=dtype)
+
+    n_states, n_coeffs = mean.shape
+
+    if factor.ndim == 3:
+        # independent gridpoints
+        states = states.reshape(n_samples, n_coeffs, n_states)
+        states = np.einsum("iab,sib->sai", factor, states)
+    else:
+        states = (states @ factor.T).reshape(n_samples, n_states, n_coeffs)
+
+    states += mean
+
+    return states
 
 
 @_set_threads_from_options()
-def _draw_innovations_correlated_np(
-    covariance, rng, n_gridcells, n_samples, n_ts, buffer
-):
+def _draw_innovations_correlated_np(factor, rng, n_gridcells, n_samples, n_ts, buffer):
     # NOTE: 'innovations' is the error or noise term.
     # innovations has shape (n_samples, n_ts + buffer, n_coeffs)
-    cov = None
-    try:
-        cov = scipy.stats.Covariance.from_cholesky(np.linalg.cholesky(covariance))
-    except np.linalg.LinAlgError as e:
-        if "Matrix is not positive definite" in str(e):
-            w, v = np.linalg.eigh(covariance)
-            cov = scipy.stats.Covariance.from_eigendecomposition((w, v))
-            msg = (
-                "Covariance matrix is not positive definite, using eigh instead of "
-                "cholesky."
-            )
-            warnings.warn(
-                msg,
-                LinAlgWarning,
-            )
 
-    innovations = scipy.stats.multivariate_normal.rvs(
-        mean=np.zeros(n_gridcells),
-        cov=cov,
-        size=[n_samples, n_ts + buffer],
-        random_state=rng,
-    ).reshape(n_samples, n_ts + buffer, n_gridcells)
+    # NOTE: same as ``scipy.stats.multivariate_normal.rvs`` with a ``Covariance``
+    # object, without recomputing the factor of the covariance matrix
+    innovations = rng.normal(size=(n_samples, n_ts + buffer, n_gridcells))
+
+    if factor.ndim == 1:
+        # standard deviations of independent innovations
+        innovations *= factor
+    else:
+        innovations = innovations @ factor.T
 
     return innovations
 
 
 def fit_auto_regression(
-    data: xr.DataArray, dim: str, *, lags: int | Sequence[int]
+    data: xr.DataArray,
+    dim: str,
+    *,
+    lags: int | Sequence[int],
+    method: Literal["numpy", "statsmodels"] = "numpy",
 ) -> xr.Dataset:
     """fit an auto regression
 
@@ -792,6 +2385,13 @@ def fit_auto_regression(
     lags : int | Sequence[int]
         The number of lags or list of lags to include in the model.
         If int, then all lags up to ``lags`` will be included.
+    method : {"numpy", "statsmodels"}, default: "numpy"
+        Method used to estimate the parameters.
+
+        - "numpy": builds the lagged regressors for all time series at once and solves
+          the ordinary least squares problem in one batched call.
+        - "statsmodels": fits ``statsmodels.tsa.ar_model.AutoReg`` for each time series
+          individually. Considerably slower, mostly kept as reference.
 
     Returns
     -------
@@ -804,16 +2404,30 @@ def fit_auto_regression(
     if not isinstance(data, xr.DataArray):
         raise TypeError(f"Expected a `xr.DataArray`, got {type(data)}")
 
-    # NOTE: this is slowish, see https://github.com/MESMER-group/mesmer/pull/290
-    intercept, coeffs, variance, nobs = xr.apply_ufunc(
-        _fit_auto_regression_np,
-        data,
-        input_core_dims=[[dim]],
-        output_core_dims=((), ("lags",), (), ()),
-        vectorize=True,
-        output_dtypes=[float, float, float, int],
-        kwargs={"lags": lags},
-    )
+    if method == "numpy":
+        intercept, coeffs, variance, nobs = xr.apply_ufunc(
+            _fit_auto_regression_batched_np,
+            data,
+            input_core_dims=[[dim]],
+            output_core_dims=((), ("lags",), (), ()),
+            output_dtypes=[float, float, float, int],
+            kwargs={"lags": lags},
+        )
+    elif method == "statsmodels":
+        # NOTE: this is slowish, see https://github.com/MESMER-group/mesmer/pull/290
+        intercept, coeffs, variance, nobs = xr.apply_ufunc(
+            _fit_auto_regression_np,
+            data,
+            input_core_dims=[[dim]],
+            output_core_dims=((), ("lags",), (), ()),
+            vectorize=True,
+            output_dtypes=[float, float, float, int],
+            kwargs={"lags": lags},
+        )
+    else:
+        raise ValueError(
+            f"'method' must be one of 'numpy' or 'statsmodels', got '{method}'"
+        )
 
     if isinstance(lags, int):
         lags = list(range(1, lags + 1))
@@ -830,6 +2444,146 @@ def fit_auto_regression(
     return xr.Dataset(data_vars)
 
 
+def _lagged_design_np(data: np.ndarray, lags: int | Sequence[int]):
+    """construct the target and the lagged regressors of an auto regression
+
+    Parameters
+    ----------
+    data : np.array
+        Array of time series, time must be along the last axis.
+    lags : int | Sequence[int]
+        The number of lags or list of lags to include in the model.
+
+    Returns
+    -------
+    target : :obj:`np.array`
+        The target of the regression, i.e., ``data`` without the first ``max(lags)``
+        time steps. Has shape ``(..., nobs)``.
+    regressors : :obj:`np.array`
+        The lagged regressors, has shape ``(..., n_lags, nobs)``.
+    """
+
+    if isinstance(lags, int):
+        lags = range(1, lags + 1)
+
+    lags = list(lags)
+    n_ts = data.shape[-1]
+    maxlag = max(lags)
+
+    if min(lags) < 1:
+        raise ValueError(f"lags must be positive, got {lags}")
+
+    if n_ts - maxlag < len(lags) + 1:
+        raise ValueError(
+            f"Not enough time steps ({n_ts}) to fit an auto regression with lags {lags}"
+        )
+
+    target = data[..., maxlag:]
+    regressors = np.stack(
+        [data[..., maxlag - lag : n_ts - lag] for lag in lags], axis=-2
+    )
+
+    return target, regressors
+
+
+def _ols_centered_np(target: np.ndarray, regressors: np.ndarray):
+    """batched ordinary least squares with intercept
+
+    Parameters
+    ----------
+    target : np.array
+        Target of shape ``(..., nobs)``.
+    regressors : np.array
+        Regressors of shape ``(..., n_regressors, nobs)``.
+
+    Returns
+    -------
+    intercept : :obj:`np.array`
+        Intercept, shape ``(...)``.
+    coeffs : :obj:`np.array`
+        Coefficients, shape ``(..., n_regressors)``.
+    residuals : :obj:`np.array`
+        Residuals, shape ``(..., nobs)``.
+
+    Notes
+    -----
+    The regression is solved on centered data, which avoids the poor conditioning of
+    the normal equations for data with a large offset (e.g. temperatures in K). Uses
+    the pseudo-inverse (like ``statsmodels.OLS``) such that rank deficient problems do
+    not raise. Time series containing non-finite values yield NaN.
+    """
+
+    target_mean = target.mean(axis=-1)
+    regressors_mean = regressors.mean(axis=-1)
+
+    y = target - target_mean[..., np.newaxis]
+    X = regressors - regressors_mean[..., np.newaxis]
+
+    # normal equations for all time series at once
+    xtx = X @ X.swapaxes(-1, -2)
+    xty = (X @ y[..., np.newaxis])[..., 0]
+
+    # the pseudo-inverse cannot handle non-finite values
+    valid = np.isfinite(xtx).all(axis=(-1, -2)) & np.isfinite(xty).all(axis=-1)
+    xtx[~valid] = np.eye(xtx.shape[-1])
+    xty[~valid] = np.nan
+
+    coeffs = (np.linalg.pinv(xtx, hermitian=True) @ xty[..., np.newaxis])[..., 0]
+
+    intercept = target_mean - np.sum(coeffs * regressors_mean, axis=-1)
+    residuals = y - (coeffs[..., np.newaxis, :] @ X)[..., 0, :]
+
+    return intercept, coeffs, residuals
+
+
+def _fit_auto_regression_batched_np(data: np.ndarray, lags: int | Sequence[int]):
+    """
+    fit an auto regression for many time series at once - numpy wrapper
+
+    Parameters
+    ----------
+    data : np.array
+        A numpy array to estimate the auto regression over. The time series must be
+        along the last axis.
+    lags : int | Sequence[int]
+        The number of lags to include in the model.
+
+    Returns
+    -------
+    intercept : :obj:`np.array`
+        Intercept of the fitted AR model.
+    coeffs : :obj:`np.array`
+        Coefficients if the AR model. Will have as many entries as ``lags`` along the
+        last axis.
+    variance : :obj:`np.array`
+        Variance of the residuals.
+    nobs: :obj:`np.array``
+        Number of observations.
+
+    Notes
+    -----
+    Yields the same estimates as :func:`_fit_auto_regression_np` (i.e. the
+    conditional maximum likelihood of ``statsmodels.tsa.ar_model.AutoReg``), but
+    solves the normal equations for all time series in one batched call.
+    """
+
+    # a contiguous copy ensures the result for each time series does not depend on
+    # the memory layout of data (i.e., on the batch it is estimated in)
+    data = np.ascontiguousarray(data, dtype=float)
+
+    target, regressors = _lagged_design_np(data, lags)
+
+    intercept, coeffs, residuals = _ols_centered_np(target, regressors)
+
+    # variance of the residuals - AutoReg uses the number of observations as ddof
+    nobs = target.shape[-1]
+    variance = np.mean(residuals**2, axis=-1)
+
+    nobs = np.full(intercept.shape, nobs)
+
+    return intercept, coeffs, variance, nobs
+
+
 def _fit_auto_regression_np(data: np.ndarray, lags: int | Sequence[int]):
     """
     fit an auto regression - numpy wrapper
@@ -936,11 +2690,47 @@ def fit_auto_regression_monthly(
 
     """
     _check_dataarray_form(monthly_data, "monthly_data", required_coords=time_dim)
-    monthly_groups = monthly_data.groupby(f"{time_dim}.month")
-    ar_params_res: list[xr.Dataset] = []
 
     (sample_dim,) = monthly_data[time_dim].dims
 
+    months = monthly_data[time_dim].dt.month.values
+    n_years, remainder = divmod(months.size, 12)
+
+    # use the vectorized version if the data consists of full years starting in January
+    if remainder == 0 and np.array_equal(months, np.tile(np.arange(1, 13), n_years)):
+        return _fit_auto_regression_monthly_vectorized(monthly_data, sample_dim)
+
+    return _fit_auto_regression_monthly_loop(monthly_data, time_dim, sample_dim)
+
+
+def _fit_auto_regression_monthly_vectorized(monthly_data, sample_dim):
+
+    slope, intercept, residuals = xr.apply_ufunc(
+        _fit_auto_regression_monthly_batched_np,
+        monthly_data,
+        input_core_dims=[[sample_dim]],
+        output_core_dims=[["month"], ["month"], [sample_dim]],
+    )
+
+    month = np.arange(1, 13)
+    slope = slope.assign_coords(month=month).transpose("month", ...)
+    intercept = intercept.assign_coords(month=month).transpose("month", ...)
+
+    ar_params = xr.Dataset({"slope": slope, "intercept": intercept})
+
+    # we loose one timestep
+    residuals = residuals.transpose(*monthly_data.dims)
+    residuals = residuals.isel({sample_dim: slice(1, None)})
+    residuals.name = "residuals"
+
+    return ar_params, residuals
+
+
+def _fit_auto_regression_monthly_loop(monthly_data, time_dim, sample_dim):
+
+    monthly_groups = monthly_data.groupby(f"{time_dim}.month")
+    ar_params_res: list[xr.Dataset] = []
+
     residuals = xr.full_like(monthly_data, fill_value=np.nan)
     # we loose one timestep
     residuals = residuals.isel({sample_dim: slice(1, None)})
@@ -979,6 +2769,68 @@ def fit_auto_regression_monthly(
     return ar_params, residuals
 
 
+def _fit_auto_regression_monthly_batched_np(data):
+    """fit a cyclo-stationary AR(1) process for all months and time series at once
+
+    Parameters
+    ----------
+    data : np.array
+        Monthly time series along the last axis, consisting of full years starting in
+        January.
+
+    Returns
+    -------
+    slope : :obj:`np.array`
+        The slope of the AR(1) process for each month (along the last axis).
+    intercept : :obj:`np.array`
+        The intercept of the AR(1) process for each month (along the last axis).
+    residuals : :obj:`np.array`
+        The residuals of the same shape as ``data``. The first time step (which has no
+        predecessor) is NaN.
+
+    Notes
+    -----
+    Yields the same estimates as calling :func:`_fit_auto_regression_monthly_np` for
+    each month, but uses closed-form weighted moments on the data reshaped to (year,
+    month) instead of a loop over months and time series.
+    """
+
+    data = np.asarray(data, dtype=float)
+    *other, n_ts = data.shape
+    n_years = n_ts // 12
+
+    # value of the previous month, the first January has no previous December
+    prev = np.empty_like(data)
+    prev[..., 0] = 0.0
+    prev[..., 1:] = data[..., :-1]
+
+    cur = data.reshape(*other, n_years, 12)
+    prev = prev.reshape(*other, n_years, 12)
+
+    # the first January is excluded from the estimation via its weight
+    weights = np.ones((n_years, 12))
+    weights[0, 0] = 0.0
+    sum_of_weights = weights.sum(axis=0)
+
+    def _weighted_mean(arr):
+        return np.sum(weights * arr, axis=-2) / sum_of_weights
+
+    prev_mean = _weighted_mean(prev)
+    cur_mean = _weighted_mean(cur)
+
+    prev_anom = prev - prev_mean[..., np.newaxis, :]
+    cur_anom = cur - cur_mean[..., np.newaxis, :]
+
+    slope = _weighted_mean(prev_anom * cur_anom) / _weighted_mean(prev_anom**2)
+    intercept = cur_mean - slope * prev_mean
+
+    residuals = cur - (intercept[..., np.newaxis, :] + slope[..., np.newaxis, :] * prev)
+    residuals = residuals.reshape(*other, n_ts)
+    residuals[..., 0] = np.nan
+
+    return slope, intercept, residuals
+
+
 def _fit_auto_regression_monthly_np(data_month, data_prev_month):
     """fit an auto regression of lag one (AR(1)) on monthly data
     We use a linear function to relate the previous month's data
@@ -1009,14 +2861,20 @@ def _fit_auto_regression_monthly_np(data_month, data_prev_month):
 
 def draw_auto_regression_monthly(
     ar_params: xr.Dataset,
-    covariance: xr.DataArray,
+    covariance: xr.DataArray | None,
     *,
     time: xr.DataArray | pd.Index,
     n_realisations: int,
-    seed: int | xr.DataTree,
+    seed: int | xr.Dataset | xr.DataTree,
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    covariance_factor: xr.DataArray | None = None,
+    sampler: Literal["compat", "direct"] = "compat",
+    dtype: str | np.dtype = "float64",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
+    return_state: bool = False,
 ) -> xr.Dataset:
     """draw time series of a cyclo-stationary auto-regressive process of lag one (AR(1))
     using individual parameters for each month including spatially-correlated
@@ -1039,6 +2897,7 @@ def draw_auto_regression_monthly(
         white noise process for each month. Must be symmetric and at least
         positive-semidefinite.
         Used to draw spatially-correlated innovations using a multivariate normal.
+        Must be None if ``covariance_factor`` is passed.
 
     time : xr.DataArray | pd.Index
         The time coordinates that determines the length of the predicted timeseries and
@@ -1047,10 +2906,12 @@ def draw_auto_regression_monthly(
     n_realisations : int
         The number of realisations to draw.
 
-    seed : int | xr.DataTree
+    seed : int | xr.Dataset | xr.DataTree
         Seed used to initialize the pseudo-random number generator. Can be an int or a
         xr.DataTree that contains Datasets with a single variable "seed" with the seed
-        value, used to draw samples for multiple scenarios.
+        value, used to draw samples for multiple scenarios. Can also be the result of a
+        draw with ``return_state=True`` (or a DataTree thereof) to continue this draw,
+        see ``return_state``.
 
     buffer : int
         Buffer to initialize the autoregressive process (ensures that start at 0 does
@@ -1062,6 +2923,40 @@ def draw_auto_regression_monthly(
     realisation_dim : str, default "realisation"
         Name of the realisation dimension for the output data.
 
+    covariance_factor : xr.DataArray of shape (12, n_gridpoints, n_gridpoints)
+        Precomputed factors of the covariance matrices, see
+        :func:`factorize_covariance`. Avoids factorizing ``covariance`` for every call.
+
+    sampler : "compat" | "direct", default: "compat"
+        How to draw the innovations. See :func:`draw_auto_regression_correlated`.
+
+    dtype : str | np.dtype, default: "float64"
+        Data type of the drawn realisations, "float32" or "float64". "float32" requires
+        ``sampler="direct"``.
+
+    rng_streams : "sequential" | "realisation", default: "sequential"
+        How the random numbers are derived from ``seed``. "realisation" uses
+        independent random number streams for each realisation, month and block of
+        years, such that any subset of realisations can be drawn independently. The
+        realisations are numbered ``0, ..., n_realisations - 1``. See
+        :func:`draw_auto_regression_correlated`.
+
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process.
+
+        - "buffer": starts the process from the innovations of the first month and
+          discards the first ``buffer`` years.
+        - "stationary": draws the first month from the stationary distribution of the
+          cyclo-stationary process, which is computed from ``ar_params`` and the
+          covariance matrices. No spin-up is required, i.e., ``buffer`` can be set to
+          0. Requires a stationary process.
+
+    return_state : bool, default: False
+        If True, the returned Dataset additionally contains the last month ("state"),
+        the "seed", and the position in the random number streams. Passing it as
+        ``seed`` continues the draw. Requires ``rng_streams="realisation"`` and full
+        years. See :func:`draw_auto_regression_correlated`.
+
     Returns
     -------
     result : xr.Dataset
@@ -1071,7 +2966,8 @@ def draw_auto_regression_monthly(
 
     """
 
-    return _draw_auto_regression_monthly(
+    return _draw_scenarios(
+        _draw_auto_regression_monthly,
         seed,
         ar_params,
         covariance,
@@ -1080,6 +2976,12 @@ def draw_auto_regression_monthly(
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        covariance_factor=covariance_factor,
+        sampler=sampler,
+        dtype=dtype,
+        rng_streams=rng_streams,
+        init=init,
+        return_state=return_state,
     )
 
 
@@ -1087,13 +2989,19 @@ def draw_auto_regression_monthly(
 def _draw_auto_regression_monthly(
     seed: int | xr.DataTree,
     ar_params: xr.Dataset,
-    covariance: xr.DataArray,
+    covariance: xr.DataArray | None,
     *,
     time: xr.DataArray | pd.Index,
     n_realisations: int,
     buffer: int,
     time_dim: str = "time",
     realisation_dim: str = "realisation",
+    covariance_factor: xr.DataArray | None = None,
+    sampler: Literal["compat", "direct"] = "compat",
+    dtype: str | np.dtype = "float64",
+    rng_streams: Literal["sequential", "realisation"] = "sequential",
+    init: Literal["buffer", "stationary"] = "buffer",
+    return_state: bool = False,
 ) -> xr.Dataset:
 
     # NOTE: seed must be the first positional argument for map_over_datasets to work
@@ -1111,13 +3019,17 @@ def _draw_auto_regression_monthly(
     _check_dataarray_form(
         ar_params.slope, "slope", ndim=2, required_dims={month_dim, gridcell_dim}
     )
-    _check_dataarray_form(
-        covariance, "covariance", ndim=3, shape=(n_months, size, size)
+    covariance, name = _covariance_or_factor(covariance, covariance_factor)
+    dtype = _check_sampler_and_dtype(sampler, dtype)
+    _check_rng_streams(rng_streams, sampler)
+    _check_init(init)
+    _check_dataarray_form(covariance, name, ndim=3, shape=(n_months, size, size))
+
+    seed, previous = _seed_and_previous_draw(seed)
+    _check_continuation(
+        previous, return_state=return_state, rng_streams=rng_streams, buffer=buffer
     )
 
-    if isinstance(seed, xr.Dataset):
-        seed = int(seed.seed.item())
-
     result = _draw_ar_corr_monthly_xr_internal(
         intercept=ar_params.intercept,
         slope=ar_params.slope,
@@ -1128,8 +3040,19 @@ def _draw_auto_regression_monthly(
         buffer=buffer,
         time_dim=time_dim,
         realisation_dim=realisation_dim,
+        is_factor=name == "covariance_factor",
+        sampler=sampler,
+        dtype=dtype,
+        rng_streams=rng_streams,
+        init=init,
+        previous=previous,
+        return_state=return_state,
     )
 
+    if return_state:
+        result, state = result
+        return result.rename("samples").to_dataset().merge(state)
+
     return result.rename("samples").to_dataset()
 
 
@@ -1144,6 +3067,13 @@ def _draw_ar_corr_monthly_xr_internal(
     buffer,
     time_dim="time",
     realisation_dim="realisation",
+    is_factor=False,
+    sampler="compat",
+    dtype=np.float64,
+    rng_streams="sequential",
+    init="buffer",
+    previous=None,
+    return_state=False,
 ):
 
     # get the size and coords of the new dimensions
@@ -1152,11 +3082,28 @@ def _draw_ar_corr_monthly_xr_internal(
         realisation, realisation_dim, "realisation"
     )
 
+    sample_keys = None
+    if rng_streams == "realisation":
+        sample_keys = _realisation_stream_keys(realisation, n_realisations)
+
     # the dimension name of the gridpoints
     _, gridpoint_dim = intercept.dims
     # make sure non-dimension coords are properly caught
     gridpoint_coords = dict(slope[gridpoint_dim].coords)
 
+    if (previous is not None or return_state) and n_ts % 12:
+        raise ValueError("Continuing a monthly draw requires full years")
+
+    initial_state, stream_start = None, 0
+    if previous is not None:
+        initial_state, stream_start = _initial_state_from_previous_draw(
+            previous,
+            sample_keys,
+            n_lags=1,
+            gridpoint_dim=gridpoint_dim,
+            realisation_dim=realisation_dim,
+        )
+
     out = _draw_auto_regression_monthly_np(
         intercept=intercept.values,
         slope=slope.transpose(..., gridpoint_dim).values,
@@ -1165,8 +3112,19 @@ def _draw_ar_corr_monthly_xr_internal(
         n_ts=n_ts,
         seed=seed,
         buffer=buffer,
+        is_factor=is_factor,
+        sampler=sampler,
+        dtype=dtype,
+        sample_keys=sample_keys,
+        init=init,
+        initial_state=initial_state,
+        stream_start=stream_start,
+        return_state=return_state,
     )
 
+    if return_state:
+        out, state = out
+
     dims = (realisation_dim, time_dim, gridpoint_dim)
 
     coords = gridpoint_coords | time_coords | realisation_coords
@@ -1176,11 +3134,37 @@ def _draw_ar_corr_monthly_xr_internal(
     # for consistency we transpose to time x gridpoint x realisation
     out = out.transpose(time_dim, gridpoint_dim, realisation_dim)
 
+    if return_state:
+        state = _state_to_dataset(
+            state,
+            seed=seed,
+            stream_position=stream_start + buffer + n_ts // 12,
+            sample_keys=sample_keys,
+            gridpoint_dim=gridpoint_dim,
+            realisation_dim=realisation_dim,
+            coords=gridpoint_coords | realisation_coords,
+        )
+        return out, state
+
     return out
 
 
 def _draw_auto_regression_monthly_np(
-    intercept, slope, covariance, n_samples, n_ts, seed, buffer
+    intercept,
+    slope,
+    covariance,
+    n_samples,
+    n_ts,
+    seed,
+    buffer,
+    is_factor=False,
+    sampler="compat",
+    dtype=np.float64,
+    sample_keys=None,
+    init="buffer",
+    initial_state=None,
+    stream_start=0,
+    return_state=False,
 ):
     """draw time series of an auto regression process with lag one
     (AR(1)) using individual parameters for each month - numpy wrapper
@@ -1205,42 +3189,112 @@ def _draw_auto_regression_monthly_np(
         Buffer to initialize the autoregressive process (ensures that start at 0 does
         not influence overall result). The number given is used for every month such
         that at the end 12*buffer months are cut off.
+    is_factor : bool, default: False
+        If True, ``covariance`` contains the factors of the covariance matrices (see
+        ``_factorize_covariance_np``).
+    sampler : "compat" | "direct", default: "compat"
+        How to draw the innovations, see ``_draw_auto_regression_correlated_np``.
+    dtype : np.dtype, default: np.float64
+        Data type of the output, float32 requires ``sampler="direct"``.
+    sample_keys : ndarray of int, default: None
+        If given, uses independent random number streams for each sample, month and
+        block of years, see ``_draw_auto_regression_correlated_np``.
+    init : "buffer" | "stationary", default: "buffer"
+        How to initialize the process. "buffer" starts the process from the innovation
+        of the first month, "stationary" draws the first month from the stationary
+        distribution of the process (see ``_stationary_moments_monthly_np``).
+    initial_state : np.array of shape (n_samples, 1, n_gridpoints), default: None
+        The last month of a previous draw. If given, continues this draw and ``init``
+        is ignored. Requires ``sample_keys``.
+    stream_start : int, default: 0
+        Position of the first innovation in the random number streams, i.e., the
+        number of years drawn previously (including the buffer). Requires
+        ``sample_keys``.
+    return_state : bool, default: False
+        If True, also returns the last month.
 
     Returns
     -------
     out : np.array of shape (n_samples, n_ts, n_gridpoints)
         Predicted time series of the specified AR(1) including spatially correlated
         innovations.
+    state : np.array of shape (n_samples, 1, n_gridpoints)
+        The last month, only returned if ``return_state`` is True. Pass as
+        ``initial_state`` together with ``stream_start=stream_start + buffer +
+        n_ts // 12`` to continue the draw.
     """
     intercept = np.asarray(intercept)
     covariance = np.atleast_3d(covariance)
 
     _, n_gridcells = intercept.shape
 
+    resume = initial_state is not None or stream_start != 0 or return_state
+    if resume and sample_keys is None:
+        raise ValueError("Continuing a draw requires independent random number streams")
+
     # ensure reproducibility
     rng = np.random.default_rng(seed)
 
     # draw innovations for each month
-    innovations = np.zeros([n_samples, n_ts // 12 + buffer, 12, n_gridcells])
+    innovations = np.zeros([n_samples, n_ts // 12 + buffer, 12, n_gridcells], dtype)
+
+    if sampler == "direct":
+        # the rng requires a contiguous buffer - reused for all months
+        innovations_month = np.empty(innovations.shape[:2] + (n_gridcells,), dtype)
+
+    factors = []
 
     for month in range(12):
         cov_month = covariance[month, :, :]
-        innovations[:, :, month, :] = _draw_innovations_correlated_np(
-            cov_month, rng, n_gridcells, n_samples, n_ts // 12, buffer
-        )
+        if is_factor:
+            factor, lower = cov_month, None
+        else:
+            factor, lower = _get_covariance_factor_np(cov_month, return_lower=True)
+
+        factors.append(factor)
+
+        if sample_keys is not None:
+            keys = [(key, month) for key in sample_keys]
+            tiled = _TiledInnovations(
+                factor, seed, keys, dtype, start=stream_start, lower=lower
+            )
+            tiled.fill(innovations_month)
+        elif sampler == "compat":
+            innovations_month = _draw_innovations_correlated_np(
+                factor, rng, n_gridcells, n_samples, n_ts // 12, buffer
+            )
+        else:
+            _draw_innovations_direct_np(factor, rng, innovations_month, lower=lower)
+
+        innovations[:, :, month, :] = innovations_month
 
     # reshape innovations into continuous time series
     innovations = innovations.reshape(n_samples, n_ts + buffer * 12, n_gridcells)
 
+    if initial_state is not None:
+        # first month from the last month of the previous draw - same operations as
+        # in ``_ar_recursion_inplace``
+        first_slope, first_intercept = slope[0].astype(dtype), intercept[0].astype(
+            dtype
+        )
+        innovations[:, 0, :] += first_slope * initial_state[:, -1, :] + first_intercept
+    elif init == "stationary":
+        mean, covariance = _stationary_moments_monthly_np(intercept, slope, factors)
+        factor = _get_covariance_factor_np(covariance)
+        keys = None if sample_keys is None else [(key,) for key in sample_keys]
+
+        innovations[:, :1, :] = _draw_stationary_state_np(
+            mean, factor, n_samples, dtype, rng=rng, seed=seed, keys=keys
+        )
+
     # predict auto-regressive process using innovations
     # copy-by-reference: use innovations as out param to save on memory
     out = innovations
-    for t in range(1, n_ts + buffer * 12):
-        month = t % 12
-        out[:, t, :] = (
-            intercept[month, :]
-            + slope[month, :] * out[:, t - 1, :]
-            + innovations[:, t, :]
-        )
+    _ar_recursion_inplace(
+        out, intercept=intercept, coeffs=slope[:, np.newaxis, :], start=1
+    )
+
+    if return_state:
+        return out[:, buffer * 12 :, :], out[:, -1:, :]
 
     return out[:, buffer * 12 :, :]
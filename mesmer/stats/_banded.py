@@ -0,0 +1,250 @@
+from typing import NamedTuple
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.csgraph
+import xarray as xr
+
+
+class _BandedMatrix(NamedTuple):
+    """symmetric matrix or its lower Cholesky factor in banded storage
+
+    The rows and columns are reordered by ``permutation`` to reduce the bandwidth,
+    i.e., the reordered matrix is ``matrix[permutation][:, permutation]``. ``bands[k,
+    j]`` contains its element ``[j + k, j]`` (the lower form used by
+    ``scipy.linalg.cholesky_banded``).
+    """
+
+    bands: np.ndarray
+    permutation: np.ndarray
+    triangular: bool = False
+
+    @property
+    def shape(self):
+        n = self.bands.shape[-1]
+        return (n, n)
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def dtype(self):
+        return self.bands.dtype
+
+    @property
+    def n_bands(self):
+        return self.bands.shape[0]
+
+    def astype(self, dtype):
+        return self._replace(bands=self.bands.astype(dtype, copy=False))
+
+    def cholesky(self):
+        """lower Cholesky factor, raises ``np.linalg.LinAlgError`` if not positive
+        definite"""
+
+        bands = scipy.linalg.cholesky_banded(self.bands, lower=True)
+        return self._replace(bands=bands, triangular=True)
+
+    def toarray(self):
+        """dense matrix in the original order"""
+
+        n_bands, n = self.bands.shape
+
+        reordered = np.zeros((n, n), dtype=self.dtype)
+        for k in range(n_bands):
+            j = np.arange(n - k)
+            reordered[j + k, j] = self.bands[k, : n - k]
+            if not self.triangular:
+                reordered[j, j + k] = self.bands[k, : n - k]
+
+        out = np.empty_like(reordered)
+        out[np.ix_(self.permutation, self.permutation)] = reordered
+
+        return out
+
+
+def _band_blocks(n_bands, n, block_size):
+    """indices of the column blocks of a banded matrix
+
+    Yields ``(start, stop, end, k, valid)``: the columns ``start:stop`` are non-zero in
+    the rows ``start:end``, ``k`` is the band of each element of this block of shape
+    (end - start, stop - start) and ``valid`` indicates elements within the band.
+    """
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        end = min(stop + n_bands - 1, n)
+
+        k = np.arange(start, end)[:, np.newaxis] - np.arange(start, stop)
+        valid = (k >= 0) & (k < n_bands)
+
+        yield start, stop, end, k, valid
+
+
+def _block_size(n_bands):
+    return max(n_bands, 64)
+
+
+def _cols(start, stop):
+    return np.arange(start, stop)[np.newaxis, :]
+
+
+def _colorize_banded_inplace_np(factor, x, block_size):
+    """compute ``x @ factor.T`` in-place for a banded factor, see
+    ``_colorize_inplace_np``"""
+
+    n_bands, n = factor.bands.shape
+    blocks = list(_band_blocks(n_bands, n, _block_size(n_bands)))
+
+    # dense blocks of the factor, computed once for all rows of x
+    dense = [
+        np.where(valid, factor.bands[np.clip(k, 0, n_bands - 1), _cols(start, stop)], 0)
+        for start, stop, end, k, valid in blocks
+    ]
+
+    scratch = np.empty((min(block_size, x.shape[0]), n), dtype=x.dtype)
+
+    for row in range(0, x.shape[0], block_size):
+        block = x[row : row + block_size]
+        tmp = scratch[: block.shape[0]]
+        tmp[:] = 0
+
+        for (start, stop, end, __, ___), factor_block in zip(blocks, dense):
+            tmp[:, start:end] += block[:, start:stop] @ factor_block.T
+
+        block[:, factor.permutation] = tmp
+
+
+def _band_permutation(pattern):
+    """reorder a sparse symmetric matrix to reduce its bandwidth
+
+    Parameters
+    ----------
+    pattern : scipy.sparse array of shape (n, n)
+        Symmetric matrix, only the positions of its stored elements are used.
+
+    Returns
+    -------
+    permutation : ndarray of int
+        The reverse Cuthill-McKee ordering.
+    n_bands : int
+        Number of bands (bandwidth + 1) of the reordered matrix.
+    """
+
+    pattern = scipy.sparse.csr_array(pattern)
+
+    permutation = scipy.sparse.csgraph.reverse_cuthill_mckee(
+        pattern, symmetric_mode=True
+    )
+
+    reordered = pattern[permutation][:, permutation].tocoo()
+
+    n_bands = int(np.abs(reordered.row - reordered.col).max(initial=0)) + 1
+
+    return permutation, n_bands
+
+
+def _sparse_to_banded(matrix, permutation, n_bands):
+    """convert a sparse symmetric matrix to a ``_BandedMatrix``"""
+
+    n = matrix.shape[0]
+
+    reordered = scipy.sparse.csr_array(matrix)[permutation][:, permutation].tocoo()
+
+    lower = reordered.row >= reordered.col
+    row, col = reordered.row[lower], reordered.col[lower]
+
+    if (row - col).max(initial=0) >= n_bands:
+        raise ValueError("'matrix' has elements outside of the bands")
+
+    bands = np.zeros((n_bands, n))
+    bands[row - col, col] = reordered.data[lower]
+
+    return _BandedMatrix(bands, permutation)
+
+
+def _banded_covariance_np(data, weights, n_bands):
+    """weighted empirical covariance matrix, restricted to the bands
+
+    Parameters
+    ----------
+    data : ndarray of shape (n_samples, n)
+        Data with the gridpoints already reordered.
+    weights : ndarray of shape (n_samples,)
+        Weights for the individual samples.
+    n_bands : int
+        Number of bands to compute.
+
+    Returns
+    -------
+    bands : ndarray of shape (n_bands, n)
+        The bands of the covariance matrix, in the same normalization as ``np.cov(data,
+        rowvar=False, aweights=weights)``.
+    """
+
+    __, n = data.shape
+
+    avg = np.average(data, axis=0, weights=weights)
+
+    v1 = weights.sum()
+    fact = v1 - (weights * weights).sum() / v1
+
+    data = data - avg
+    data_weighted = data * weights[:, np.newaxis]
+
+    bands = np.zeros((n_bands, n))
+
+    for start, stop, end, k, valid in _band_blocks(n_bands, n, _block_size(n_bands)):
+        block = data[:, start:end].T @ data_weighted[:, start:stop]
+
+        col = np.broadcast_to(_cols(start, stop), k.shape)
+        bands[k[valid], col[valid]] = block[valid]
+
+    bands /= fact
+
+    return bands
+
+
+def _is_banded(obj):
+    """whether ``obj`` is a DataArray of a banded matrix"""
+
+    return isinstance(obj, xr.DataArray) and "band" in obj.dims
+
+
+def _banded_from_dataarray(obj, name="covariance", triangular=False):
+    """convert a banded DataArray (see ``_banded_to_dataarray``) to a _BandedMatrix"""
+
+    if obj.ndim != 2 or "band_order" not in obj.coords:
+        raise ValueError(
+            f"Expected '{name}' to be a 2D banded matrix with a 'band_order' coordinate"
+        )
+
+    (dim,) = set(obj.dims) - {"band"}
+    obj = obj.transpose("band", dim)
+
+    permutation = np.argsort(obj.band_order.values)
+
+    return _BandedMatrix(obj.values[:, permutation], permutation, triangular)
+
+
+def _banded_to_dataarray(matrix, dim):
+    """convert a _BandedMatrix to a DataArray in the original order
+
+    The DataArray has the dimensions ("band", dim). ``bands[k, i]`` contains the
+    element of gridpoint ``i`` and the gridpoint ``k`` positions later in the banded
+    order, which is given by the "band_order" coordinate.
+    """
+
+    n_bands, n = matrix.bands.shape
+
+    bands = np.empty_like(matrix.bands)
+    bands[:, matrix.permutation] = matrix.bands
+
+    band_order = np.empty(n, dtype=int)
+    band_order[matrix.permutation] = np.arange(n)
+
+    return xr.DataArray(
+        bands, dims=("band", dim), coords={"band_order": (dim, band_order)}
+    )
@@ -3,45 +3,233 @@
 # Licensed under the GNU General Public License v3.0 or later see LICENSE or
 # https://www.gnu.org/licenses/
 
-from collections.abc import Iterable
+import collections
+import functools
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future
 
 import numpy as np
+import scipy.sparse
 import xarray as xr
 
+from mesmer._core.disk_cache import _cache_key, _cached_array, _disk_cache_enabled
+
 
 def gaspari_cohn_correlation_matrices(
-    geodist: xr.DataArray | np.ndarray, localisation_radii: Iterable[float]
-) -> dict[float, xr.DataArray | np.ndarray]:
+    geodist: xr.DataArray | np.ndarray | scipy.sparse.sparray,
+    localisation_radii: Iterable[float],
+) -> dict[float, xr.DataArray | np.ndarray | scipy.sparse.csr_array]:
     """Gaspari-Cohn correlation matrices for a range of localisation radii
 
     Parameters
     ----------
-    geodist : xr.DataArray, np.ndarray
-        2D array of great circle distances. Calculated from e.g. ``geodist_exact``.
+    geodist : xr.DataArray, np.ndarray, scipy.sparse array
+        2D array of great circle distances. Calculated from e.g. ``geodist_exact`` or,
+        as sparse array, from ``geodist_sparse``.
     localisation_radii : iterable of float
         Localisation radii to test (in km)
 
     Returns
     -------
     gaspari_cohn_correlation_matrices: dict[float : :obj:`xr.DataArray`, :obj:`np.ndarray`]
-        Gaspari-Cohn correlation matrix (values) for each localisation radius (keys)
+        Gaspari-Cohn correlation matrix (values) for each localisation radius (keys).
+        Sparse (``scipy.sparse.csr_array``) if ``geodist`` is sparse.
 
     Notes
     -----
     Values in ``localisation_radii`` should not exceed 10'000 km by much because
     it can lead to correlation matrices which are not positive semidefinite.
 
+    For a sparse ``geodist``, all pairs that are not stored are assumed to be further
+    apart than 2 x the localisation radius, i.e., ``geodist_sparse`` must be called with
+    ``max_distance >= 2 * max(localisation_radii)``.
+
+    For a dense ``geodist``, the matrices are loaded from the on-disk cache if the
+    ``disk_cache_dir`` option of :class:`mesmer.set_options` is set.
+
     See Also
     --------
-    gaspari_cohn, geodist_exact
+    gaspari_cohn, geodist_exact, geodist_sparse, GaspariCohnLocalizer
 
     """
 
+    if scipy.sparse.issparse(geodist):
+        return {lr: _gaspari_cohn_sparse(geodist, lr) for lr in localisation_radii}
+
+    if _disk_cache_enabled():
+        key = _cache_key(np.asarray(geodist))
+        return {lr: _gaspari_cohn_cached(geodist, lr, key) for lr in localisation_radii}
+
     out = {lr: gaspari_cohn(geodist / lr) for lr in localisation_radii}
 
     return out
 
 
+def _gaspari_cohn_cached(geodist, localisation_radius, geodist_key):
+    """``gaspari_cohn(geodist / localisation_radius)`` using the on-disk cache"""
+
+    values = np.asarray(geodist)
+
+    key = _cache_key(geodist=geodist_key, localisation_radius=localisation_radius)
+    out = _cached_array(
+        "gaspari_cohn", lambda: _gaspari_cohn_np(values / localisation_radius), key=key
+    )
+
+    if isinstance(geodist, xr.DataArray):
+        out = xr.DataArray(out, dims=geodist.dims, coords=geodist.coords)
+
+    return out
+
+
+class GaspariCohnLocalizer(Mapping):
+    """lazy Gaspari-Cohn correlation matrices for a range of localisation radii
+
+    Drop-in replacement for the dict returned by
+    :func:`gaspari_cohn_correlation_matrices`, which computes the correlation matrix
+    for a localisation radius only when it is accessed and keeps only the most recently
+    used matrices. This avoids holding one n_gridpoints x n_gridpoints matrix per
+    localisation radius in memory, most of which are never used by
+    :func:`find_localized_empirical_covariance` because it stops at the first local
+    minimum.
+
+    Parameters
+    ----------
+    geodist : xr.DataArray, np.ndarray, scipy.sparse array
+        2D array of great circle distances. Calculated from e.g. ``geodist_exact`` or,
+        as sparse array, from ``geodist_sparse``. Shared by all correlation matrices.
+    localisation_radii : iterable of float
+        Localisation radii to test (in km)
+    maxsize : int, default: 2
+        Maximum number of correlation matrices to keep in memory. The least recently
+        used matrix is discarded first. If the localizer is shared between concurrent
+        workers (e.g., the months in :func:`find_localized_empirical_covariance_monthly`
+        with the ``crossvalidation_workers`` option), ``maxsize`` should be at least
+        the number of workers, otherwise matrices are discarded while still in use and
+        computed again.
+
+    Notes
+    -----
+    The correlation matrices are equal to the values of
+    ``gaspari_cohn_correlation_matrices(geodist, localisation_radii)``, see there.
+
+    The localizer is thread-safe. A matrix requested by several threads at once is
+    computed only once.
+
+    See Also
+    --------
+    gaspari_cohn_correlation_matrices
+    """
+
+    def __init__(
+        self,
+        geodist: xr.DataArray | np.ndarray | scipy.sparse.sparray,
+        localisation_radii: Iterable[float],
+        *,
+        maxsize: int = 2,
+    ):
+
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"'maxsize' must be a positive integer, got {maxsize}")
+
+        self.geodist = geodist
+        self.maxsize = maxsize
+
+        self._localisation_radii = list(localisation_radii)
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+        # matrices currently computed by another thread
+        self._pending: dict[float, Future] = {}
+        # the localizer may be shared between threads
+        self._lock = threading.Lock()
+
+    @functools.cached_property
+    def _geodist_key(self):
+        return _cache_key(np.asarray(self.geodist))
+
+    @property
+    def sparse(self) -> bool:
+        """whether the correlation matrices are sparse"""
+        return scipy.sparse.issparse(self.geodist)
+
+    def __getitem__(self, localisation_radius):
+
+        if localisation_radius not in self:
+            raise KeyError(localisation_radius)
+
+        with self._lock:
+            out = self._cache.get(localisation_radius)
+            if out is not None:
+                self._cache.move_to_end(localisation_radius)
+                return out
+
+            future = self._pending.get(localisation_radius)
+            if future is None:
+                future = self._pending[localisation_radius] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+
+        # wait for the thread computing this matrix
+        if not is_owner:
+            return future.result()
+
+        try:
+            out = self._compute(localisation_radius)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[localisation_radius]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._cache[localisation_radius] = out
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            del self._pending[localisation_radius]
+
+        future.set_result(out)
+
+        return out
+
+    def _compute(self, localisation_radius):
+
+        if self.sparse:
+            return _gaspari_cohn_sparse(self.geodist, localisation_radius)
+
+        if _disk_cache_enabled():
+            return _gaspari_cohn_cached(
+                self.geodist, localisation_radius, self._geodist_key
+            )
+
+        return gaspari_cohn(self.geodist / localisation_radius)
+
+    def __contains__(self, localisation_radius):
+        # the default implementation of Mapping computes the matrix
+        return localisation_radius in self._localisation_radii
+
+    def __iter__(self):
+        return iter(self._localisation_radii)
+
+    def __len__(self):
+        return len(self._localisation_radii)
+
+    def __repr__(self):
+
+        radii = ", ".join(map(str, self._localisation_radii))
+        return f"<GaspariCohnLocalizer (maxsize={self.maxsize}) radii: {radii}>"
+
+
+def _gaspari_cohn_sparse(geodist, localisation_radius):
+
+    out = scipy.sparse.csr_array(geodist, copy=True)
+    out.data = _gaspari_cohn_np(out.data / localisation_radius)
+
+    # remove pairs further apart than 2 x localisation_radius
+    out.eliminate_zeros()
+
+    return out
+
+
 def gaspari_cohn(
     r: xr.DataArray | np.ndarray | int | float,
 ) -> xr.DataArray | np.ndarray:
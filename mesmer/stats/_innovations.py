@@ -0,0 +1,689 @@
+import collections
+import hashlib
+import threading
+import warnings
+from typing import NamedTuple
+
+import numpy as np
+import scipy.linalg
+import xarray as xr
+
+from mesmer._core.options import OPTIONS
+from mesmer._core.utils import (
+    LinAlgWarning,
+    _check_dataarray_form,
+    _set_threads_from_options,
+)
+from mesmer.stats._banded import (
+    _banded_from_dataarray,
+    _BandedMatrix,
+    _colorize_banded_inplace_np,
+    _is_banded,
+)
+
+
+def factorize_covariance(
+    covariance: xr.DataArray, *, explained_variance: float | None = None
+) -> xr.DataArray:
+    """factorize a covariance matrix to draw spatially-correlated innovations
+
+    Computes a factor ``F`` such that ``covariance = F @ F.T``. Passing the factor to
+    :func:`draw_auto_regression_correlated` or :func:`draw_auto_regression_monthly`
+    (as ``covariance_factor``) avoids factorizing the covariance matrix for every call,
+    e.g., for every scenario and seed.
+
+    Parameters
+    ----------
+    covariance : xr.DataArray
+        The covariance matrix. Must be symmetric and positive-semidefinite. Can be
+        2D (n_gridpoints x n_gridpoints) or 3D with the covariance matrices stacked
+        along the first dimension, e.g., one for each month. Can also be a banded
+        covariance matrix, see :func:`find_localized_empirical_covariance`.
+    explained_variance : float, default: None
+        If given, computes an approximate low-rank factor, which keeps the leading
+        eigenvectors (EOFs) that explain this fraction of the total variance (e.g.,
+        0.95) and a diagonal correction, such that the variance of each gridpoint is
+        exact. Only for 2D covariance matrices. See Notes.
+
+    Returns
+    -------
+    covariance_factor : xr.DataArray
+        The factor of the covariance matrix with the same dimensions and coordinates as
+        ``covariance``.
+
+    Notes
+    -----
+    Uses the Cholesky decomposition. If the covariance matrix is not positive definite,
+    the factor is computed from its eigendecomposition (``v * sqrt(w)``) and a
+    ``LinAlgWarning`` is raised. Banded covariance matrices must be positive definite
+    and the factor is again banded.
+
+    The low-rank factor has the dimensions (gridpoint, "eof") and the standard
+    deviations of the diagonal correction as "residual_std" coordinate. Drawing
+    innovations then costs O(n_gridpoints x n_eofs) instead of O(n_gridpoints**2) per
+    time step and requires ``sampler="direct"``. The attributes "explained_variance"
+    (the fraction actually explained by the EOFs) and "approximation_error" (the
+    relative error of the approximated covariance matrix in the Frobenius norm)
+    report the quality of the approximation.
+    """
+
+    _check_dataarray_form(covariance, "covariance")
+
+    if explained_variance is not None:
+        return _factorize_covariance_low_rank(covariance, explained_variance)
+
+    if _is_banded(covariance):
+        factor = _banded_from_dataarray(covariance).cholesky()
+
+        bands = np.empty_like(factor.bands)
+        bands[:, factor.permutation] = factor.bands
+
+        covariance = covariance.transpose("band", ...)
+        return covariance.copy(data=bands).rename("covariance_factor")
+
+    if covariance.ndim not in (2, 3) or covariance.shape[-1] != covariance.shape[-2]:
+        raise ValueError(
+            "'covariance' must be a square 2D array or a stack of square 2D arrays, "
+            f"got shape {covariance.shape}"
+        )
+
+    values = covariance.values
+
+    if covariance.ndim == 2:
+        factor = _factorize_covariance_np(values)
+    else:
+        factor = np.stack([_factorize_covariance_np(cov) for cov in values])
+
+    return covariance.copy(data=factor).rename("covariance_factor")
+
+
+def _factorize_covariance_low_rank(covariance, explained_variance):
+
+    if covariance.ndim != 2 or covariance.shape[0] != covariance.shape[1]:
+        raise ValueError(
+            "'explained_variance' requires a square 2D covariance matrix, got shape "
+            f"{covariance.shape}"
+        )
+
+    if not 0 < explained_variance <= 1:
+        raise ValueError(
+            f"'explained_variance' must be in the interval (0, 1], got "
+            f"{explained_variance}"
+        )
+
+    factor = _factorize_covariance_low_rank_np(covariance.values, explained_variance)
+
+    dim = covariance.dims[0]
+    coords = {
+        name: coord for name, coord in covariance.coords.items() if coord.dims == (dim,)
+    }
+
+    attrs = {
+        "explained_variance": factor.explained_variance,
+        "approximation_error": factor.approximation_error,
+    }
+
+    return xr.DataArray(
+        factor.eofs,
+        dims=(dim, "eof"),
+        coords=coords | {"residual_std": (dim, factor.residual_std)},
+        attrs=attrs,
+        name="covariance_factor",
+    )
+
+
+class _LowRankFactor(NamedTuple):
+    """approximate factor of a covariance matrix from its leading EOFs
+
+    The covariance matrix is approximated as ``eofs @ eofs.T +
+    np.diag(residual_std**2)``.
+    """
+
+    eofs: np.ndarray
+    residual_std: np.ndarray
+    explained_variance: float = 1.0
+    approximation_error: float = 0.0
+
+    @property
+    def shape(self):
+        n = self.eofs.shape[0]
+        return (n, n)
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def n_eofs(self):
+        return self.eofs.shape[1]
+
+    def astype(self, dtype):
+        return self._replace(
+            eofs=self.eofs.astype(dtype, copy=False),
+            residual_std=self.residual_std.astype(dtype, copy=False),
+        )
+
+    def covariance(self):
+        """the approximated covariance matrix"""
+
+        return self.eofs @ self.eofs.T + np.diag(self.residual_std**2)
+
+
+def _factorize_covariance_low_rank_np(covariance, explained_variance):
+    """approximate factor from the leading eigenvectors and a diagonal correction
+
+    Parameters
+    ----------
+    covariance : np.ndarray of shape (n, n)
+        The covariance matrix. Must be symmetric and positive-semidefinite.
+    explained_variance : float
+        Fraction of the total variance explained by the retained eigenvectors.
+
+    Returns
+    -------
+    factor : _LowRankFactor
+        The low-rank factor. The diagonal correction ensures the variances are exact.
+    """
+
+    w, v = np.linalg.eigh(covariance)
+
+    # descending order, negative eigenvalues are numerical noise
+    w, v = w[::-1], v[:, ::-1]
+    w_pos = np.clip(w, 0, None)
+
+    cumulative = np.cumsum(w_pos) / w_pos.sum()
+    n_eofs = min(int(np.searchsorted(cumulative, explained_variance)) + 1, w.size)
+
+    eofs = v[:, :n_eofs] * np.sqrt(w_pos[:n_eofs])
+
+    # the variance not explained by the eofs
+    residual_variance = np.diag(covariance) - (eofs**2).sum(axis=1)
+
+    # the error is the off-diagonal part of the residual matrix; its squared frobenius
+    # norm is the sum of the squared omitted eigenvalues minus the diagonal part
+    error = np.sum(w[n_eofs:] ** 2) - np.sum(residual_variance**2)
+    error = np.sqrt(max(error, 0) / np.sum(w**2))
+
+    return _LowRankFactor(
+        eofs,
+        np.sqrt(np.clip(residual_variance, 0, None)),
+        explained_variance=float(cumulative[n_eofs - 1]),
+        approximation_error=float(error),
+    )
+
+
+def _is_low_rank(obj):
+    """whether ``obj`` is a DataArray of a low-rank factor"""
+
+    return isinstance(obj, xr.DataArray) and "eof" in obj.dims
+
+
+def _low_rank_from_dataarray(obj):
+
+    (dim,) = set(obj.dims) - {"eof"}
+    obj = obj.transpose(dim, "eof")
+
+    return _LowRankFactor(obj.values, obj.residual_std.values)
+
+
+def _factorize_covariance_np(covariance):
+    """compute ``F`` such that ``covariance = F @ F.T``
+
+    Parameters
+    ----------
+    covariance : np.ndarray of shape (n, n)
+        The covariance matrix. Must be symmetric and positive-semidefinite.
+
+    Returns
+    -------
+    factor : np.ndarray of shape (n, n)
+        The lower-triangular Cholesky factor or, if ``covariance`` is not positive
+        definite, ``v * sqrt(w)`` of its eigendecomposition (with eigenvalues ``w`` and
+        eigenvectors ``v``).
+
+    Notes
+    -----
+    Uses the same factors as ``scipy.stats.Covariance.from_cholesky`` and
+    ``scipy.stats.Covariance.from_eigendecomposition``, such that the drawn innovations
+    are identical to ``scipy.stats.multivariate_normal.rvs``.
+    """
+
+    factor, is_cholesky = _factorize_covariance_np_impl(covariance)
+
+    if not is_cholesky:
+        _warn_not_positive_definite()
+
+    return factor
+
+
+def _factorize_covariance_np_impl(covariance):
+
+    covariance = np.atleast_2d(covariance)
+
+    try:
+        return np.linalg.cholesky(covariance), True
+    except np.linalg.LinAlgError as e:
+        if "Matrix is not positive definite" not in str(e):
+            raise
+
+    w, v = np.linalg.eigh(covariance)
+
+    # also for stacked covariance matrices
+    return v * np.sqrt(w)[..., np.newaxis, :], False
+
+
+def _warn_not_positive_definite():
+
+    msg = "Covariance matrix is not positive definite, using eigh instead of cholesky."
+    warnings.warn(msg, LinAlgWarning, stacklevel=3)
+
+
+class _CovarianceFactorCache:
+    """thread-safe LRU cache for covariance factors, keyed by the content hash
+
+    The total size of the cached factors is limited by the option
+    ``covariance_cache_size`` (in bytes), see :class:`mesmer.set_options`.
+    """
+
+    def __init__(self):
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(covariance):
+
+        covariance = np.ascontiguousarray(covariance)
+
+        h = hashlib.blake2b(digest_size=32)
+        h.update(str((covariance.dtype.str, covariance.shape)).encode())
+        h.update(covariance.view(np.uint8).data)
+
+        return h.digest()
+
+    def get(self, covariance, return_lower=False):
+        """get the factor of ``covariance``, computing it on a cache miss
+
+        If ``return_lower`` is True, also returns whether the factor is lower
+        triangular (i.e. a Cholesky factor).
+        """
+
+        max_nbytes = OPTIONS["covariance_cache_size"]
+
+        if max_nbytes == 0:
+            factor, is_cholesky = _factorize_covariance_np_impl(covariance)
+            if not is_cholesky:
+                _warn_not_positive_definite()
+            return (factor, is_cholesky) if return_lower else factor
+
+        key = self._key(covariance)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+
+        if entry is None:
+            entry = _factorize_covariance_np_impl(covariance)
+            # the cached factor is shared between calls
+            entry[0].flags.writeable = False
+            self._insert(key, entry, max_nbytes)
+
+        factor, is_cholesky = entry
+
+        # also warn for cached factors
+        if not is_cholesky:
+            _warn_not_positive_definite()
+
+        return (factor, is_cholesky) if return_lower else factor
+
+    def _insert(self, key, entry, max_nbytes):
+
+        nbytes = entry[0].nbytes
+
+        if nbytes > max_nbytes:
+            return
+
+        with self._lock:
+            if key in self._cache:
+                return
+
+            self._cache[key] = entry
+            self._nbytes += nbytes
+
+            while self._nbytes > max_nbytes:
+                _, (factor, _) = self._cache.popitem(last=False)
+                self._nbytes -= factor.nbytes
+
+    def clear(self):
+
+        with self._lock:
+            self._cache.clear()
+            self._nbytes = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+
+_COVARIANCE_FACTOR_CACHE = _CovarianceFactorCache()
+
+
+def _get_covariance_factor_np(covariance, return_lower=False):
+    """factorize ``covariance`` using the cache, see ``_factorize_covariance_np``
+
+    If ``return_lower`` is True, also returns whether the factor is lower triangular,
+    which can be passed on as ``lower`` to the functions multiplying with the factor.
+    """
+
+    # banded matrices are not cached
+    if isinstance(covariance, _BandedMatrix):
+        factor = covariance.cholesky()
+        # banded factors keep track themselves
+        return (factor, None) if return_lower else factor
+
+    return _COVARIANCE_FACTOR_CACHE.get(covariance, return_lower=return_lower)
+
+
+def _is_lower_triangular(factor):
+    """whether the dense 2D ``factor`` is lower triangular
+
+    Checks row by row to avoid a temporary of the size of ``factor``. Determine this
+    once per factor and pass it on as ``lower`` to ``_colorize_inplace_np``.
+    """
+
+    n = factor.shape[-1]
+
+    return not any(factor[i, i + 1 :].any() for i in range(n - 1))
+
+
+def _dense_factor_lower(factor, lower):
+    """determine ``lower`` for a dense 2D factor, if not known"""
+
+    is_dense = isinstance(factor, np.ndarray) and factor.ndim == 2
+
+    if lower is None and is_dense:
+        return _is_lower_triangular(factor)
+
+    return bool(lower) and is_dense
+
+
+def _as_factor(factor, dtype):
+    """convert ``factor`` (an array, a _BandedMatrix or a _LowRankFactor) to
+    ``dtype``"""
+
+    if isinstance(factor, (_BandedMatrix, _LowRankFactor)):
+        return factor.astype(dtype)
+
+    return np.asarray(factor, dtype=dtype)
+
+
+def _check_sampler_and_dtype(sampler, dtype):
+    """validate the ``sampler`` and ``dtype`` arguments of the draw functions"""
+
+    if sampler not in ("compat", "direct"):
+        raise ValueError(
+            f"'sampler' must be one of 'compat' or 'direct', got '{sampler}'"
+        )
+
+    dtype = np.dtype(dtype)
+
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"'dtype' must be float32 or float64, got '{dtype}'")
+
+    if sampler == "compat" and dtype != np.float64:
+        raise ValueError("sampler='compat' only supports dtype float64")
+
+    return dtype
+
+
+@_set_threads_from_options()
+def _draw_innovations_direct_np(factor, rng, out, lower=None):
+    """draw correlated innovations in-place into a preallocated buffer
+
+    Parameters
+    ----------
+    factor : np.ndarray of shape (n, n) or _BandedMatrix or _LowRankFactor
+        Factor of the covariance matrix, see ``_factorize_covariance_np``.
+    rng : np.random.Generator
+        The random number generator.
+    out : np.ndarray of shape (..., n)
+        C-contiguous float32 or float64 array. Overwritten with the innovations.
+    lower : bool, optional
+        Whether a dense factor is lower triangular, determined if not given.
+
+    Notes
+    -----
+    Draws standard normal numbers directly into ``out`` and multiplies them in-place
+    with the factor, using ``trmm`` for triangular (Cholesky) factors. This avoids the
+    temporaries of ``scipy.stats.multivariate_normal.rvs`` but yields (slightly)
+    different innovations than ``_draw_innovations_correlated_np`` for float64 and
+    different random numbers for float32. For a low-rank factor, the standard normal
+    numbers of the eofs are drawn after those of ``out``.
+    """
+
+    n = factor.shape[-1]
+
+    if out.shape[-1] != n or not out.flags.c_contiguous:
+        raise ValueError("'out' must be C-contiguous with the size of 'factor' last")
+
+    rng.standard_normal(out=out, dtype=out.dtype)
+    out_2d = out.reshape(-1, n)
+
+    normals = None
+    if isinstance(factor, _LowRankFactor):
+        normals = rng.standard_normal(
+            size=(out_2d.shape[0], factor.n_eofs), dtype=out.dtype
+        )
+
+    # rows per block, limits the size of the scratch buffer (and the BLAS dimension)
+    block_size = max(1, 2**20 // n)
+
+    _colorize_inplace_np(factor, out_2d, block_size, normals=normals, lower=lower)
+
+    return out
+
+
+def _colorize_inplace_np(factor, x, block_size, normals=None, lower=None):
+    """compute ``x @ factor.T`` in-place, in blocks of ``block_size`` rows
+
+    Parameters
+    ----------
+    factor : np.ndarray of shape (n, n) or (n,) or _BandedMatrix or _LowRankFactor
+        Factor of the covariance matrix or the standard deviations of independent
+        innovations.
+    x : np.ndarray of shape (m, n)
+        C-contiguous array of standard normal numbers, overwritten.
+    block_size : int
+        Number of rows multiplied at once. The result for one row depends (in the last
+        bits) on the size of its block, but not on its position.
+    normals : np.ndarray of shape (m, n_eofs), optional
+        Additional standard normal numbers for the eofs of a low-rank factor, i.e.,
+        computes ``x * factor.residual_std + normals @ factor.eofs.T``.
+    lower : bool, optional
+        Whether a dense factor is lower triangular (then uses ``trmm``). Determined
+        from ``factor`` if not given, which requires a pass over the factor.
+    """
+
+    n = x.shape[-1]
+    factor = _as_factor(factor, x.dtype)
+    lower = _dense_factor_lower(factor, lower)
+
+    if isinstance(factor, _LowRankFactor):
+        x *= factor.residual_std
+
+        for start in range(0, x.shape[0], block_size):
+            block = x[start : start + block_size]
+            block += normals[start : start + block_size] @ factor.eofs.T
+
+    elif isinstance(factor, _BandedMatrix):
+        _colorize_banded_inplace_np(factor, x, block_size)
+
+    elif factor.ndim == 1:
+        # standard deviations of independent innovations
+        x *= factor
+
+    elif lower:
+        (trmm,) = scipy.linalg.get_blas_funcs(("trmm",), (factor, x))
+
+        for start in range(0, x.shape[0], block_size):
+            block = x[start : start + block_size]
+            # block.T is F-contiguous: computes ``factor @ block.T`` in-place
+            trmm(1.0, factor, block.T, lower=1, overwrite_b=1)
+
+    else:
+        scratch = np.empty((min(block_size, x.shape[0]), n), dtype=x.dtype)
+
+        for start in range(0, x.shape[0], block_size):
+            block = x[start : start + block_size]
+            tmp = scratch[: block.shape[0]]
+            np.matmul(block, factor.T, out=tmp)
+            block[:] = tmp
+
+
+class _TiledInnovations:
+    """draw correlated innovations for several realisations in tiles of fixed length
+
+    Every tile of every realisation uses its own random number generator, initialized
+    from ``np.random.SeedSequence(seed, spawn_key=(*key, tile))``. The standard normal
+    numbers are multiplied with the factor tile by tile. Therefore, the innovations of
+    a realisation depend neither on the other realisations nor on the number of time
+    steps requested per call to ``fill``, i.e., they can be drawn in arbitrary chunks,
+    in any order and in separate processes.
+
+    Parameters
+    ----------
+    factor : np.ndarray of shape (n, n) or (n,) or _BandedMatrix or _LowRankFactor
+        Factor of the covariance matrix or the standard deviations of independent
+        innovations.
+    seed : int
+        Seed used to initialize the pseudo-random number generators.
+    keys : list of tuple of int
+        Key of the random number streams for each realisation, e.g., ``(realisation,)``.
+    dtype : np.dtype
+        Data type of the innovations.
+    tile_size : int, default: 128
+        Number of time steps per tile.
+    start : int, default: 0
+        Position in the streams (in time steps) of the first innovation to draw, allows
+        to continue previous draws.
+    lower : bool, optional
+        Whether a dense factor is lower triangular, determined once if not given.
+    """
+
+    def __init__(self, factor, seed, keys, dtype, tile_size=128, start=0, lower=None):
+
+        self.factor = _as_factor(factor, dtype)
+        self.lower = _dense_factor_lower(self.factor, lower)
+        self.seed = seed
+        self.keys = [tuple(key) for key in keys]
+        self.dtype = dtype
+        self.tile_size = tile_size
+
+        n = self.factor.shape[-1]
+
+        # innovations drawn in the last tile but not used yet
+        self._carry = np.empty((len(self.keys), 0, n), dtype=dtype)
+
+        # index of the next tile to draw, skip to the start position
+        self._tile, offset = divmod(start, tile_size)
+        if offset:
+            self.fill(np.empty((len(self.keys), offset, n), dtype=dtype))
+
+    def _rng(self, key, tile):
+
+        return _stream_rng(self.seed, (*key, tile))
+
+    @_set_threads_from_options()
+    def fill(self, out):
+        """fill ``out`` of shape (n_realisations, n_ts, n) with the next innovations"""
+
+        n_realisations, n_ts, n = out.shape
+        n_carry = min(self._carry.shape[1], n_ts)
+
+        out[:, :n_carry] = self._carry[:, :n_carry]
+        self._carry = self._carry[:, n_carry:]
+
+        n_new = n_ts - n_carry
+        if n_new == 0:
+            return out
+
+        n_tiles = -(-n_new // self.tile_size)
+
+        # the tiles are drawn directly into ``out`` - only a tile that does not fit
+        # (i.e. the last one) is drawn into a scratch buffer, its remainder is carried
+        scratch = np.empty((self.tile_size, n), self.dtype)
+        n_remainder = n_tiles * self.tile_size - n_new
+        carry = np.empty((n_realisations, n_remainder, n), self.dtype)
+
+        for i, key in enumerate(self.keys):
+            for j in range(n_tiles):
+                t0 = n_carry + j * self.tile_size
+                tile = out[i, t0 : t0 + self.tile_size]
+
+                if tile.shape[0] < self.tile_size or not tile.flags.c_contiguous:
+                    self._draw_tile(key, self._tile + j, scratch)
+
+                    n_used = min(self.tile_size, n_ts - t0)
+                    tile[:] = scratch[:n_used]
+                    if n_used < self.tile_size:
+                        carry[i] = scratch[n_used:]
+                else:
+                    self._draw_tile(key, self._tile + j, tile)
+
+        self._tile += n_tiles
+        self._carry = carry
+
+        return out
+
+    def _draw_tile(self, key, tile, out):
+        """draw the innovations of one tile of one realisation into ``out`` in-place"""
+
+        rng = self._rng(key, tile)
+        rng.standard_normal(out=out, dtype=self.dtype)
+
+        normals = None
+        if isinstance(self.factor, _LowRankFactor):
+            normals = rng.standard_normal(
+                size=(self.tile_size, self.factor.n_eofs), dtype=self.dtype
+            )
+
+        # the block is exactly one tile
+        _colorize_inplace_np(
+            self.factor, out, self.tile_size, normals=normals, lower=self.lower
+        )
+
+
+def _stream_rng(seed, key):
+    """random number generator of the stream ``key``, derived from ``seed``"""
+
+    seed_seq = np.random.SeedSequence(seed, spawn_key=key)
+    return np.random.default_rng(seed_seq)
+
+
+def _realisation_stream_keys(realisation, n_realisations):
+    """get the integer labels of the realisations used as keys for the rng streams"""
+
+    if isinstance(realisation, int):
+        return np.arange(n_realisations)
+
+    keys = np.asarray(realisation)
+
+    if not np.issubdtype(keys.dtype, np.integer) or (keys < 0).any():
+        raise ValueError(
+            "The coordinates of 'realisation' must be non-negative integers to be used"
+            " as keys of the random number streams"
+        )
+
+    return keys
+
+
+def _check_rng_streams(rng_streams, sampler):
+
+    if rng_streams not in ("sequential", "realisation"):
+        raise ValueError(
+            "'rng_streams' must be one of 'sequential' or 'realisation', got "
+            f"'{rng_streams}'"
+        )
+
+    if rng_streams == "realisation" and sampler != "direct":
+        raise ValueError("rng_streams='realisation' requires sampler='direct'")
@@ -1,9 +1,13 @@
+from typing import Literal
+
 import numpy as np
+import scipy.linalg
 import xarray as xr
 
 from mesmer._core.utils import (
     _check_dataarray_form,
     _check_dataset_form,
+    _set_threads_from_options,
     _to_set,
 )
 from mesmer.datatree import _datatree_wrapper
@@ -36,6 +40,8 @@ class LinearRegression:
         dim: str,
         weights: xr.DataArray | None = None,
         fit_intercept: bool = True,
+        *,
+        method: Literal["numpy", "sklearn"] = "numpy",
     ):
         """
         Fit a linear model
@@ -55,6 +61,14 @@ class LinearRegression:
             Whether to calculate the intercept for this model. If set to False, no
             intercept will be used in calculations (i.e. data is expected to be
             centered).
+        method : {"numpy", "sklearn"}, default: "numpy"
+            Method used to estimate the parameters.
+
+            - "numpy": forms the weighted normal equations of the predictors once and
+              solves them for all targets at once. The target only enters in one matrix
+              product and is not copied.
+            - "sklearn": fits ``sklearn.linear_model.LinearRegression``. Copies and
+              rescales the target, mostly kept as reference.
         """
 
         params = _fit_linear_regression_xr(
@@ -63,6 +77,7 @@ class LinearRegression:
             dim=dim,
             weights=weights,
             fit_intercept=fit_intercept,
+            method=method,
         )
 
         self._params = params
@@ -278,6 +293,7 @@ def _fit_linear_regression_xr(
     dim: str,
     weights: xr.DataArray | None = None,
     fit_intercept: bool = True,
+    method: Literal["numpy", "sklearn"] = "numpy",
 ) -> xr.Dataset:
     """
     Perform a linear regression
@@ -296,6 +312,8 @@ def _fit_linear_regression_xr(
     fit_intercept : bool, default=True
         Whether to calculate the intercept for this model. If set to False, no intercept
         will be used in calculations (i.e. data is expected to be centered).
+    method : {"numpy", "sklearn"}, default: "numpy"
+        Method used to estimate the parameters. See :meth:`LinearRegression.fit`.
 
     Returns
     -------
@@ -348,7 +366,16 @@ def _fit_linear_regression_xr(
 
     (target_dim,) = list(set(target.dims) - {dim})
 
-    out = _fit_linear_regression_np(
+    if method == "numpy":
+        fit_linear_regression_np = _fit_linear_regression_batched_np
+    elif method == "sklearn":
+        fit_linear_regression_np = _fit_linear_regression_np
+    else:
+        raise ValueError(
+            f"'method' must be one of 'numpy' or 'sklearn', got '{method}'"
+        )
+
+    out = fit_linear_regression_np(
         predictors_concat.transpose(dim, "predictor"),
         target.transpose(dim, target_dim),
         weights,
@@ -371,6 +398,141 @@ def _fit_linear_regression_xr(
     return out.squeeze()
 
 
+@_set_threads_from_options()
+def _fit_linear_regression_batched_np(
+    predictors, target, weights=None, fit_intercept=True
+):
+    """
+    Perform a linear regression for all targets at once - numpy wrapper
+
+    Parameters
+    ----------
+    predictors : array-like of shape (n_samples, n_predictors)
+        Array of predictors
+    target : array-like of shape (n_samples, n_targets)
+        Array of targets where each row is a sample and each column is a
+        different target i.e. variable to be predicted
+    weights : array-like of shape (n_samples,)
+        Weights for each sample
+    fit_intercept : bool, default=True
+        Whether to calculate the intercept for this model. If set to False, no intercept
+        will be used in calculations (i.e. data is expected to be centered).
+
+    Returns
+    -------
+    :obj:`np.ndarray` of shape (n_targets, n_predictors + 1)
+        Array of intercepts and coefficients, see :func:`_fit_linear_regression_np`.
+
+    Notes
+    -----
+    Yields the same estimates as :func:`_fit_linear_regression_np` (i.e. as
+    ``sklearn.linear_model.LinearRegression``). As the predictors are shared by all
+    targets, only the (weighted) predictors are centered and decomposed once, using a
+    singular value decomposition with the same cutoff as sklearn. This yields the
+    minimum norm least squares solution, also for (nearly) collinear predictors. The
+    target enters in a single matrix product, which yields its weighted mean and its
+    projection onto the left singular vectors. It is not rescaled and the product is
+    accumulated in float64 - a float32 target is converted in blocks of columns.
+    The estimates are always returned as float64.
+    """
+
+    predictors = np.asarray(predictors, dtype=float)
+    target = np.asarray(target)
+
+    n_samples = target.shape[0]
+
+    if predictors.ndim != 2:
+        raise ValueError(f"Expected 2D predictors, got {predictors.ndim}D")
+
+    if predictors.shape[0] != n_samples:
+        raise ValueError(
+            "predictors and target have inconsistent numbers of samples: "
+            f"{predictors.shape[0]} vs. {n_samples}"
+        )
+
+    if weights is None:
+        weights = np.ones(n_samples)
+    else:
+        weights = np.asarray(weights, dtype=float)
+
+        if weights.shape != (n_samples,):
+            raise ValueError(
+                f"weights have shape {weights.shape}, expected {(n_samples,)}"
+            )
+
+    if not (np.isfinite(predictors).all() and np.isfinite(weights).all()):
+        raise ValueError("predictors and weights must not contain NaN or infinity")
+
+    weights_sum = weights.sum()
+
+    if fit_intercept:
+        predictors_mean = weights @ predictors / weights_sum
+        predictors = predictors - predictors_mean
+
+    sqrt_weights = np.sqrt(weights)
+
+    # minimum norm solution of the (weighted) least squares problem, with the same
+    # cutoff for small singular values as sklearn (i.e. ``scipy.linalg.lstsq``)
+    u, s, vt = scipy.linalg.svd(
+        predictors * sqrt_weights[:, np.newaxis],
+        full_matrices=False,
+        check_finite=False,
+    )
+    rcond = np.finfo(float).eps * max(predictors.shape)
+    s_pinv = np.zeros_like(s)
+    above_cutoff = s > rcond * s.max(initial=0)
+    s_pinv[above_cutoff] = 1 / s[above_cutoff]
+
+    # projection of the (weighted) target onto the left singular vectors
+    projection = u.T * sqrt_weights
+
+    if fit_intercept:
+        # the weighted mean of the target is obtained in the same matrix product
+        projection = np.vstack([weights / weights_sum, projection])
+
+    target_2d = target.reshape(n_samples, -1)
+    projected = _matmul_float64(projection, target_2d)
+
+    if not np.isfinite(projected).all():
+        raise ValueError("target must not contain NaN or infinity")
+
+    if fit_intercept:
+        target_mean, projected = projected[0], projected[1:]
+
+        # center the target - this vanishes in exact arithmetic but avoids that
+        # rounding errors scaled by the mean are amplified by small singular values
+        projected = projected - np.outer(projection[1:].sum(axis=1), target_mean)
+
+    coefficients = vt.T @ (s_pinv[:, np.newaxis] * projected)
+
+    if fit_intercept:
+        intercepts = target_mean - predictors_mean @ coefficients
+    else:
+        intercepts = np.zeros(coefficients.shape[1])
+
+    return np.column_stack([intercepts, coefficients.T])
+
+
+def _matmul_float64(matrix, target, block_size=4096):
+    """accumulate ``matrix @ target`` in float64
+
+    Targets of another dtype (e.g. float32) are converted block by block, such that
+    no float64 copy of the full target is required.
+    """
+
+    if target.dtype == np.float64:
+        return matrix @ target
+
+    n_targets = target.shape[1]
+    out = np.empty((matrix.shape[0], n_targets))
+
+    for start in range(0, n_targets, block_size):
+        block = slice(start, start + block_size)
+        np.matmul(matrix, target[:, block].astype(float), out=out[:, block])
+
+    return out
+
+
 def _fit_linear_regression_np(predictors, target, weights=None, fit_intercept=True):
     """
     Perform a linear regression - numpy wrapper
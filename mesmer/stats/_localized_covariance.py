@@ -1,16 +1,35 @@
+import functools
+import threading
 import warnings
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Literal
 
 import numpy as np
 import scipy
+import scipy.sparse
 import xarray as xr
 
+from mesmer._core.options import OPTIONS, set_options
 from mesmer._core.utils import (
     LinAlgWarning,
+    _BracketingSearch,
     _check_dataarray_form,
     _create_equal_dim_names,
+    _divide_threads_between_workers,
     _minimize_local_discrete,
     _set_threads_from_options,
 )
+from mesmer.stats._banded import (
+    _band_permutation,
+    _banded_covariance_np,
+    _banded_to_dataarray,
+    _BandedMatrix,
+    _is_banded,
+    _sparse_to_banded,
+)
+from mesmer.stats._gaspari_cohn import GaspariCohnLocalizer
 
 
 def adjust_covariance_ar1(
@@ -22,7 +41,8 @@ def adjust_covariance_ar1(
     Parameters
     ----------
     covariance : 2D xr.DataArray
-        Empirical covariance matrix.
+        Empirical covariance matrix. Can also be a banded covariance matrix, as
+        returned by :func:`find_localized_empirical_covariance` for sparse localizers.
     ar_coefs : 1D xr.DataArray
         The coefficients of the autoregressive process of order 1.
         Must have length equal to the size of `covariance`.
@@ -62,19 +82,55 @@ def adjust_covariance_ar1(
        & Sons, Hoboken, New Jersey, USA, 2011.
     """
 
+    if _is_banded(covariance):
+        return _adjust_ecov_ar1_banded(covariance, ar_coefs.data)
+
     # pass ar_coefs.data - so it will 'just work'
     return _adjust_ecov_ar1_np(covariance, ar_coefs.data)
 
 
-def _adjust_ecov_ar1_np(covariance, ar_coefs):
+def _reduction_factor_ar1(ar_coefs, size):
 
     ar_coefs = ar_coefs.squeeze()  # allow n x 1 ar_coeffs
-    if ar_coefs.ndim != 1 or ar_coefs.size != covariance.shape[0]:
+    if ar_coefs.ndim != 1 or ar_coefs.size != size:
         raise ValueError(
             "`ar_coefs` must be 1D and have length equal to the size of `covariance`"
         )
 
-    reduction_factor = np.sqrt(1 - ar_coefs**2)
+    return np.sqrt(1 - ar_coefs**2)
+
+
+def _adjust_ecov_ar1_banded(covariance, ar_coefs):
+    """adjust a banded covariance DataArray (see ``_banded_to_dataarray``)"""
+
+    if covariance.ndim != 2 or "band_order" not in covariance.coords:
+        raise ValueError(
+            "Expected 'covariance' to be a 2D banded matrix with a 'band_order' "
+            "coordinate"
+        )
+
+    (dim,) = set(covariance.dims) - {"band"}
+    n_bands, size = covariance.sizes["band"], covariance.sizes[dim]
+
+    reduction_factor = _reduction_factor_ar1(ar_coefs, size)
+
+    # band k of gridpoint i holds the element of the gridpoint k positions later in the
+    # banded order - positions beyond the last gridpoint are padding
+    band_order = covariance.band_order.values
+    permutation = np.argsort(band_order)
+
+    position = band_order + np.arange(n_bands)[:, np.newaxis]
+    valid = position < size
+    other = permutation[np.where(valid, position, 0)]
+
+    factor = np.where(valid, reduction_factor * reduction_factor[other], 0.0)
+
+    return covariance * xr.DataArray(factor, dims=("band", dim))
+
+
+def _adjust_ecov_ar1_np(covariance, ar_coefs):
+
+    reduction_factor = _reduction_factor_ar1(ar_coefs, covariance.shape[0])
     reduction_factor = np.atleast_2d(reduction_factor)  # so it can be transposed
 
     # equivalent to ``diag(reduction_factor) @ covariance @ diag(reduction_factor)``
@@ -84,11 +140,12 @@ def _adjust_ecov_ar1_np(covariance, ar_coefs):
 def find_localized_empirical_covariance(
     data: xr.DataArray,
     weights: xr.DataArray,
-    localizer: dict[float | int, xr.DataArray | np.ndarray],
+    localizer: Mapping[float | int, xr.DataArray | np.ndarray],
     dim: str,
     *,
     k_folds: int,
     equal_dim_suffixes: tuple[str, str] = ("_i", "_j"),
+    radius_search: Literal["linear", "bracketing"] = "linear",
 ) -> xr.Dataset:
     """determine localized empirical covariance by cross validation
 
@@ -101,7 +158,12 @@ def find_localized_empirical_covariance(
     localizer : dict of xr.DataArray
         Dictionary containing the localization radii as keys and the localization matrix
         as values. The localization must be 2D and of shape n_gridpoints x n_gridpoints.
-        Currently only the Gaspari-Cohn localizer is implemented in MESMER.
+        Currently only the Gaspari-Cohn localizer is implemented in MESMER. Can also be
+        sparse (``scipy.sparse`` arrays, see :func:`geodist_sparse
+        <mesmer.geospatial.geodist_sparse>`), in which case the covariance matrices are
+        computed and returned in banded form (see Notes). Pass a
+        :class:`GaspariCohnLocalizer <mesmer.stats.GaspariCohnLocalizer>` to compute
+        the localization matrices only for the evaluated radii.
     dim : str
         Dimension along which to calculate the covariance.
     k_folds : int
@@ -109,6 +171,18 @@ def find_localized_empirical_covariance(
     equal_dim_suffixes : tuple of str, default: ("_i", "_j")
         Suffixes to add to the the name of ``dim`` for the covariance array
         (xr.DataArray cannot have two dimensions with the same name).
+    radius_search : "linear" | "bracketing", default: "linear"
+        How to search the localization radius with the smallest cross-validated
+        negative log likelihood:
+
+        - "linear": evaluates the radii in ascending order until the likelihood
+          increases.
+        - "bracketing": golden-section search over the sorted radii, which requires
+          fewer evaluations for long lists of radii. Assumes that the negative log
+          likelihood has a single minimum over the radii and falls back to the linear
+          search otherwise. The number of evaluated radii and the number of evaluations
+          saved compared to "linear" are stored in the ``n_evaluations`` and
+          ``n_evaluations_saved`` attributes of ``localization_radius``.
 
     Returns
     -------
@@ -124,9 +198,47 @@ def find_localized_empirical_covariance(
     Notes
     -----
     Runs a k-fold cross validation if ``k_folds`` is smaller than the number of samples
-    and a leave-one-out cross validation otherwise.
+    and a leave-one-out cross validation otherwise. The folds are evaluated
+    concurrently if the ``crossvalidation_workers`` option of :class:`mesmer.set_options`
+    is larger than 1 (for dense localizers only). The selected localization radius does
+    not depend on the number of workers.
+
+    For sparse localizers, the gridpoints are reordered (reverse Cuthill-McKee) such
+    that all non-zero elements of the localizers lie within a band around the diagonal.
+    Only these bands are computed and stored, which requires much less memory than the
+    full n_gridpoints x n_gridpoints matrices for small localization radii. The
+    covariance matrices then have the dimensions ("band", gridpoint) and a "band_order"
+    coordinate, and are restricted to the elements within the band (i.e., the
+    empirical ``covariance`` is not complete). The localized covariance can be passed
+    to :func:`draw_auto_regression_correlated
+    <mesmer.stats.draw_auto_regression_correlated>`.
     """
 
+    return _find_localized_empirical_covariance(
+        data,
+        weights,
+        localizer,
+        dim,
+        k_folds=k_folds,
+        equal_dim_suffixes=equal_dim_suffixes,
+        radius_search=radius_search,
+    )
+
+
+def _find_localized_empirical_covariance(
+    data,
+    weights,
+    localizer,
+    dim,
+    *,
+    k_folds,
+    equal_dim_suffixes=("_i", "_j"),
+    radius_search="linear",
+    release_gil=False,
+):
+    """see ``find_localized_empirical_covariance`` - ``release_gil`` is passed to
+    ``_find_localized_empirical_covariance_np``"""
+
     _check_dataarray_form(data, name="data", ndim=2)
 
     (sample_dim,) = data[dim].dims
@@ -144,21 +256,57 @@ def find_localized_empirical_covariance(
     if data[dim].size != weights.size:
         raise ValueError("weights and data have incompatible shape")
 
-    out = xr.apply_ufunc(
-        _find_localized_empirical_covariance_np,
-        data,
-        weights,
-        kwargs={"localizer": localizer, "k_folds": k_folds},
-        input_core_dims=[all_dims, [sample_dim]],
-        output_core_dims=([], out_dims, out_dims),
-    )
-    localization_radius, covariance, localized_covariance = out
+    if radius_search == "linear":
+        minimize = _minimize_local_discrete
+    elif radius_search == "bracketing":
+        minimize = _BracketingSearch()
+    else:
+        raise ValueError(
+            f"'radius_search' must be 'linear' or 'bracketing', got {radius_search!r}"
+        )
 
-    data_vars = {
-        "localization_radius": localization_radius,
-        "covariance": covariance,
-        "localized_covariance": localized_covariance,
-    }
+    if _is_sparse_localizer(localizer):
+        localization_radius, covariance, localized_covariance = (
+            _find_localized_empirical_covariance_banded_np(
+                data.values, weights.values, localizer, k_folds, minimize=minimize
+            )
+        )
+
+        data_vars = {
+            "localization_radius": xr.DataArray(localization_radius),
+            "covariance": _banded_to_dataarray(covariance, other_dim),
+            "localized_covariance": _banded_to_dataarray(
+                localized_covariance, other_dim
+            ),
+        }
+
+    else:
+        out = xr.apply_ufunc(
+            _find_localized_empirical_covariance_np,
+            data,
+            weights,
+            kwargs={
+                "localizer": localizer,
+                "k_folds": k_folds,
+                "minimize": minimize,
+                "release_gil": release_gil,
+            },
+            input_core_dims=[all_dims, [sample_dim]],
+            output_core_dims=([], out_dims, out_dims),
+        )
+        localization_radius, covariance, localized_covariance = out
+
+        data_vars = {
+            "localization_radius": localization_radius,
+            "covariance": covariance,
+            "localized_covariance": localized_covariance,
+        }
+
+    if radius_search == "bracketing":
+        data_vars["localization_radius"].attrs.update(
+            n_evaluations=minimize.n_evaluations,
+            n_evaluations_saved=minimize.n_evaluations_saved,
+        )
 
     return xr.Dataset(data_vars)
 
@@ -166,11 +314,12 @@ def find_localized_empirical_covariance(
 def find_localized_empirical_covariance_monthly(
     data: xr.DataArray,
     weights: xr.DataArray,
-    localizer: dict[float | int, xr.DataArray | np.ndarray],
+    localizer: Mapping[float | int, xr.DataArray | np.ndarray],
     dim: str,
     *,
     k_folds: int,
     equal_dim_suffixes: tuple[str, str] = ("_i", "_j"),
+    radius_search: Literal["linear", "bracketing"] = "linear",
 ) -> xr.Dataset:
     """determine localized empirical covariance by cross validation for each month.
 
@@ -188,7 +337,9 @@ def find_localized_empirical_covariance_monthly(
     localizer : dict of DataArray
         Dictionary containing the localization radii as keys and the localization matrix
         as values. The localization must be 2D and of shape n_gridpoints x n_gridpoints.
-        Currently only the Gaspari-Cohn localizer is implemented in MESMER.
+        Currently only the Gaspari-Cohn localizer is implemented in MESMER. Can also be
+        a :class:`GaspariCohnLocalizer <mesmer.stats.GaspariCohnLocalizer>`, which is
+        shared between the months.
     dim : str
         Dimension along which to calculate the covariance.
     k_folds : int
@@ -196,6 +347,18 @@ def find_localized_empirical_covariance_monthly(
     equal_dim_suffixes : tuple of str, default: ("_i", "_j")
         Suffixes to add to the the name of ``dim`` for the covariance array
         (xr.DataArray cannot have two dimensions with the same name).
+    radius_search : "linear" | "bracketing", default: "linear"
+        How to search the localization radius with the smallest cross-validated
+        negative log likelihood:
+
+        - "linear": evaluates the radii in ascending order until the likelihood
+          increases.
+        - "bracketing": golden-section search over the sorted radii, which requires
+          fewer evaluations for long lists of radii. Assumes that the negative log
+          likelihood has a single minimum over the radii and falls back to the linear
+          search otherwise. The number of evaluated radii and the number of evaluations
+          saved compared to "linear" are stored in the ``n_evaluations`` and
+          ``n_evaluations_saved`` attributes of ``localization_radius``.
 
     Returns
     -------
@@ -212,28 +375,69 @@ def find_localized_empirical_covariance_monthly(
     -----
     Runs a k-fold cross validation if ``k_folds`` is smaller than the number of samples
     and a leave-one-out cross validation otherwise.
+
+    If the ``crossvalidation_workers`` option of :class:`mesmer.set_options` is larger
+    than 1, the months are calibrated concurrently in a pool of threads, which share
+    the localizer (the folds of each month are then evaluated sequentially). The memory
+    budget for the covariance matrices of the folds (``crossvalidation_cache_size``) is
+    divided between the workers. The ``maxsize`` of a :class:`GaspariCohnLocalizer
+    <mesmer.stats.GaspariCohnLocalizer>` should be at least the number of workers.
     """
-    localized_ecov = []
     (sample_dim,) = data[dim].dims
     data_grouped = data.groupby(f"{dim}.month")
     weights_grouped = weights.groupby(f"{dim}.month")
 
-    for mon in range(1, 13):
-        res = find_localized_empirical_covariance(
-            data_grouped[mon],
-            weights_grouped[mon],
+    # select the months upfront - groupby objects are not thread-safe
+    monthly = [(data_grouped[mon], weights_grouped[mon]) for mon in range(1, 13)]
+
+    workers = OPTIONS["crossvalidation_workers"]
+    cache_size = OPTIONS["crossvalidation_cache_size"] // workers
+
+    def _find_month(data_weights, release_gil=False):
+        return _find_localized_empirical_covariance(
+            *data_weights,
             localizer,
             dim=dim,
             k_folds=k_folds,
             equal_dim_suffixes=equal_dim_suffixes,
+            radius_search=radius_search,
+            release_gil=release_gil,
         )
-        localized_ecov.append(res)
+
+    with (
+        set_options(crossvalidation_cache_size=cache_size),
+        _crossvalidation_executor() as executor,
+    ):
+        if executor is None:
+            localized_ecov = [_find_month(data_weights) for data_weights in monthly]
+        else:
+            localized_ecov = list(
+                executor.map(functools.partial(_find_month, release_gil=True), monthly)
+            )
 
     month = xr.DataArray(range(1, 13), dims="month")
-    return xr.concat(localized_ecov, dim=month)
+    out = xr.concat(localized_ecov, dim=month, combine_attrs="drop")
+
+    if radius_search == "bracketing":
+        # total over all months
+        out.localization_radius.attrs.update(
+            {
+                attr: sum(res.localization_radius.attrs[attr] for res in localized_ecov)
+                for attr in ("n_evaluations", "n_evaluations_saved")
+            }
+        )
+
+    return out
 
 
-def _find_localized_empirical_covariance_np(data, weights, localizer, k_folds):
+def _find_localized_empirical_covariance_np(
+    data,
+    weights,
+    localizer,
+    k_folds,
+    minimize=_minimize_local_discrete,
+    release_gil=False,
+):
     """determine localized empirical covariance by cross validation
 
     Parameters
@@ -249,6 +453,13 @@ def _find_localized_empirical_covariance_np(data, weights, localizer, k_folds):
         MESMER.
     k_folds : int
         Number of folds to use for cross validation.
+    minimize : callable, default: _minimize_local_discrete
+        Function to find the localization radius with the minimum negative log
+        likelihood, e.g., a ``_BracketingSearch`` instance.
+    release_gil : bool, default: False
+        Whether to use a Cholesky decomposition that releases the GIL, see
+        ``_get_neg_loglikelihood``. Always used if the folds are evaluated
+        concurrently.
 
     Returns
     -------
@@ -272,28 +483,130 @@ def _find_localized_empirical_covariance_np(data, weights, localizer, k_folds):
     # start again. Better to stop once min is reached (to limit computational effort
     # and singular matrices).
 
-    localization_radius = _minimize_local_discrete(
-        _ecov_crossvalidation,
+    fold_covariances = _FoldCovariances.from_options(data, weights, k_folds)
+
+    with _crossvalidation_executor() as executor:
+        localization_radius = minimize(
+            _ecov_crossvalidation,
+            localization_radii,
+            data=data,
+            weights=weights,
+            localizer=localizer,
+            k_folds=k_folds,
+            fold_covariances=fold_covariances,
+            executor=executor,
+            release_gil=release_gil or executor is not None,
+        )
+
+    covariance = np.cov(data, rowvar=False, aweights=weights)
+    localized_covariance = localizer[localization_radius] * covariance
+
+    return localization_radius, covariance, localized_covariance
+
+
+def _find_localized_empirical_covariance_banded_np(
+    data, weights, localizer, k_folds, minimize=_minimize_local_discrete
+):
+    """determine localized empirical covariance by cross validation for sparse
+    localizers
+
+    Parameters
+    ----------
+    data : 2D array
+        Data array with shape n_samples x n_gridpoints.
+    weights : 1D array
+        Weights for the individual samples.
+    localizer : dict of scipy.sparse arrays
+        Dictionary containing the localization radii as keys and the sparse localization
+        matrix as values.
+    k_folds : int
+        Number of folds to use for cross validation.
+    minimize : callable, default: _minimize_local_discrete
+        Function to find the localization radius with the minimum negative log
+        likelihood, e.g., a ``_BracketingSearch`` instance.
+
+    Returns
+    -------
+    localization_radius : float
+        Selected localization radius.
+    covariance : _BandedMatrix
+        Empirical covariance matrix, restricted to the bands.
+    localized_covariance : _BandedMatrix
+        Localized empirical covariance matrix.
+    """
+
+    localization_radii = sorted(localizer.keys())
+
+    # all localizers must fit into the bands
+    if isinstance(localizer, GaspariCohnLocalizer):
+        # the support of the Gaspari-Cohn function grows with the radius
+        pattern = localizer[max(localizer)]
+    else:
+        pattern = sum(abs(scipy.sparse.csr_array(loc)) for loc in localizer.values())
+    permutation, n_bands = _band_permutation(pattern)
+
+    # converted on access, such that a lazy localizer stays lazy
+    localizer = _BandedLocalizer(localizer, permutation, n_bands)
+    data = data[:, permutation]
+
+    # see _find_localized_empirical_covariance_np
+    fold_covariances = _FoldCovariances.from_options(
+        data, weights, k_folds, n_bands=n_bands
+    )
+
+    localization_radius = minimize(
+        _ecov_crossvalidation_banded,
         localization_radii,
         data=data,
         weights=weights,
         localizer=localizer,
         k_folds=k_folds,
+        fold_covariances=fold_covariances,
     )
 
-    covariance = np.cov(data, rowvar=False, aweights=weights)
-    localized_covariance = localizer[localization_radius] * covariance
+    covariance = _banded_covariance_np(data, weights, n_bands)
+    localized_covariance = localizer[localization_radius].bands * covariance
+
+    covariance = _BandedMatrix(covariance, permutation)
+    localized_covariance = _BandedMatrix(localized_covariance, permutation)
 
     return localization_radius, covariance, localized_covariance
 
 
+class _BandedLocalizer(Mapping):
+    """converts the sparse matrices of ``localizer`` to ``_BandedMatrix`` on access"""
+
+    def __init__(self, localizer, permutation, n_bands):
+        self.localizer = localizer
+        self.permutation = permutation
+        self.n_bands = n_bands
+
+    def __getitem__(self, localization_radius):
+        loc = self.localizer[localization_radius]
+        return _sparse_to_banded(loc, self.permutation, self.n_bands)
+
+    def __contains__(self, localization_radius):
+        return localization_radius in self.localizer
+
+    def __iter__(self):
+        return iter(self.localizer)
+
+    def __len__(self):
+        return len(self.localizer)
+
+
 @_set_threads_from_options()
-def _ecov_crossvalidation(localization_radius, *, data, weights, localizer, k_folds):
-    """k-fold crossvalidation for a single localization radius"""
+def _ecov_crossvalidation_banded(
+    localization_radius, *, data, weights, localizer, k_folds, fold_covariances=None
+):
+    """k-fold crossvalidation for a single localization radius and banded localizer"""
 
     n_samples, __ = data.shape
     n_iterations = min(n_samples, k_folds)
 
+    localizer = localizer[localization_radius].bands
+    n_bands = localizer.shape[0]
+
     nll = 0  # negative log likelihood
 
     for it in range(n_iterations):
@@ -302,19 +615,19 @@ def _ecov_crossvalidation(localization_radius, *, data, weights, localizer, k_fo
         sel = np.ones(n_samples, dtype=bool)
         sel[it::k_folds] = False
 
-        # extract training set
-        data_train, weights_train = data[sel, :], weights[sel]
+        # compute (localized) empirical covariance of the training set
+        if fold_covariances is None:
+            cov = _banded_covariance_np(data[sel, :], weights[sel], n_bands)
+        else:
+            cov = fold_covariances[it]
 
-        # extract validation set
-        data_cv, weights_cv = data[~sel, :], weights[~sel]
-
-        # compute (localized) empirical covariance
-        cov = np.cov(data_train, rowvar=False, aweights=weights_train)
-        localized_cov = localizer[localization_radius] * cov
+        localized_cov = localizer * cov
 
         try:
             # sum log likelihood of all crossvalidation folds
-            nll += _get_neg_loglikelihood(data_cv, localized_cov, weights_cv)
+            nll += _get_neg_loglikelihood_banded(
+                data[~sel, :], localized_cov, weights[~sel]
+            )
         except np.linalg.LinAlgError:
             warnings.warn(
                 f"Singular matrix for localization_radius of {localization_radius}."
@@ -326,7 +639,214 @@ def _ecov_crossvalidation(localization_radius, *, data, weights, localizer, k_fo
     return nll
 
 
-def _get_neg_loglikelihood(data, covariance, weights):
+def _is_sparse_localizer(localizer):
+
+    # avoid computing all localization matrices of a lazy localizer
+    if isinstance(localizer, GaspariCohnLocalizer):
+        return localizer.sparse
+
+    return any(scipy.sparse.issparse(loc) for loc in localizer.values())
+
+
+@contextmanager
+def _crossvalidation_executor():
+    """thread pool to evaluate the cross validation folds concurrently
+
+    Yields None if the ``crossvalidation_workers`` option is 1. The number of threads
+    for matrix operations (see the ``threads`` option) is divided between the workers
+    and nested calls within the workers run sequentially.
+    """
+
+    workers = OPTIONS["crossvalidation_workers"]
+
+    if workers == 1:
+        yield None
+        return
+
+    with (
+        _divide_threads_between_workers(workers, crossvalidation_workers=1),
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+        yield executor
+
+
+@_set_threads_from_options()
+def _ecov_crossvalidation(
+    localization_radius,
+    *,
+    data,
+    weights,
+    localizer,
+    k_folds,
+    fold_covariances=None,
+    executor=None,
+    release_gil=None,
+):
+    """k-fold crossvalidation for a single localization radius
+
+    ``fold_covariances`` (see ``_FoldCovariances``) provides the empirical covariance
+    matrices of the training sets, which do not depend on the localization radius. If
+    an ``executor`` is passed, the folds are evaluated concurrently. The negative log
+    likelihoods are summed in the order of the folds in any case. ``release_gil`` (see
+    ``_get_neg_loglikelihood``) defaults to whether an ``executor`` is passed.
+    """
+
+    if release_gil is None:
+        release_gil = executor is not None
+
+    n_samples, __ = data.shape
+    n_iterations = min(n_samples, k_folds)
+
+    def _fold_nll(it):
+
+        # every `k_folds` element for validation such that each is used exactly once
+        sel = np.ones(n_samples, dtype=bool)
+        sel[it::k_folds] = False
+
+        # extract training set
+        data_train, weights_train = data[sel, :], weights[sel]
+
+        # extract validation set
+        data_cv, weights_cv = data[~sel, :], weights[~sel]
+
+        # compute (localized) empirical covariance
+        if fold_covariances is None:
+            cov = np.cov(data_train, rowvar=False, aweights=weights_train)
+        else:
+            cov = fold_covariances[it]
+
+        localized_cov = localizer[localization_radius] * cov
+
+        # log likelihood of this crossvalidation fold
+        return _get_neg_loglikelihood(
+            data_cv, localized_cov, weights_cv, release_gil=release_gil
+        )
+
+    # lazily evaluated if executor is None, i.e., stops at the first singular matrix
+    fold_map = map if executor is None else executor.map
+
+    nll = 0  # negative log likelihood
+
+    try:
+        # sum log likelihood of all crossvalidation folds
+        for fold_nll in fold_map(_fold_nll, range(n_iterations)):
+            nll += fold_nll
+    except np.linalg.LinAlgError:
+        warnings.warn(
+            f"Singular matrix for localization_radius of {localization_radius}."
+            " Skipping this radius.",
+            LinAlgWarning,
+        )
+        return float("inf")
+
+    return nll
+
+
+class _FoldCovariances:
+    """empirical covariance matrices of the training sets of the cross validation
+
+    The training set of fold ``it`` contains all samples except every ``k_folds``-th
+    sample starting at ``it`` (see ``_ecov_crossvalidation``). Its covariance matrix is
+    computed from the weighted scatter matrix of all samples by subtracting the scatter
+    of the validation samples (a low-rank update), which is much cheaper than computing
+    it from the training samples. The matrices are cached as long as the total size
+    stays below ``max_nbytes`` (including the scatter matrix) and recomputed otherwise.
+
+    For banded covariance matrices (``n_bands`` is not None) the bands are computed from
+    the training samples and cached.
+    """
+
+    def __init__(self, data, weights, k_folds, max_nbytes, n_bands=None):
+
+        n_samples, n_gridpoints = data.shape
+
+        self.k_folds = k_folds
+        self.n_bands = n_bands
+        self.max_nbytes = max_nbytes
+        self._cache = {}
+        # the folds may be evaluated concurrently, see _ecov_crossvalidation
+        self._lock = threading.Lock()
+
+        self._weights = weights
+
+        if n_bands is not None:
+            self._data = data
+            self._nbytes = n_bands * n_gridpoints * data.itemsize
+            return
+
+        # the covariance does not depend on the mean - centering the data reduces the
+        # cancellation in the low-rank updates
+        self._data = data - np.average(data, axis=0, weights=weights)
+
+        data_weighted = self._data * weights[:, np.newaxis]
+        self._scatter = data_weighted.T @ self._data
+        self._sum = data_weighted.sum(axis=0)
+
+        self._nbytes = self._scatter.nbytes
+        self.max_nbytes -= self._nbytes
+
+    @classmethod
+    def from_options(cls, data, weights, k_folds, n_bands=None):
+        """use the ``crossvalidation_cache_size`` option as memory budget
+
+        Returns None if not even one matrix fits into the budget.
+        """
+
+        max_nbytes = OPTIONS["crossvalidation_cache_size"]
+
+        n_gridpoints = data.shape[1]
+        n_rows = n_gridpoints if n_bands is None else n_bands
+
+        if n_rows * n_gridpoints * data.itemsize > max_nbytes:
+            return None
+
+        return cls(data, weights, k_folds, max_nbytes, n_bands=n_bands)
+
+    def __getitem__(self, it):
+
+        cov = self._cache.get(it)
+
+        if cov is None:
+            cov = self._compute(it)
+
+            with self._lock:
+                if (len(self._cache) + 1) * self._nbytes <= self.max_nbytes:
+                    # the cached matrices are shared between the localization radii
+                    cov.flags.writeable = False
+                    self._cache[it] = cov
+
+        return cov
+
+    def _compute(self, it):
+
+        n_samples = self._data.shape[0]
+
+        # every `k_folds` element for validation, see _ecov_crossvalidation
+        sel = np.ones(n_samples, dtype=bool)
+        sel[it :: self.k_folds] = False
+
+        if self.n_bands is not None:
+            return _banded_covariance_np(
+                self._data[sel, :], self._weights[sel], self.n_bands
+            )
+
+        data_cv, weights_cv = self._data[~sel, :], self._weights[~sel]
+        data_cv_weighted = data_cv * weights_cv[:, np.newaxis]
+
+        weights_train = self._weights[sel]
+        v1 = weights_train.sum()
+
+        # weighted mean and scatter of the training set
+        mean = (self._sum - data_cv_weighted.sum(axis=0)) / v1
+        scatter = self._scatter - data_cv_weighted.T @ data_cv
+
+        # same normalization as np.cov with aweights
+        fact = v1 - (weights_train * weights_train).sum() / v1
+
+        return (scatter - v1 * np.outer(mean, mean)) / fact
+
+
+def _get_neg_loglikelihood(data, covariance, weights, *, release_gil=False):
     """calculate weighted log likelihood for multivariate normal distribution
 
     Parameters
@@ -337,6 +857,10 @@ def _get_neg_loglikelihood(data, covariance, weights):
         Localized empirical variance matrix.
     weights : 1D array
         Sample weights
+    release_gil : bool, default: False
+        If True, factorizes the covariance matrix with ``np.linalg.cholesky``, which
+        releases the GIL (unlike the slightly faster ``scipy.linalg.cho_factor``), such
+        that several folds can be evaluated in threads.
 
     Returns
     -------
@@ -350,17 +874,75 @@ def _get_neg_loglikelihood(data, covariance, weights):
 
     Notes
     -----
-    The mean is assumed to be zero for all points.
+    The mean is assumed to be zero for all points. Equivalent to
+    ``scipy.stats.multivariate_normal.logpdf`` but the covariance matrix is factorized
+    only once and all samples are whitened in a single triangular solve.
     """
 
-    # NOTE: 90 % of time is spent in multivariate_normal.logpdf - not much point
-    # optimizing the rest
+    # raises LinAlgError if covariance is not positive definite
+    if release_gil:
+        factor = np.linalg.cholesky(covariance)
+    else:
+        factor, __ = scipy.linalg.cho_factor(covariance, lower=True, check_finite=False)
 
-    cov = scipy.stats.Covariance.from_cholesky(np.linalg.cholesky(covariance))
-    log_likelihood = scipy.stats.multivariate_normal.logpdf(data, cov=cov)
+    # whiten all samples at once - the upper triangle of factor is not referenced
+    whitened = scipy.linalg.solve_triangular(
+        factor, data.T, lower=True, check_finite=False
+    )
 
-    # logpdf can return a scalar, which np.average does not like
-    log_likelihood = np.atleast_1d(log_likelihood)
+    log_det = 2 * np.log(np.diagonal(factor)).sum()
+
+    return _neg_loglikelihood_from_whitened(whitened, log_det, weights)
+
+
+def _get_neg_loglikelihood_banded(data, bands, weights):
+    """calculate weighted log likelihood for multivariate normal distribution with a
+    banded covariance matrix
+
+    Parameters
+    ----------
+    data : 2D array
+        Data array used for cross validation.
+    bands : 2D array
+        Lower bands of the localized empirical covariance matrix (see
+        ``scipy.linalg.cholesky_banded``).
+    weights : 1D array
+        Sample weights
+
+    Returns
+    -------
+    weighted_nll : float
+        Weighted negative log likelihood
+
+    Raises
+    ------
+    np.linalg.LinAlgError if the covariance matrix is not positive definite.
+
+    Notes
+    -----
+    The mean is assumed to be zero for all points. Equivalent to
+    ``_get_neg_loglikelihood`` for the full covariance matrix.
+    """
+
+    factor = scipy.linalg.cholesky_banded(bands, lower=True)
+
+    (tbtrs,) = scipy.linalg.get_lapack_funcs(("tbtrs",), (factor,))
+    whitened, __ = tbtrs(factor, data.T, uplo="L")
+
+    log_det = 2 * np.log(factor[0]).sum()
+
+    return _neg_loglikelihood_from_whitened(whitened, log_det, weights)
+
+
+def _neg_loglikelihood_from_whitened(whitened, log_det, weights):
+    """weighted negative log likelihood of whitened samples (of shape (n, n_samples))
+    of a zero-mean multivariate normal distribution"""
+
+    n = whitened.shape[0]
+
+    log_likelihood = -0.5 * (
+        n * np.log(2 * np.pi) + log_det + (whitened**2).sum(axis=0)
+    )
 
     # weighted sum for each cv sample
     # equals `log_likelihood @ weights * weights.size / weights.sum()`
@@ -3,11 +3,13 @@ from unittest import mock
 import numpy as np
 import pandas as pd
 import pytest
+import scipy.linalg
+import scipy.sparse
 import xarray as xr
 
 import mesmer
 from mesmer._core.utils import LinAlgWarning, _check_dataarray_form, _check_dataset_form
-from mesmer.stats import _auto_regression
+from mesmer.stats import _auto_regression, _banded, _innovations
 from mesmer.testing import trend_data_1D, trend_data_2D, trend_data_3D
 
 
@@ -75,6 +77,48 @@ def test_select_ar_order_np():
         _auto_regression._select_ar_order_np(data[:6], 5)
 
 
+def test_select_ar_order_batched_np():
+
+    rng = np.random.default_rng(seed=0)
+    data = rng.normal(size=100)
+
+    result = _auto_regression._select_ar_order_batched_np(data, 2)
+    assert np.isnan(result)
+
+    result = _auto_regression._select_ar_order_batched_np(data[:10], 2)
+    assert result == 2
+
+    with pytest.raises(ValueError):
+        _auto_regression._select_ar_order_batched_np(data[:6], 5)
+
+    with pytest.raises(ValueError, match="'ic' must be one of"):
+        _auto_regression._select_ar_order_batched_np(data, 2, ic="foo")
+
+
+@pytest.mark.parametrize("ic", ["aic", "bic", "hqic"])
+@pytest.mark.parametrize("maxlag", [1, 4])
+def test_select_ar_order_numpy_equal_statsmodels(ic, maxlag):
+
+    rng = np.random.default_rng(seed=0)
+    data = xr.DataArray(rng.normal(size=(25, 40)), dims=("cells", "time"))
+    data = data + trend_data_2D(n_timesteps=40, n_lat=5, n_lon=5)
+
+    result = mesmer.stats.select_ar_order(data, "time", maxlag=maxlag, ic=ic)
+    expected = mesmer.stats.select_ar_order(
+        data, "time", maxlag=maxlag, ic=ic, method="statsmodels"
+    )
+
+    xr.testing.assert_equal(result, expected)
+
+
+def test_select_ar_order_method_error():
+
+    data = trend_data_1D()
+
+    with pytest.raises(ValueError, match="'method' must be one of"):
+        mesmer.stats.select_ar_order(data, "time", maxlag=1, method="foo")
+
+
 @pytest.fixture
 def ar_params_1D():
 
@@ -129,15 +173,92 @@ def test_draw_auto_regression_uncorrelated_wrong_input(ar_params_1D, drop):
         )
 
 
-def test_draw_auto_regression_uncorrelated_2D_errors(ar_params_2D):
+@pytest.mark.parametrize("rng_streams", ("sequential", "realisation"))
+@pytest.mark.parametrize("init", ("buffer", "stationary"))
+def test_draw_auto_regression_uncorrelated_2D(ar_params_2D, rng_streams, init):
+
+    ar_params_2D = ar_params_2D.assign_coords(gridcell=["a", "b"])
+    ar_params_2D["coeffs"] = ar_params_2D.coeffs + [[0.3, 0.5]]
+
+    kwargs = dict(
+        time=4, realisation=3, seed=0, buffer=0, rng_streams=rng_streams, init=init
+    )
+
+    result = mesmer.stats.draw_auto_regression_uncorrelated(ar_params_2D, **kwargs)
+    result = result.samples
+
+    _check_dataarray_form(
+        result,
+        "result",
+        ndim=3,
+        required_dims={"time", "gridcell", "realisation"},
+        shape=(4, 2, 3),
+    )
+    assert result.dims == ("time", "gridcell", "realisation")
+    np.testing.assert_equal(result.gridcell.values, ["a", "b"])
+
+    # independent innovations are equal to a diagonal covariance matrix
+    covariance = xr.DataArray(
+        np.diag(ar_params_2D.variance.values), dims=("gridcell_i", "gridcell_j")
+    )
+    sampler = "direct" if rng_streams == "realisation" else "compat"
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D.drop_vars("variance"), covariance, sampler=sampler, **kwargs
+    )
+
+    np.testing.assert_allclose(result, expected.samples, rtol=1e-12)
 
-    with pytest.raises(
-        ValueError,
-        match="``draw_auto_regression_uncorrelated`` can currently only handle single points",
-    ):
 
+def test_draw_auto_regression_uncorrelated_3D():
+
+    rng = np.random.default_rng(0)
+
+    intercept = xr.DataArray(rng.normal(size=(2, 3)), dims=("lat", "lon"))
+    coeffs = xr.DataArray(
+        rng.uniform(-0.5, 0.5, (2, 3, 2)), dims=("lat", "lon", "lags")
+    )
+    variance = xr.DataArray(rng.uniform(0.5, 2.0, (3, 2)), dims=("lon", "lat"))
+    ar_params = xr.Dataset(
+        {"intercept": intercept, "coeffs": coeffs, "variance": variance}
+    )
+
+    result = mesmer.stats.draw_auto_regression_uncorrelated(
+        ar_params, time=2_000, realisation=20, seed=0, buffer=0, init="stationary"
+    ).samples
+
+    assert result.dims == ("time", "lat", "lon", "realisation")
+    assert result.shape == (2_000, 2, 3, 20)
+
+    # compare to the stationary moments of each point
+    for lat in range(2):
+        for lon in range(3):
+            params = ar_params.isel(lat=lat, lon=lon)
+            intercept, (c1, c2) = params.intercept.item(), params.coeffs.values
+            variance = params.variance.item()
+
+            mean = intercept / (1 - c1 - c2)
+            rho1 = c1 / (1 - c2)
+            var = variance / (1 - c1 * rho1 - c2 * (c1 * rho1 + c2))
+
+            samples = result.isel(lat=lat, lon=lon)
+            np.testing.assert_allclose(samples.mean(), mean, atol=0.1)
+            np.testing.assert_allclose(samples.var(), var, rtol=0.1)
+
+
+def test_draw_auto_regression_uncorrelated_dims_errors(ar_params_2D):
+
+    with pytest.raises(ValueError, match="'coeffs' must have the dimensions of"):
         mesmer.stats.draw_auto_regression_uncorrelated(
-            ar_params_2D,
+            ar_params_2D.assign(variance=ar_params_2D.variance.rename(gridcell="x")),
+            time=1,
+            realisation=1,
+            seed=0,
+            buffer=0,
+        )
+
+    with pytest.raises(ValueError, match="'coeffs' must have the dimensions of"):
+        mesmer.stats.draw_auto_regression_uncorrelated(
+            ar_params_2D.assign(coeffs=ar_params_2D.coeffs.isel(lags=0)),
             time=1,
             realisation=1,
             seed=0,
@@ -279,6 +400,22 @@ def test_draw_auto_regression_uncorrelated_coords(ar_params_1D, dim, coords):
     np.testing.assert_equal(result[dim].values, coords.values)
 
 
+def test_draw_auto_regression_uncorrelated_rng_streams(ar_params_1D):
+
+    kwargs = dict(time=4, seed=0, buffer=2, rng_streams="realisation")
+
+    expected = mesmer.stats.draw_auto_regression_uncorrelated(
+        ar_params_1D, realisation=5, **kwargs
+    )
+    result = mesmer.stats.draw_auto_regression_uncorrelated(
+        ar_params_1D, realisation=pd.Index([3]), **kwargs
+    )
+
+    np.testing.assert_equal(
+        result.samples.values, expected.samples.isel(realisation=[3]).values
+    )
+
+
 @pytest.mark.parametrize("drop", ("intercept", "coeffs"))
 def test_draw_auto_regression_correlated_wrong_input(ar_params_2D, covariance, drop):
 
@@ -329,49 +466,943 @@ def test_draw_auto_regression_correlated(
     )
 
 
-def test_draw_auto_regression_correlated_dt(ar_params_2D, covariance):
+def test_draw_auto_regression_correlated_dt(ar_params_2D, covariance):
+    seeds = xr.DataTree.from_dict(
+        {
+            "scen1": xr.DataArray(np.array([25]), name="seed").to_dataset(),
+            "scen2": xr.DataArray(np.array([42]), name="seed").to_dataset(),
+        }
+    )
+    n_realisation = 10
+    n_ts = 20
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D,
+        covariance,
+        time=n_ts,
+        realisation=n_realisation,
+        seed=seeds,
+        buffer=10,
+        time_dim="time",
+        realisation_dim="realisation",
+    )
+
+    assert result["scen1"].to_dataset().var() is not result["scen2"].to_dataset().var()
+    _check_dataset_form(
+        result["scen1"].to_dataset(), "result", required_vars={"samples"}
+    )
+    _check_dataset_form(
+        result["scen2"].to_dataset(), "result", required_vars={"samples"}
+    )
+    _check_dataarray_form(
+        result["scen1"].samples,
+        "samples",
+        ndim=3,
+        required_dims={"time", "gridcell", "realisation"},
+        shape=(n_ts, 2, n_realisation),
+    )
+    _check_dataarray_form(
+        result["scen2"].samples,
+        "samples",
+        ndim=3,
+        required_dims={"time", "gridcell", "realisation"},
+        shape=(n_ts, 2, n_realisation),
+    )
+
+
+@pytest.mark.parametrize("draw_workers", [1, 2, 3])
+@pytest.mark.parametrize("sampler", ["compat", "direct"])
+def test_draw_auto_regression_correlated_dt_workers(
+    ar_params_2D, covariance, draw_workers, sampler
+):
+    seeds = xr.DataTree.from_dict(
+        {
+            "scen1": xr.DataArray(np.array([25]), name="seed").to_dataset(),
+            "scen2": xr.DataArray(np.array([42]), name="seed").to_dataset(),
+            "scen3": xr.DataArray(np.array([7]), name="seed").to_dataset(),
+        }
+    )
+
+    kwargs = dict(time=20, realisation=10, buffer=10, sampler=sampler)
+
+    with mesmer.set_options(draw_workers=draw_workers):
+        result = mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, seed=seeds, **kwargs
+        )
+
+    assert mesmer.get_options()["draw_workers"] == 1
+    assert not result.has_data
+
+    for name, seed in (("scen1", 25), ("scen2", 42), ("scen3", 7)):
+        expected = mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, seed=seed, **kwargs
+        )
+        xr.testing.assert_identical(result[name].to_dataset(), expected)
+
+
+def test_draw_auto_regression_correlated_covariance_factor(ar_params_2D, covariance):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, covariance, **kwargs
+    )
+
+    covariance_factor = mesmer.stats.factorize_covariance(covariance)
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, None, covariance_factor=covariance_factor, **kwargs
+    )
+
+    xr.testing.assert_identical(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_draw_auto_regression_correlated_sampler_direct(
+    ar_params_2D, covariance, dtype
+):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, covariance, sampler="direct", dtype=dtype, **kwargs
+    )
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, covariance, **kwargs
+    )
+
+    assert result.samples.dtype == dtype
+    assert result.samples.dims == expected.samples.dims
+
+    # float64: same standard normal numbers, only the matrix product differs
+    if dtype == "float64":
+        xr.testing.assert_allclose(result, expected)
+
+
+def test_draw_auto_regression_correlated_sampler_errors(ar_params_2D, covariance):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    with pytest.raises(ValueError, match="'sampler' must be one of"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, sampler="foo", **kwargs  # type: ignore[arg-type]
+        )
+
+    with pytest.raises(ValueError, match="sampler='compat' only supports"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, dtype="float32", **kwargs
+        )
+
+
+def banded_covariance(covariance, dim):
+    covariance = scipy.sparse.csr_array(covariance)
+    permutation, n_bands = _banded._band_permutation(covariance)
+    covariance = _banded._sparse_to_banded(covariance, permutation, n_bands)
+
+    return _banded._banded_to_dataarray(covariance, dim)
+
+
+@pytest.mark.parametrize("rng_streams", ("sequential", "realisation"))
+def test_draw_auto_regression_correlated_banded(rng_streams):
+
+    n_gridcells = 6
+    covariance = np.eye(n_gridcells) + np.diag(np.full(n_gridcells - 1, 0.4), 1)
+    covariance = covariance + covariance.T - np.eye(n_gridcells)
+    covariance_banded = banded_covariance(covariance, "gridcell")
+
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", np.arange(n_gridcells, dtype=float)),
+            "coeffs": (("lags", "gridcell"), np.zeros((1, n_gridcells))),
+        }
+    )
+
+    kwargs = dict(
+        time=10_000,
+        realisation=3,
+        seed=0,
+        buffer=0,
+        sampler="direct",
+        rng_streams=rng_streams,
+    )
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance_banded, **kwargs
+    ).samples
+
+    assert result.dims == ("time", "gridcell", "realisation")
+
+    # the samples are the innovations (plus the intercept)
+    samples = result.transpose("time", "realisation", "gridcell").values
+    samples = samples.reshape(-1, n_gridcells)
+
+    np.testing.assert_allclose(samples.mean(axis=0), ar_params.intercept, atol=0.03)
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), covariance, atol=0.03)
+
+    covariance_factor = mesmer.stats.factorize_covariance(covariance_banded)
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, None, covariance_factor=covariance_factor, **kwargs
+    ).samples
+
+    xr.testing.assert_identical(result, expected)
+
+
+def test_draw_auto_regression_correlated_banded_errors(ar_params_2D, covariance):
+
+    covariance = banded_covariance(covariance.values, "gridcell")
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    with pytest.raises(ValueError, match="A banded 'covariance' requires sampler="):
+        mesmer.stats.draw_auto_regression_correlated(ar_params_2D, covariance, **kwargs)
+
+    with pytest.raises(ValueError, match="A banded 'covariance' requires init="):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, sampler="direct", init="stationary", **kwargs
+        )
+
+    with pytest.raises(ValueError, match="is missing the required coords"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D,
+            covariance.drop_vars("band_order"),
+            sampler="direct",
+            **kwargs,
+        )
+
+
+@pytest.mark.parametrize("rng_streams", ("sequential", "realisation"))
+def test_draw_auto_regression_correlated_low_rank(ar_params_2D, rng_streams):
+
+    covariance = xr.DataArray(
+        [[1.0, 0.5], [0.5, 2.0]], dims=("gridcell_i", "gridcell_j")
+    )
+    covariance_factor = mesmer.stats.factorize_covariance(
+        covariance, explained_variance=0.5
+    )
+    assert covariance_factor.sizes["eof"] == 1
+
+    kwargs = dict(
+        time=20_000,
+        realisation=2,
+        seed=0,
+        buffer=0,
+        sampler="direct",
+        rng_streams=rng_streams,
+    )
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, None, covariance_factor=covariance_factor, **kwargs
+    ).samples
+
+    assert result.dims == ("time", "gridcell", "realisation")
+
+    samples = result.transpose("time", "realisation", "gridcell").values
+    samples = samples.reshape(-1, 2)
+
+    # the variances are exact, the covariance is approximated
+    expected = covariance_factor.values @ covariance_factor.values.T
+    expected += np.diag(covariance_factor.residual_std.values**2)
+
+    np.testing.assert_allclose(np.diag(expected), np.diag(covariance))
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), expected, atol=0.05)
+
+
+def test_draw_auto_regression_correlated_low_rank_errors(ar_params_2D, covariance):
+
+    covariance_factor = mesmer.stats.factorize_covariance(
+        covariance, explained_variance=0.9
+    )
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    msg = "A low-rank 'covariance_factor' requires sampler="
+    with pytest.raises(ValueError, match=msg):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, None, covariance_factor=covariance_factor, **kwargs
+        )
+
+    msg = "A low-rank 'covariance_factor' requires init="
+    with pytest.raises(ValueError, match=msg):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D,
+            None,
+            covariance_factor=covariance_factor,
+            sampler="direct",
+            init="stationary",
+            **kwargs,
+        )
+
+    with pytest.raises(ValueError, match="expected 2 gridpoints, got 1"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D,
+            None,
+            covariance_factor=covariance_factor.isel(gridcell_i=[0]),
+            sampler="direct",
+            **kwargs,
+        )
+
+
+def test_draw_auto_regression_correlated_covariance_factor_errors(
+    ar_params_2D, covariance
+):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+    msg = "Must pass exactly one of 'covariance' and 'covariance_factor'"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.stats.draw_auto_regression_correlated(ar_params_2D, None, **kwargs)
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, covariance_factor=covariance, **kwargs
+        )
+
+    with pytest.raises(ValueError, match="covariance_factor has wrong shape"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, None, covariance_factor=covariance[:1, :1], **kwargs
+        )
+
+
+def _draw_chunked_and_combine(ar_params, covariance, **kwargs):
+
+    chunks = mesmer.stats.draw_auto_regression_correlated_chunked(
+        ar_params, covariance, **kwargs
+    )
+    return xr.combine_by_coords(list(chunks))
+
+
+@pytest.mark.parametrize(
+    "realisation_chunk_size, time_chunk_size",
+    [(None, None), (1, 1), (2, 3), (3, 7), (5, None)],
+)
+def test_draw_auto_regression_correlated_chunked(
+    ar_params_2D, covariance, realisation_chunk_size, time_chunk_size
+):
+
+    time = pd.Index(np.arange(2000, 2011), name="time")
+    realisation = pd.Index(np.arange(5), name="realisation")
+    kwargs = dict(time=time, realisation=realisation, seed=0, buffer=4)
+
+    expected = _draw_chunked_and_combine(ar_params_2D, covariance, **kwargs)
+
+    chunks = list(
+        mesmer.stats.draw_auto_regression_correlated_chunked(
+            ar_params_2D,
+            covariance,
+            realisation_chunk_size=realisation_chunk_size,
+            time_chunk_size=time_chunk_size,
+            **kwargs,
+        )
+    )
+
+    for chunk in chunks:
+        assert chunk.samples.dims == ("time", "gridcell", "realisation")
+        assert chunk.sizes["realisation"] <= (realisation_chunk_size or 5)
+        assert chunk.sizes["time"] <= (time_chunk_size or 11)
+
+    result = xr.combine_by_coords(chunks)
+
+    # identical, independent of the chunking
+    xr.testing.assert_identical(result, expected)
+    np.testing.assert_equal(result.time.values, time.values)
+
+
+def test_draw_auto_regression_correlated_chunked_innovations():
+
+    # zero coefficients: the samples are the innovations
+    n_gridcells = 2
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", [0.0, 0.0]),
+            "coeffs": (("lags", "gridcell"), [[0.0, 0.0]]),
+        }
+    )
+    cov = np.array([[1.0, 0.5], [0.5, 2.0]])
+    covariance = xr.DataArray(cov, dims=("gridcell_i", "gridcell_j"))
+
+    (result,) = mesmer.stats.draw_auto_regression_correlated_chunked(
+        ar_params, covariance, time=5000, realisation=10, seed=0, buffer=0
+    )
+
+    samples = result.samples.transpose(..., "gridcell").values.reshape(-1, n_gridcells)
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), cov, rtol=0.05)
+
+    # each realisation uses an independent stream
+    assert np.not_equal(result.samples[..., 0], result.samples[..., 1]).all()
+
+
+def test_draw_auto_regression_correlated_chunked_options(ar_params_2D, covariance):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+
+    expected = _draw_chunked_and_combine(ar_params_2D, covariance, **kwargs)
+
+    covariance_factor = mesmer.stats.factorize_covariance(covariance)
+    result = _draw_chunked_and_combine(
+        ar_params_2D, None, covariance_factor=covariance_factor, **kwargs
+    )
+    xr.testing.assert_identical(result, expected)
+
+    result = _draw_chunked_and_combine(
+        ar_params_2D, covariance, dtype="float32", **kwargs
+    )
+    assert result.samples.dtype == np.float32
+
+
+def test_draw_auto_regression_correlated_chunked_errors(ar_params_2D, covariance):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+    func = mesmer.stats.draw_auto_regression_correlated_chunked
+
+    # errors are raised eagerly, not when iterating
+    with pytest.raises(ValueError, match="'time_chunk_size' must be a positive"):
+        func(ar_params_2D, covariance, time_chunk_size=0, **kwargs)
+
+    with pytest.raises(ValueError, match="'realisation_chunk_size' must be a positive"):
+        func(ar_params_2D, covariance, realisation_chunk_size=1.5, **kwargs)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="'dtype' must be float32 or float64"):
+        func(ar_params_2D, covariance, dtype="int32", **kwargs)
+
+    with pytest.raises(ValueError, match="covariance has wrong shape"):
+        func(ar_params_2D, covariance[:1, :1], **kwargs)
+
+
+@pytest.mark.parametrize("kind", ["banded", "banded_factor", "low_rank"])
+def test_draw_auto_regression_correlated_chunked_banded_low_rank(kind):
+
+    n_gridcells = 6
+    covariance = np.eye(n_gridcells) + np.diag(np.full(n_gridcells - 1, 0.4), 1)
+    covariance = covariance + covariance.T - np.eye(n_gridcells)
+
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", np.arange(n_gridcells, dtype=float)),
+            "coeffs": (("lags", "gridcell"), np.full((1, n_gridcells), 0.3)),
+        }
+    )
+
+    if kind == "low_rank":
+        # n_eofs == n_gridpoints, the residual_std must not be dropped
+        covariance = xr.DataArray(covariance, dims=("gridcell_i", "gridcell_j"))
+        factor = mesmer.stats.factorize_covariance(covariance, explained_variance=1.0)
+        factor["residual_std"] = factor.residual_std + 0.5
+        covariance, covariance_factor = None, factor
+    else:
+        covariance = banded_covariance(covariance, "gridcell")
+        covariance_factor = None
+
+        if kind == "banded_factor":
+            covariance_factor = mesmer.stats.factorize_covariance(covariance)
+            covariance = None
+
+    time = pd.Index(np.arange(7), name="time")
+    realisation = pd.Index(np.arange(3), name="realisation")
+    kwargs = dict(
+        time=time,
+        realisation=realisation,
+        seed=0,
+        buffer=3,
+        covariance_factor=covariance_factor,
+    )
+
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, sampler="direct", rng_streams="realisation", **kwargs
+    )
+    result = _draw_chunked_and_combine(
+        ar_params, covariance, realisation_chunk_size=2, time_chunk_size=3, **kwargs
+    )
+
+    np.testing.assert_allclose(
+        result.samples.values, expected.samples.values, rtol=1e-12
+    )
+
+
+def test_draw_auto_regression_correlated_chunked_banded_low_rank_errors(
+    ar_params_2D, covariance
+):
+
+    kwargs = dict(time=5, realisation=3, seed=0, buffer=3)
+    func = mesmer.stats.draw_auto_regression_correlated_chunked
+
+    banded = banded_covariance(covariance.values, "gridcell")
+    with pytest.raises(ValueError, match="A banded 'covariance' requires init="):
+        func(ar_params_2D, banded, init="stationary", **kwargs)
+
+    covariance_factor = mesmer.stats.factorize_covariance(
+        covariance, explained_variance=0.9
+    )
+    msg = "A low-rank 'covariance_factor' requires init="
+    with pytest.raises(ValueError, match=msg):
+        func(
+            ar_params_2D,
+            None,
+            covariance_factor=covariance_factor,
+            init="stationary",
+            **kwargs,
+        )
+
+    with pytest.raises(ValueError, match="must be passed as 'covariance_factor'"):
+        func(ar_params_2D, covariance_factor, **kwargs)
+
+
+def test_draw_auto_regression_correlated_rng_streams_realisation(
+    ar_params_2D, covariance
+):
+
+    kwargs = dict(time=7, seed=0, buffer=3, sampler="direct")
+    kwargs["rng_streams"] = "realisation"
+
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, covariance, realisation=6, **kwargs
+    )
+
+    # any subset of realisations can be drawn independently
+    realisation = pd.Index([4, 1], name="realisation")
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D, covariance, realisation=realisation, **kwargs
+    )
+
+    np.testing.assert_equal(
+        result.samples.values, expected.samples.isel(realisation=[4, 1]).values
+    )
+
+    # equal to the chunked draws
+    expected = _draw_chunked_and_combine(
+        ar_params_2D,
+        covariance,
+        time=pd.Index(np.arange(7), name="time"),
+        realisation=realisation,
+        seed=0,
+        buffer=3,
+        realisation_chunk_size=1,
+        time_chunk_size=2,
+    )
+    np.testing.assert_equal(
+        result.samples.values, expected.samples.sel(realisation=[4, 1]).values
+    )
+
+
+def test_draw_auto_regression_correlated_rng_streams_errors(ar_params_2D, covariance):
+
+    kwargs = dict(time=7, realisation=2, seed=0, buffer=3)
+
+    with pytest.raises(ValueError, match="'rng_streams' must be one of"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, rng_streams="foo", **kwargs  # type: ignore[arg-type]
+        )
+
+    with pytest.raises(ValueError, match="requires sampler='direct'"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, rng_streams="realisation", **kwargs
+        )
+
+    kwargs["realisation"] = pd.Index(["a", "b"])
+    with pytest.raises(ValueError, match="must be non-negative integers"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D,
+            covariance,
+            rng_streams="realisation",
+            sampler="direct",
+            **kwargs,
+        )
+
+
+@pytest.mark.parametrize("ar_order", [1, 2, 3])
+def test_stationary_moments_ar_np(ar_order):
+
+    n_coeffs = 3
+    rng = np.random.default_rng(0)
+
+    intercept = rng.normal(size=n_coeffs)
+    coeffs = rng.uniform(-0.3, 0.3, size=(ar_order, n_coeffs))
+    data = rng.normal(size=(n_coeffs, n_coeffs))
+    cov = data @ data.T + np.eye(n_coeffs)
+
+    factor = np.linalg.cholesky(cov)
+    mean, result = _auto_regression._stationary_moments_ar_np(intercept, coeffs, factor)
+
+    # state-space form with the most recent state first
+    n_states = ar_order * n_coeffs
+    transition = np.zeros((n_states, n_states))
+    for lag in range(ar_order):
+        transition[:n_coeffs, lag * n_coeffs : (lag + 1) * n_coeffs] = np.diag(
+            coeffs[lag]
+        )
+    transition[n_coeffs:, : n_states - n_coeffs] = np.eye(n_states - n_coeffs)
+    noise = np.zeros((n_states, n_states))
+    noise[:n_coeffs, :n_coeffs] = cov
+
+    expected = scipy.linalg.solve_discrete_lyapunov(transition, noise)
+
+    # chronological order
+    order = np.arange(n_states).reshape(ar_order, n_coeffs)[::-1].ravel()
+    np.testing.assert_allclose(result, expected[np.ix_(order, order)], atol=1e-12)
+
+    expected_mean = intercept / (1 - coeffs.sum(axis=0))
+    np.testing.assert_allclose(mean, np.tile(expected_mean, (ar_order, 1)))
+
+
+def test_stationary_moments_ar_np_not_stationary():
+
+    coeffs = np.array([[0.5, 1.0]])
+    with pytest.raises(ValueError, match="process is not stationary"):
+        _auto_regression._stationary_moments_ar_np(np.zeros(2), coeffs, np.eye(2))
+
+
+@pytest.mark.parametrize(
+    "coeffs, independent",
+    [
+        ([[0.7, 0.7, 0.7]], False),
+        ([[0.7, 0.7, 0.7]], True),
+        ([[0.7, -0.2, 0.5]], False),
+        ([[0.5, 0.1, 0.3], [0.2, -0.3, 0.1]], False),
+        ([[0.5, 0.1, 0.3], [0.2, -0.3, 0.1]], True),
+    ],
+)
+def test_stationary_state_factor_np(coeffs, independent):
+
+    rng = np.random.default_rng(0)
+
+    intercept = rng.normal(size=3)
+    coeffs = np.array(coeffs)
+
+    if independent:
+        factor = rng.uniform(0.5, 2, size=3)
+    else:
+        data = rng.normal(size=(3, 3))
+        factor = np.linalg.cholesky(data @ data.T + np.eye(3))
+
+    mean, result = _auto_regression._stationary_state_factor_np(
+        intercept, coeffs, factor
+    )
+    expected_mean, expected = _auto_regression._stationary_moments_ar_np(
+        intercept, coeffs, factor
+    )
+
+    np.testing.assert_allclose(mean, expected_mean)
+    np.testing.assert_allclose(result @ result.swapaxes(-1, -2), expected, atol=1e-12)
+
+
+def test_stationary_state_factor_np_shared_ar1():
+
+    factor = np.linalg.cholesky(np.array([[1.0, 0.5], [0.5, 2.0]]))
+    coeffs = np.array([[0.6, 0.6]])
+
+    # the factor of the innovations is rescaled - the Stein equation is not solved
+    with mock.patch.object(_auto_regression, "_solve_stein_doubling_np") as mocked:
+        mean, result = _auto_regression._stationary_state_factor_np(
+            np.array([1.0, 2.0]), coeffs, factor
+        )
+
+    mocked.assert_not_called()
+    np.testing.assert_allclose(result, factor / np.sqrt(1 - 0.6**2))
+    np.testing.assert_allclose(mean, [[2.5, 5.0]])
+
+    with pytest.raises(ValueError, match="process is not stationary"):
+        _auto_regression._stationary_state_factor_np(np.zeros(2), -coeffs / 0.6, factor)
+
+
+def test_draw_auto_regression_correlated_init_stationary_cached():
+
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", [1.0, -2.0]),
+            "coeffs": (("lags", "gridcell"), [[0.9, 0.5], [-0.2, 0.3]]),
+        }
+    )
+    cov = np.array([[1.0, 0.5], [0.5, 2.0]])
+    covariance = xr.DataArray(cov, dims=("gridcell_i", "gridcell_j"))
+
+    _innovations._COVARIANCE_FACTOR_CACHE.clear()
+
+    factorize = _innovations._factorize_covariance_np_impl
+    with mock.patch.object(
+        _innovations, "_factorize_covariance_np_impl", wraps=factorize
+    ) as mocked:
+        for seed in range(3):
+            mesmer.stats.draw_auto_regression_correlated(
+                ar_params,
+                covariance,
+                time=3,
+                realisation=2,
+                seed=seed,
+                buffer=0,
+                init="stationary",
+            )
+
+    _innovations._COVARIANCE_FACTOR_CACHE.clear()
+
+    # the innovation and the stationary covariance are only factorized once
+    assert mocked.call_count == 2
+
+
+@pytest.mark.parametrize("sampler", ["compat", "direct"])
+def test_draw_auto_regression_correlated_init_stationary(sampler):
+
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", [1.0, -2.0]),
+            "coeffs": (("lags", "gridcell"), [[0.9, 0.5], [-0.2, 0.3]]),
+        }
+    )
+    cov = np.array([[1.0, 0.5], [0.5, 2.0]])
+    covariance = xr.DataArray(cov, dims=("gridcell_i", "gridcell_j"))
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=3,
+        realisation=20_000,
+        seed=0,
+        buffer=0,
+        sampler=sampler,
+        init="stationary",
+    )
+
+    intercept, coeffs = ar_params.intercept.values, ar_params.coeffs.values
+    mean, expected_cov = _auto_regression._stationary_moments_ar_np(
+        intercept, coeffs, np.linalg.cholesky(cov)
+    )
+
+    # already stationary at the first time steps - no spin-up required
+    for t in range(3):
+        samples = result.samples.isel(time=t).values.T
+        np.testing.assert_allclose(samples.mean(axis=0), mean[0], atol=0.05)
+        np.testing.assert_allclose(
+            np.cov(samples, rowvar=False), expected_cov[:2, :2], rtol=0.05
+        )
+
+
+def test_draw_auto_regression_correlated_init_stationary_streams(
+    ar_params_2D, covariance
+):
+
+    kwargs = dict(seed=0, buffer=0, init="stationary")
+    realisation = pd.Index([4, 1], name="realisation")
+
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params_2D,
+        covariance,
+        time=7,
+        realisation=6,
+        sampler="direct",
+        rng_streams="realisation",
+        **kwargs,
+    )
+
+    result = _draw_chunked_and_combine(
+        ar_params_2D,
+        covariance,
+        time=pd.Index(np.arange(7), name="time"),
+        realisation=realisation,
+        realisation_chunk_size=1,
+        time_chunk_size=2,
+        **kwargs,
+    )
+
+    np.testing.assert_equal(
+        result.samples.sel(realisation=[4, 1]).values,
+        expected.samples.isel(realisation=[4, 1]).values,
+    )
+
+    # the initial state is not zero
+    assert (expected.samples.isel(time=0) != 0).all()
+
+
+def test_draw_auto_regression_init_errors(ar_params_2D, covariance):
+
+    kwargs = dict(time=7, realisation=2, seed=0, buffer=3)
+
+    with pytest.raises(ValueError, match="'init' must be one of"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params_2D, covariance, init="foo", **kwargs  # type: ignore[arg-type]
+        )
+
+    with pytest.raises(ValueError, match="'init' must be one of"):
+        mesmer.stats.draw_auto_regression_correlated_chunked(
+            ar_params_2D, covariance, init="foo", **kwargs  # type: ignore[arg-type]
+        )
+
+    ar_params = ar_params_2D.assign(coeffs=ar_params_2D.coeffs + 1.0)
+    with pytest.raises(ValueError, match="process is not stationary"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params, covariance, init="stationary", **kwargs
+        )
+
+
+@pytest.fixture
+def ar_params_ar2():
+
+    rng = np.random.default_rng(0)
+    n_gridcells = 3
+
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("gridcell", rng.normal(size=n_gridcells)),
+            "coeffs": (("lags", "gridcell"), rng.uniform(-0.4, 0.4, (2, n_gridcells))),
+        }
+    )
+    data = rng.normal(size=(n_gridcells, n_gridcells))
+    covariance = xr.DataArray(
+        data @ data.T + np.eye(n_gridcells), dims=("gridcell_i", "gridcell_j")
+    )
+
+    return ar_params, covariance
+
+
+@pytest.mark.parametrize("n_ts_first", [1, 128, 150])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("init", ["buffer", "stationary"])
+def test_draw_auto_regression_correlated_continue(
+    ar_params_ar2, n_ts_first, dtype, init
+):
+
+    ar_params, covariance = ar_params_ar2
+    kwargs = dict(
+        realisation=4,
+        seed=3,
+        sampler="direct",
+        dtype=dtype,
+        rng_streams="realisation",
+    )
+
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, time=300, buffer=20, init=init, **kwargs
+    )
+
+    first = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=n_ts_first,
+        buffer=20,
+        init=init,
+        return_state=True,
+        **kwargs | {"seed": 3},
+    )
+
+    # the state can be stored
+    assert first.state.dims == ("lags", "gridcell", "realisation")
+    assert first.stream_position == 20 + n_ts_first
+
+    second = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=300 - n_ts_first,
+        buffer=0,
+        **kwargs | {"seed": first},
+    )
+
+    result = np.concatenate([first.samples.values, second.samples.values])
+    np.testing.assert_equal(result, expected.samples.values)
+
+
+def test_draw_auto_regression_correlated_continue_subset(ar_params_ar2):
+
+    ar_params, covariance = ar_params_ar2
+    kwargs = dict(sampler="direct", rng_streams="realisation")
+
+    realisation = pd.Index([5, 2, 7], name="realisation")
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=30,
+        realisation=realisation,
+        seed=0,
+        buffer=5,
+        **kwargs,
+    )
+    first = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=10,
+        realisation=realisation,
+        seed=0,
+        buffer=5,
+        return_state=True,
+        **kwargs,
+    )
+
+    # continue only a subset of the realisations
+    subset = pd.Index([7, 5], name="realisation")
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=20,
+        realisation=subset,
+        seed=first,
+        buffer=0,
+        **kwargs,
+    )
+
+    xr.testing.assert_equal(
+        result.samples,
+        expected.samples.isel(time=slice(10, None)).sel(realisation=subset),
+    )
+
+    with pytest.raises(ValueError, match="contains no realisation.* with key.*'3'"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params,
+            covariance,
+            time=20,
+            realisation=pd.Index([3, 5], name="realisation"),
+            seed=first,
+            buffer=0,
+            **kwargs,
+        )
+
+
+def test_draw_auto_regression_correlated_continue_dt(ar_params_ar2):
+
+    ar_params, covariance = ar_params_ar2
     seeds = xr.DataTree.from_dict(
         {
             "scen1": xr.DataArray(np.array([25]), name="seed").to_dataset(),
             "scen2": xr.DataArray(np.array([42]), name="seed").to_dataset(),
         }
     )
-    n_realisation = 10
-    n_ts = 20
-
-    result = mesmer.stats.draw_auto_regression_correlated(
-        ar_params_2D,
-        covariance,
-        time=n_ts,
-        realisation=n_realisation,
-        seed=seeds,
-        buffer=10,
-        time_dim="time",
-        realisation_dim="realisation",
-    )
+    kwargs = dict(realisation=2, sampler="direct", rng_streams="realisation")
 
-    assert result["scen1"].to_dataset().var() is not result["scen2"].to_dataset().var()
-    _check_dataset_form(
-        result["scen1"].to_dataset(), "result", required_vars={"samples"}
+    expected = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, time=20, seed=seeds, buffer=5, **kwargs
     )
-    _check_dataset_form(
-        result["scen2"].to_dataset(), "result", required_vars={"samples"}
+    first = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, time=5, seed=seeds, buffer=5, return_state=True, **kwargs
     )
-    _check_dataarray_form(
-        result["scen1"].samples,
-        "samples",
-        ndim=3,
-        required_dims={"time", "gridcell", "realisation"},
-        shape=(n_ts, 2, n_realisation),
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, time=15, seed=first, buffer=0, **kwargs
     )
-    _check_dataarray_form(
-        result["scen2"].samples,
-        "samples",
-        ndim=3,
-        required_dims={"time", "gridcell", "realisation"},
-        shape=(n_ts, 2, n_realisation),
+
+    for scen in ("scen1", "scen2"):
+        np.testing.assert_equal(
+            result[scen].samples.values,
+            expected[scen].samples.isel(time=slice(5, None)).values,
+        )
+
+
+def test_draw_auto_regression_correlated_continue_errors(ar_params_ar2):
+
+    ar_params, covariance = ar_params_ar2
+    kwargs = dict(time=5, realisation=2, sampler="direct")
+
+    with pytest.raises(ValueError, match="requires rng_streams='realisation'"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params, covariance, seed=0, buffer=3, return_state=True, **kwargs
+        )
+
+    kwargs["rng_streams"] = "realisation"
+    first = mesmer.stats.draw_auto_regression_correlated(
+        ar_params, covariance, seed=0, buffer=3, return_state=True, **kwargs
     )
 
+    with pytest.raises(ValueError, match="'buffer' must be 0 to continue a draw"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar_params, covariance, seed=first, buffer=3, **kwargs
+        )
+
+    ar1_params = ar_params.isel(lags=[0])
+    with pytest.raises(ValueError, match="must have 1 lag"):
+        mesmer.stats.draw_auto_regression_correlated(
+            ar1_params, covariance, seed=first, buffer=0, **kwargs
+        )
+
 
 @pytest.mark.parametrize("dim", ("time", "realisation"))
 @pytest.mark.parametrize("wrong_coords", (None, 2.0, np.array([1, 2]), xr.Dataset()))
@@ -552,6 +1583,68 @@ def test_draw_auto_regression_random():
     np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("n_periods", [1, 12])
+@pytest.mark.parametrize("ar_order", [1, 3])
+def test_ar_recursion_inplace_np(n_periods, ar_order):
+
+    rng = np.random.default_rng(0)
+    n_samples, n_ts, n_coeffs = 3, 30, 4
+
+    innovations = rng.normal(size=(n_samples, n_ts, n_coeffs))
+    intercept = rng.normal(size=(n_periods, n_coeffs))
+    coeffs = rng.uniform(-0.3, 0.3, size=(n_periods, ar_order, n_coeffs))
+
+    expected = innovations.copy()
+    for t in range(ar_order, n_ts):
+        period = t % n_periods
+        for lag in range(1, ar_order + 1):
+            expected[:, t] += coeffs[period, lag - 1] * expected[:, t - lag]
+        expected[:, t] += intercept[period]
+
+    result = innovations.copy()
+    _auto_regression._ar_recursion_inplace_np(result, intercept, coeffs, ar_order)
+
+    np.testing.assert_allclose(result, expected)
+
+    # the python loops (compiled with numba if available) yield identical results
+    result_loops = innovations.copy()
+    _auto_regression._ar_recursion_inplace_loops(
+        result_loops, intercept, coeffs, ar_order
+    )
+
+    np.testing.assert_equal(result_loops, result)
+
+
+def test_ar_recursion_inplace_numba():
+
+    pytest.importorskip("numba")
+
+    rng = np.random.default_rng(0)
+    innovations = rng.normal(size=(3, 30, 4))
+    intercept = rng.normal(size=(1, 4))
+    coeffs = rng.uniform(-0.3, 0.3, size=(1, 2, 4))
+
+    expected = innovations.copy()
+    _auto_regression._ar_recursion_inplace_np(expected, intercept, coeffs, 2)
+
+    result = innovations.copy()
+    _auto_regression._ar_recursion_inplace(
+        result, intercept=intercept, coeffs=coeffs, start=2
+    )
+
+    np.testing.assert_equal(result, expected)
+
+
+def test_ar_recursion_inplace_start_error():
+
+    out = np.zeros((1, 5, 1))
+
+    with pytest.raises(ValueError, match="'start' must be larger or equal"):
+        _auto_regression._ar_recursion_inplace(
+            out, intercept=np.zeros((1, 1)), coeffs=np.zeros((1, 2, 1)), start=1
+        )
+
+
 def test_draw_auto_regression_correlated_eigh():
     # test that the function uses eigh when the covariance matrix is not positive definite
     with pytest.warns(
@@ -670,6 +1763,54 @@ def test_fit_auto_regression_xr_2D(lags):
     _check_dataarray_form(res.variance, "variance", ndim=1, shape=(n_cells,))
 
 
+def test_fit_auto_regression_method_error():
+
+    data = trend_data_1D()
+
+    with pytest.raises(ValueError, match="'method' must be one of"):
+        mesmer.stats.fit_auto_regression(data, "time", lags=1, method="foo")
+
+
+@pytest.mark.parametrize("lags", [1, 2, [2], [1, 3]])
+@pytest.mark.parametrize("offset", [0, 273.15])
+def test_fit_auto_regression_numpy_equal_statsmodels(lags, offset):
+
+    data = trend_data_3D(n_lat=3, n_lon=2) + offset
+
+    result = mesmer.stats.fit_auto_regression(data, "time", lags=lags, method="numpy")
+    expected = mesmer.stats.fit_auto_regression(
+        data, "time", lags=lags, method="statsmodels"
+    )
+
+    xr.testing.assert_allclose(result, expected, rtol=1e-10)
+
+
+def test_fit_auto_regression_batched_np_nan():
+
+    data = trend_data_2D().values
+    data[2, 3] = np.nan
+
+    intercept, coeffs, variance, nobs = (
+        _auto_regression._fit_auto_regression_batched_np(data, lags=1)
+    )
+
+    assert np.isnan(intercept[2]) and np.isnan(coeffs[2]).all()
+    assert np.isnan(variance[2])
+    assert np.isfinite(np.delete(intercept, 2)).all()
+    np.testing.assert_equal(nobs, data.shape[-1] - 1)
+
+
+def test_fit_auto_regression_batched_np_errors():
+
+    data = np.arange(5.0)
+
+    with pytest.raises(ValueError, match="Not enough time steps"):
+        _auto_regression._fit_auto_regression_batched_np(data, lags=3)
+
+    with pytest.raises(ValueError, match="lags must be positive"):
+        _auto_regression._fit_auto_regression_batched_np(data, lags=[0])
+
+
 @pytest.mark.parametrize("lags", [1, 2])
 def test_fit_auto_regression_np(lags):
 
@@ -792,6 +1933,84 @@ def test_fit_auto_regression_monthly(stack) -> None:
         mesmer.stats.fit_auto_regression_monthly(data.values)  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize("stack", (False, True))
+def test_fit_auto_regression_monthly_vectorized_equal_loop(stack) -> None:
+    n_years = 20
+    n_gridcells = 10
+    rng = np.random.default_rng(seed=0)
+
+    data = xr.DataArray(
+        rng.normal(size=(2, n_years * 12, n_gridcells)).cumsum(axis=1) + 273.15,
+        dims=("member", "time", "gridcell"),
+        coords={
+            "time": pd.date_range("2000-01-01", periods=n_years * 12, freq="ME"),
+            "gridcell": np.arange(n_gridcells),
+            "lat": ("gridcell", np.linspace(-50, 50, n_gridcells)),
+        },
+    )
+
+    if stack:
+        data = data.stack(sample=["time"], create_index=False)
+
+    sample_dim = "sample" if stack else "time"
+
+    result_fit, result_residuals = (
+        _auto_regression._fit_auto_regression_monthly_vectorized(data, sample_dim)
+    )
+    expected_fit, expected_residuals = (
+        _auto_regression._fit_auto_regression_monthly_loop(data, "time", sample_dim)
+    )
+
+    xr.testing.assert_allclose(result_fit, expected_fit, rtol=1e-10)
+    xr.testing.assert_allclose(result_residuals, expected_residuals, atol=1e-10)
+
+    assert result_residuals.dims == expected_residuals.dims
+    assert result_residuals.coords.equals(expected_residuals.coords)
+
+
+def test_fit_auto_regression_monthly_not_starting_in_january() -> None:
+    # falls back to the loop over the months
+
+    n_years = 5
+    rng = np.random.default_rng(seed=0)
+
+    data = xr.DataArray(
+        rng.normal(size=(n_years * 12, 3)),
+        dims=("time", "gridcell"),
+        coords={"time": pd.date_range("2000-03-01", periods=n_years * 12, freq="MS")},
+    )
+
+    with mock.patch.object(
+        _auto_regression, "_fit_auto_regression_monthly_vectorized"
+    ) as mocked:
+        result_fit, result_residuals = mesmer.stats.fit_auto_regression_monthly(data)
+
+    mocked.assert_not_called()
+
+    assert result_fit.slope.shape == (12, 3)
+    assert result_residuals.shape == (n_years * 12 - 1, 3)
+
+
+def test_fit_auto_regression_monthly_batched_np_nan() -> None:
+
+    rng = np.random.default_rng(seed=0)
+    data = rng.normal(size=(3, 10 * 12))
+    data[1, 5] = np.nan
+
+    slope, intercept, residuals = (
+        _auto_regression._fit_auto_regression_monthly_batched_np(data)
+    )
+
+    assert slope.shape == intercept.shape == (3, 12)
+    assert residuals.shape == data.shape
+
+    assert np.isnan(residuals[:, 0]).all()
+    assert np.isfinite(slope[[0, 2]]).all()
+    # only the months depending on the missing value are affected
+    assert np.isnan(slope[1, [5, 6]]).all()
+    assert np.isfinite(np.delete(slope[1], [5, 6])).all()
+
+
 @pytest.mark.filterwarnings(
     "ignore:Covariance matrix is not positive definite, using eigh instead of cholesky."
 )
@@ -851,6 +2070,211 @@ def test_draw_autoregression_monthly_np_rng():
     assert np.not_equal(jan, feb).any()
 
 
+def test_draw_auto_regression_monthly_covariance_factor():
+
+    n_gridcells = 3
+    rng = np.random.default_rng(seed=0)
+
+    dims = ("month", "gridcell")
+    ar_params = xr.Dataset(
+        {
+            "intercept": (dims, rng.normal(size=(12, n_gridcells))),
+            "slope": (dims, rng.uniform(-0.5, 0.5, size=(12, n_gridcells))),
+        }
+    )
+
+    a = rng.normal(size=(12, n_gridcells, n_gridcells))
+    covariance = xr.DataArray(
+        a @ a.transpose(0, 2, 1), dims=("month", "gridcell_i", "gridcell_j")
+    )
+
+    time = pd.date_range("2000-01-01", periods=5 * 12, freq="ME")
+    kwargs = dict(time=time, n_realisations=2, seed=0, buffer=2)
+
+    expected = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, covariance, **kwargs
+    )
+
+    covariance_factor = mesmer.stats.factorize_covariance(covariance)
+    result = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, None, covariance_factor=covariance_factor, **kwargs
+    )
+
+    xr.testing.assert_identical(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_draw_auto_regression_monthly_np_sampler_direct(dtype):
+
+    n_gridcells = 4
+    rng = np.random.default_rng(seed=0)
+    slope = rng.uniform(-0.5, 0.5, size=(12, n_gridcells))
+    intercept = rng.normal(size=(12, n_gridcells))
+    a = rng.normal(size=(12, n_gridcells, n_gridcells))
+    covariance = a @ a.transpose(0, 2, 1)
+
+    kwargs = dict(n_samples=2, n_ts=60, seed=0, buffer=2)
+
+    result = _auto_regression._draw_auto_regression_monthly_np(
+        intercept, slope, covariance, sampler="direct", dtype=dtype, **kwargs
+    )
+    expected = _auto_regression._draw_auto_regression_monthly_np(
+        intercept, slope, covariance, **kwargs
+    )
+
+    assert result.dtype == dtype
+    assert result.shape == expected.shape
+
+    if dtype == "float64":
+        np.testing.assert_allclose(result, expected)
+
+
+def test_draw_auto_regression_monthly_np_rng_streams_realisation():
+
+    n_gridcells = 3
+    rng = np.random.default_rng(seed=0)
+    slope = rng.uniform(-0.5, 0.5, size=(12, n_gridcells))
+    intercept = rng.normal(size=(12, n_gridcells))
+    covariance = np.tile(np.eye(n_gridcells), [12, 1, 1])
+
+    kwargs = dict(n_ts=36, seed=0, buffer=2, sampler="direct")
+
+    expected = _auto_regression._draw_auto_regression_monthly_np(
+        intercept, slope, covariance, n_samples=4, sample_keys=np.arange(4), **kwargs
+    )
+
+    result = _auto_regression._draw_auto_regression_monthly_np(
+        intercept, slope, covariance, n_samples=1, sample_keys=np.array([2]), **kwargs
+    )
+
+    np.testing.assert_equal(result, expected[[2]])
+
+    # the months use different streams
+    innovations = _auto_regression._draw_auto_regression_monthly_np(
+        np.zeros_like(intercept),
+        np.zeros_like(slope),
+        covariance,
+        n_samples=1,
+        sample_keys=np.array([0]),
+        **kwargs,
+    )
+    assert np.not_equal(innovations[:, 0::12], innovations[:, 1::12]).all()
+
+
+def test_stationary_moments_monthly_np():
+
+    n_gridcells = 3
+    rng = np.random.default_rng(seed=0)
+    slope = rng.uniform(-0.9, 0.9, size=(12, n_gridcells))
+    intercept = rng.normal(size=(12, n_gridcells))
+    data = rng.normal(size=(12, n_gridcells, n_gridcells))
+    covariance = data @ data.transpose(0, 2, 1) + np.eye(n_gridcells)
+    factors = np.linalg.cholesky(covariance)
+
+    mean, cov = _auto_regression._stationary_moments_monthly_np(
+        intercept, slope, factors
+    )
+
+    # propagate the moments until they converge
+    expected_mean = np.zeros(n_gridcells)
+    expected_cov = np.zeros((n_gridcells, n_gridcells))
+    for t in range(1, 12 * 200 + 1):
+        month = t % 12
+        expected_mean = intercept[month] + slope[month] * expected_mean
+        expected_cov *= np.outer(slope[month], slope[month])
+        expected_cov += covariance[month]
+
+    np.testing.assert_allclose(mean, expected_mean[np.newaxis, :])
+    np.testing.assert_allclose(cov, expected_cov)
+
+    with pytest.raises(ValueError, match="process is not stationary"):
+        _auto_regression._stationary_moments_monthly_np(
+            intercept, np.ones_like(slope), factors
+        )
+
+
+@pytest.mark.parametrize("sample_keys", [None, np.arange(20_000)])
+def test_draw_auto_regression_monthly_np_init_stationary(sample_keys):
+
+    n_gridcells = 2
+    rng = np.random.default_rng(seed=0)
+    slope = rng.uniform(0.5, 0.9, size=(12, n_gridcells))
+    intercept = rng.normal(size=(12, n_gridcells))
+    covariance = np.tile(np.array([[1.0, 0.3], [0.3, 0.5]]), [12, 1, 1])
+
+    result = _auto_regression._draw_auto_regression_monthly_np(
+        intercept,
+        slope,
+        covariance,
+        n_samples=20_000,
+        n_ts=12,
+        seed=0,
+        buffer=0,
+        sampler="direct",
+        sample_keys=sample_keys,
+        init="stationary",
+    )
+
+    factors = np.linalg.cholesky(covariance)
+    mean, cov = _auto_regression._stationary_moments_monthly_np(
+        intercept, slope, factors
+    )
+
+    # the first month is drawn from the stationary distribution
+    samples = result[:, 0, :]
+    np.testing.assert_allclose(samples.mean(axis=0), mean[0], atol=0.05)
+    np.testing.assert_allclose(np.cov(samples, rowvar=False), cov, rtol=0.05)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_draw_auto_regression_monthly_continue(dtype):
+
+    n_gridcells = 3
+    rng = np.random.default_rng(seed=0)
+    coords = {"month": np.arange(1, 13), "gridcell": np.arange(n_gridcells)}
+    ar_params = xr.Dataset(
+        {
+            "intercept": (("month", "gridcell"), rng.normal(size=(12, n_gridcells))),
+            "slope": (("month", "gridcell"), rng.uniform(-0.9, 0.9, (12, n_gridcells))),
+        },
+        coords=coords,
+    )
+    covariance = xr.DataArray(
+        np.tile(np.eye(n_gridcells) + 0.5, [12, 1, 1]),
+        dims=("month", "gridcell_i", "gridcell_j"),
+    )
+
+    time = pd.date_range("2000-01-01", periods=12 * 12, freq="ME")
+    kwargs = dict(
+        n_realisations=3, sampler="direct", dtype=dtype, rng_streams="realisation"
+    )
+
+    expected = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, covariance, time=time, seed=0, buffer=2, **kwargs
+    )
+    first = mesmer.stats.draw_auto_regression_monthly(
+        ar_params,
+        covariance,
+        time=time[:36],
+        seed=0,
+        buffer=2,
+        return_state=True,
+        **kwargs,
+    )
+    assert first.stream_position == 2 + 3
+
+    result = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, covariance, time=time[36:], seed=first, buffer=0, **kwargs
+    )
+
+    xr.testing.assert_identical(result, expected.isel(time=slice(36, None)))
+
+    with pytest.raises(ValueError, match="requires full years"):
+        mesmer.stats.draw_auto_regression_monthly(
+            ar_params, covariance, time=time[:30], seed=first, buffer=0, **kwargs
+        )
+
+
 @pytest.mark.parametrize("seed", [0, xr.Dataset({"seed": 0})])
 def test_draw_auto_regression_monthly(seed):
     freq = "ME"
@@ -904,6 +2328,54 @@ def test_draw_auto_regression_monthly(seed):
     )
 
 
+def test_draw_auto_regression_monthly_dt_workers():
+
+    seeds = xr.DataTree.from_dict(
+        {
+            "scen1": xr.DataArray(np.array([25]), name="seed").to_dataset(),
+            "scen2": xr.DataArray(np.array([42]), name="seed").to_dataset(),
+        }
+    )
+
+    n_gridcells = 3
+    rng = np.random.default_rng(seed=0)
+
+    coords = {"month": np.arange(1, 13), "gridcell": np.arange(n_gridcells)}
+    ar_params = xr.Dataset(
+        {
+            "intercept": (("month", "gridcell"), rng.normal(size=(12, n_gridcells))),
+            "slope": (("month", "gridcell"), rng.uniform(-0.9, 0.9, (12, n_gridcells))),
+        },
+        coords=coords,
+    )
+
+    covariance = xr.DataArray(
+        np.tile(np.eye(n_gridcells) + 0.5, [12, 1, 1]),
+        dims=("month", "gridcell_i", "gridcell_j"),
+    )
+
+    time = pd.date_range("2000-01-01", periods=5 * 12, freq="ME")
+    time = xr.DataArray(time, dims="time", coords={"time": time})
+
+    kwargs = dict(time=time, n_realisations=4, buffer=10)
+
+    expected = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, covariance, seed=seeds, **kwargs
+    )
+
+    with mesmer.set_options(draw_workers=2):
+        result = mesmer.stats.draw_auto_regression_monthly(
+            ar_params, covariance, seed=seeds, **kwargs
+        )
+
+    xr.testing.assert_identical(result, expected)
+
+    expected = mesmer.stats.draw_auto_regression_monthly(
+        ar_params, covariance, seed=42, **kwargs
+    )
+    xr.testing.assert_identical(result["scen2"].to_dataset(), expected)
+
+
 def test_draw_auto_regression_monthly_dt():
 
     seeds = xr.DataTree.from_dict(
@@ -214,3 +214,91 @@ def test_fit_auto_regression_scen_ens_errors() -> None:
         mesmer.stats.fit_auto_regression_scen_ens(
             dataset, dim="time", ens_dim="ens", lags=3  # type: ignore[arg-type]
         )
+
+
+@pytest.mark.parametrize("data_format", ["tuple", "dict", "datatree"])
+def test_select_and_fit_auto_regression_scen_ens_multi_scen(data_format):
+    da1 = generate_ar_samples([1, 0.5, 0.3], n_timesteps=100, n_ens=4)
+    da2 = generate_ar_samples([1, 0.5, 0.3, 0.4], n_timesteps=100, n_ens=5) + 10
+
+    data = _prepare_data(da1, da2, data_format=data_format)
+
+    result = _maybe_unpack_data_and_call(
+        mesmer.stats.select_and_fit_auto_regression_scen_ens,
+        data_format,
+        data,
+        dim="time",
+        ens_dim="ens",
+        maxlag=5,
+    )
+
+    ar_order = _maybe_unpack_data_and_call(
+        mesmer.stats.select_ar_order_scen_ens,
+        data_format,
+        data,
+        dim="time",
+        ens_dim="ens",
+        maxlag=5,
+    )
+    expected = _maybe_unpack_data_and_call(
+        mesmer.stats.fit_auto_regression_scen_ens,
+        data_format,
+        data,
+        dim="time",
+        ens_dim="ens",
+        lags=ar_order,
+    )
+
+    xr.testing.assert_equal(result.selected_ar_order, ar_order.drop_vars("quantile"))
+    xr.testing.assert_allclose(result.drop_vars("selected_ar_order"), expected)
+
+
+@pytest.mark.parametrize("data_format", ["tuple", "dict", "datatree"])
+def test_select_and_fit_auto_regression_scen_ens_no_ens_dim(data_format):
+
+    da = generate_ar_samples([1, 0.5, 0.3, 0.4], n_timesteps=100, n_ens=4)
+    data = _prepare_data(da, data_format=data_format)
+
+    result = _maybe_unpack_data_and_call(
+        mesmer.stats.select_and_fit_auto_regression_scen_ens,
+        data_format,
+        data,
+        dim="time",
+        ens_dim=None,
+        maxlag=5,
+    )
+
+    ar_order = mesmer.stats.select_ar_order(da, "time", maxlag=5)
+    xr.testing.assert_equal(result.selected_ar_order, ar_order.astype(int))
+
+    # each member is fitted with its own order, coeffs are padded with zeros
+    n_lags = int(ar_order.max())
+    for ens in da.ens.values:
+        order = int(ar_order.sel(ens=ens))
+        expected = mesmer.stats.fit_auto_regression(da.sel(ens=ens), "time", lags=order)
+        result_ens = result.sel(ens=ens)
+
+        xr.testing.assert_allclose(result_ens.intercept, expected.intercept)
+        xr.testing.assert_allclose(result_ens.variance, expected.variance)
+        np.testing.assert_allclose(result_ens.nobs, expected.nobs)
+        np.testing.assert_allclose(result_ens.coeffs[:order], expected.coeffs)
+        np.testing.assert_equal(result_ens.coeffs[order:n_lags].values, 0)
+
+
+def test_fit_auto_regression_from_stats_np_order_zero():
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(3, 50))
+
+    stats = mesmer.stats._auto_regression._ar_sufficient_stats_np(data, 2)
+    intercept, coeffs, variance, nobs = (
+        mesmer.stats._auto_regression._fit_auto_regression_from_stats_np(
+            *stats, ar_order=np.nan, n_lags=1
+        )
+    )
+
+    # no lags: mean and variance of the full time series
+    np.testing.assert_allclose(intercept, data.mean(axis=-1))
+    np.testing.assert_allclose(variance, data.var(axis=-1))
+    np.testing.assert_equal(coeffs, 0)
+    np.testing.assert_equal(nobs, 50)
@@ -1,9 +1,20 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pyproj
 import pytest
+import scipy.sparse
 import xarray as xr
-
-from mesmer.geospatial import closest_neighbors, geodist_exact
-from mesmer.stats import gaspari_cohn, gaspari_cohn_correlation_matrices
+from sklearn.metrics.pairwise import haversine_distances
+
+import mesmer
+from mesmer.geospatial import closest_neighbors, geodist_exact, geodist_sparse
+from mesmer.stats import (
+    GaspariCohnLocalizer,
+    gaspari_cohn,
+    gaspari_cohn_correlation_matrices,
+)
 from mesmer.testing import assert_dict_allclose
 
 
@@ -151,6 +162,93 @@ def test_geodist_exact(as_dataarray):
         np.testing.assert_allclose(result, expected)
 
 
+def geodist_exact_rowwise(lon, lat):
+
+    geod = pyproj.Geod(ellps="WGS84")
+    n_points = lon.size
+
+    expected = np.zeros((n_points, n_points))
+    for i in range(n_points - 1):
+        ln, lt = np.full(n_points - i - 1, lon[i]), np.full(n_points - i - 1, lat[i])
+        expected[i, i + 1 :] = geod.inv(ln, lt, lon[i + 1 :], lat[i + 1 :])[2] / 1000
+
+    return expected + expected.T
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 30, 512])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_geodist_exact_blocks(block_size, workers):
+
+    rng = np.random.default_rng(0)
+    lon, lat = rng.uniform(-180, 180, 30), rng.uniform(-90, 90, 30)
+
+    with mesmer.set_options(geodist_workers=workers):
+        result = mesmer.geospatial._geodist_exact(lon, lat, block_size=block_size)
+
+    # bitwise equal to the row-by-row computation
+    np.testing.assert_array_equal(result, geodist_exact_rowwise(lon, lat))
+    np.testing.assert_array_equal(result, result.T)
+
+
+@pytest.mark.parametrize("as_dataarray", [True, False])
+def test_geodist_exact_float32(as_dataarray):
+
+    lon, lat = grid_lon_lat()
+    expected = geodist_exact_rowwise(lon, lat).astype("float32")
+
+    if as_dataarray:
+        lon = xr.DataArray(lon, dims="gridpoint")
+        lat = xr.DataArray(lat, dims="gridpoint")
+
+    result = geodist_exact(lon, lat, dtype="float32")
+
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("as_dataarray", [True, False])
+def test_geodist_exact_out(tmp_path, as_dataarray):
+
+    lon, lat = grid_lon_lat()
+    n_points = lon.size
+    expected = geodist_exact_rowwise(lon, lat)
+
+    if as_dataarray:
+        lon = xr.DataArray(lon, dims="gridpoint")
+        lat = xr.DataArray(lat, dims="gridpoint")
+
+    out = np.lib.format.open_memmap(
+        tmp_path / "geodist.npy", mode="w+", dtype="float32", shape=(n_points, n_points)
+    )
+
+    result = geodist_exact(lon, lat, out=out)
+    out.flush()
+
+    if as_dataarray:
+        assert result.dims == ("gridpoint_i", "gridpoint_j")
+        result = result.values
+
+    assert np.shares_memory(result, out)
+    np.testing.assert_array_equal(
+        np.load(tmp_path / "geodist.npy"), expected.astype("float32")
+    )
+
+
+def test_geodist_exact_out_errors():
+
+    lon, lat = grid_lon_lat()
+    n_points = lon.size
+
+    with pytest.raises(ValueError, match="'out' must have shape"):
+        geodist_exact(lon, lat, out=np.empty((n_points, n_points - 1)))
+
+    with pytest.raises(ValueError, match="'out' must have dtype float32, got float64"):
+        geodist_exact(lon, lat, dtype="float32", out=np.empty((n_points, n_points)))
+
+    with pytest.raises(ValueError, match="Expected a floating point dtype, got int64"):
+        geodist_exact(lon, lat, dtype="int64")
+
+
 @pytest.mark.parametrize("localisation_radii", [[1000, 2000], range(5000, 5001)])
 @pytest.mark.parametrize("as_dataarray", [True, False])
 def test_gaspari_cohn_correlation_matrices(localisation_radii, as_dataarray):
@@ -173,6 +271,205 @@ def test_gaspari_cohn_correlation_matrices(localisation_radii, as_dataarray):
     assert_dict_allclose(expected, result)
 
 
+@pytest.mark.parametrize("as_dataarray", [True, False])
+def test_gaspari_cohn_localizer(as_dataarray):
+
+    lon, lat = grid_lon_lat()
+
+    if as_dataarray:
+        lon = xr.DataArray(lon, dims="gridpoint")
+        lat = xr.DataArray(lat, dims="gridpoint")
+
+    geodist = geodist_exact(lon, lat)
+    localisation_radii = [1000, 2000, 3000]
+
+    result = GaspariCohnLocalizer(geodist, localisation_radii)
+    expected = gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+
+    assert not result.sparse
+    assert len(result) == 3
+    assert list(result) == localisation_radii
+    assert 2000 in result and 2500 not in result
+
+    # nothing is computed upfront
+    assert len(result._cache) == 0
+
+    assert_dict_allclose(expected, dict(result))
+
+    # only the most recently used matrices are kept
+    assert list(result._cache) == [2000, 3000]
+    assert result[2000] is result[2000]
+    assert list(result._cache) == [3000, 2000]
+
+    with pytest.raises(KeyError):
+        result[2500]
+
+
+def test_gaspari_cohn_localizer_concurrent():
+
+    lon, lat = grid_lon_lat()
+    geodist = geodist_exact(lon, lat)
+
+    result = GaspariCohnLocalizer(geodist, [1000, 2000])
+
+    n_calls = []
+    started = threading.Event()
+    release = threading.Event()
+    compute = result._compute
+
+    def _compute(localisation_radius):
+        n_calls.append(localisation_radius)
+        started.set()
+        release.wait(timeout=10)
+        return compute(localisation_radius)
+
+    result._compute = _compute
+
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(result.__getitem__, 1000) for _ in range(4)]
+
+        # all threads request the matrix while it is being computed
+        started.wait(timeout=10)
+        release.set()
+
+        matrices = [future.result() for future in futures]
+
+    # computed only once and shared
+    assert n_calls == [1000]
+    assert all(matrix is matrices[0] for matrix in matrices)
+    assert not result._pending
+
+
+def test_gaspari_cohn_localizer_concurrent_error():
+
+    lon, lat = grid_lon_lat()
+    geodist = geodist_exact(lon, lat)
+
+    result = GaspariCohnLocalizer(geodist, [1000])
+    compute = result._compute
+
+    def _compute(localisation_radius):
+        raise MemoryError()
+
+    result._compute = _compute
+
+    with pytest.raises(MemoryError):
+        result[1000]
+
+    # the failed computation is not cached
+    assert not result._pending
+    result._compute = compute
+    assert 1000 in dict(result)
+
+
+def test_gaspari_cohn_localizer_maxsize():
+
+    lon, lat = grid_lon_lat()
+    geodist = geodist_exact(lon, lat)
+
+    result = GaspariCohnLocalizer(geodist, [1000, 2000, 3000], maxsize=1)
+
+    result[1000]
+    result[3000]
+    assert list(result._cache) == [3000]
+
+    with pytest.raises(ValueError, match="'maxsize' must be a positive integer"):
+        GaspariCohnLocalizer(geodist, [1000], maxsize=0)
+
+
+def grid_lon_lat():
+
+    lon = np.arange(0, 31, 5)
+    lat = np.arange(-45, 46, 15)
+    lat, lon = np.meshgrid(lat, lon)
+
+    return lon.flatten(), lat.flatten()
+
+
+@pytest.mark.parametrize("max_distance", [100, 1500, 30_000])
+@pytest.mark.parametrize("as_dataarray", [True, False])
+def test_geodist_sparse(max_distance, as_dataarray):
+
+    lon, lat = grid_lon_lat()
+
+    expected = geodist_exact(lon, lat)
+
+    if as_dataarray:
+        lon = xr.DataArray(lon, dims="gridpoint")
+        lat = xr.DataArray(lat, dims="gridpoint")
+
+    result = geodist_sparse(lon, lat, max_distance=max_distance)
+
+    assert isinstance(result, scipy.sparse.csr_array)
+
+    # all pairs closer than max_distance and the diagonal are stored
+    stored = np.zeros(expected.shape, dtype=bool)
+    stored[result.nonzero()] = True
+    stored[np.diag_indices_from(stored)] = True
+
+    np.testing.assert_equal(stored, expected < max_distance)
+    np.testing.assert_equal(result.diagonal(), 0)
+    assert result.nnz == stored.sum()
+
+    np.testing.assert_equal(result.toarray(), np.where(stored, expected, 0))
+
+
+def test_geodist_sparse_errors():
+
+    ds = xr.Dataset()
+
+    with pytest.raises(TypeError, match="Dataset is not supported"):
+        geodist_sparse(ds, ds, max_distance=100)  # type: ignore[arg-type]
+
+    lon = xr.DataArray([0], dims="lon")
+    lat = xr.DataArray([0], dims="lat")
+
+    with pytest.raises(AssertionError, match="lon and lat have different dims"):
+        geodist_sparse(lon, lat, max_distance=100)
+
+    with pytest.raises(ValueError, match="lon and lat must be 1D arrays"):
+        geodist_sparse(np.array([0, 0]), np.array([0]), max_distance=100)
+
+    with pytest.raises(ValueError, match="'max_distance' must be positive"):
+        geodist_sparse(np.array([0]), np.array([0]), max_distance=0)
+
+
+def test_gaspari_cohn_correlation_matrices_sparse():
+
+    localisation_radii = [500, 1000]
+    lon, lat = grid_lon_lat()
+
+    geodist = geodist_sparse(lon, lat, max_distance=2 * max(localisation_radii))
+    result = gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+
+    geodist = geodist_exact(lon, lat)
+    expected = gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+
+    for lr in localisation_radii:
+        assert isinstance(result[lr], scipy.sparse.csr_array)
+        np.testing.assert_equal(result[lr].toarray(), expected[lr])
+
+        # elements beyond 2 x the localisation radius are not stored
+        assert result[lr].nnz == np.count_nonzero(expected[lr])
+
+
+def test_gaspari_cohn_localizer_sparse():
+
+    localisation_radii = [500, 1000]
+    lon, lat = grid_lon_lat()
+
+    geodist = geodist_sparse(lon, lat, max_distance=2 * max(localisation_radii))
+
+    result = GaspariCohnLocalizer(geodist, localisation_radii)
+    expected = gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+
+    assert result.sparse
+
+    for lr in localisation_radii:
+        assert isinstance(result[lr], scipy.sparse.csr_array)
+        np.testing.assert_equal(result[lr].toarray(), expected[lr].toarray())
+
+
 def test_closest_neighbors_errors():
 
     lon = np.array([-180, 0, 3])
@@ -255,3 +552,30 @@ def test_closest_neighbors():
     )
 
     xr.testing.assert_equal(result, expected)
+
+
+def test_closest_neighbors_regular_grid():
+    # many gridpoints have equally distant neighbors
+
+    lon, lat = np.meshgrid(np.arange(0, 360, 30.0), np.arange(-75, 76, 30.0))
+    lon, lat = lon.ravel(), lat.ravel()
+
+    coords = np.deg2rad(np.column_stack([lat, lon]))
+    dist = haversine_distances(coords, coords)
+
+    n = 9
+    expected = np.sort(dist, axis=1)[:, :n]
+
+    lon = xr.DataArray(
+        lon, dims="gridpoint", coords={"lon": ("gridpoint", lon)}, name="lon"
+    )
+    lat = xr.DataArray(
+        lat, dims="gridpoint", coords={"lat": ("gridpoint", lat)}, name="lat"
+    )
+
+    result = closest_neighbors(lon, lat, n)
+
+    np.testing.assert_equal(result.values[:, 0], np.arange(lon.size))
+    np.testing.assert_allclose(
+        np.take_along_axis(dist, result.values, axis=1), expected, atol=1e-12
+    )
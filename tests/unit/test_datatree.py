@@ -6,7 +6,11 @@ import xarray as xr
 
 import mesmer
 from mesmer._core.utils import _check_dataarray_form, _check_dataset_form
-from mesmer.datatree import _datatree_wrapper, map_over_datasets
+from mesmer.datatree import (
+    _datatree_wrapper,
+    _map_over_datasets_concurrently,
+    map_over_datasets,
+)
 from mesmer.testing import trend_data_1D, trend_data_2D
 
 
@@ -581,3 +585,19 @@ def test_map_over_dataset():
     result = map_over_datasets(rename_coords, dt)
     expected = xr.DataTree.from_dict({"node": ds_coords.rename(x="y")})
     xr.testing.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_map_over_datasets_concurrently(max_workers):
+
+    ds = xr.Dataset(data_vars={"data": ("x", [1, 2])})
+    dt = xr.DataTree.from_dict({"a": ds, "b": ds * 2, "b/c": ds * 3, "d": None})
+
+    def add(ds, value, *, factor):
+        return ds * factor + value
+
+    result = _map_over_datasets_concurrently(
+        add, dt, 1, kwargs={"factor": 2}, max_workers=max_workers
+    )
+    expected = map_over_datasets(add, dt, 1, kwargs={"factor": 2})
+    xr.testing.assert_identical(result, expected)
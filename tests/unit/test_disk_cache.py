@@ -0,0 +1,201 @@
+import os
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import mesmer
+from mesmer._core.disk_cache import _cache_key, _cached_array
+
+
+class Compute:
+    def __init__(self, value):
+        self.value = value
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return self.value
+
+
+def test_cache_key():
+
+    arr = np.arange(5.0)
+
+    assert _cache_key(arr, a=1) == _cache_key(arr.copy(), a=1)
+    assert _cache_key(arr, a=1) != _cache_key(arr, a=2)
+    assert _cache_key(arr) != _cache_key(arr.astype("float32"))
+    assert _cache_key(arr) != _cache_key(arr.reshape(5, 1))
+    assert _cache_key(arr) != _cache_key(arr[::-1])
+
+
+def test_cached_array_disabled(tmp_path):
+
+    compute = Compute(np.arange(5.0))
+
+    _cached_array("test", compute, key="key")
+    result = _cached_array("test", compute, key="key")
+
+    assert compute.n_calls == 2
+    assert not isinstance(result, np.memmap)
+    assert not list(tmp_path.iterdir())
+
+
+def test_cached_array(tmp_path):
+
+    compute = Compute(np.arange(5.0))
+    key = _cache_key(name="key")
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        first = _cached_array("test", compute, key=key)
+        second = _cached_array("test", compute, key=key)
+
+    assert compute.n_calls == 1
+    assert isinstance(second, np.memmap)
+    np.testing.assert_array_equal(first, compute.value)
+    np.testing.assert_array_equal(second, compute.value)
+
+    assert [f.name for f in tmp_path.iterdir()] == [f"test-{key}.npy"]
+
+    # modifying the result does not change the cache
+    second[:] = 0
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        third = _cached_array("test", compute, key=key)
+
+    np.testing.assert_array_equal(third, compute.value)
+
+
+def test_cached_array_eviction(tmp_path):
+
+    value = np.arange(100.0)
+    nbytes = os.path.getsize(_save(tmp_path / "size.npy", value))
+    (tmp_path / "size.npy").unlink()
+
+    keys = {name: _cache_key(name=name) for name in "abcd"}
+
+    # files not written by the cache are never removed (nor counted)
+    _save(tmp_path / "my_results.npy", value)
+    _save(tmp_path / f"results-{keys['a'][:-1]}.npy", value)
+
+    with mesmer.set_options(disk_cache_dir=tmp_path, disk_cache_size=2 * nbytes):
+        _cached_array("test", Compute(value), key=keys["a"])
+        _cached_array("test", Compute(value), key=keys["b"])
+
+        # make "b" the least recently used file
+        os.utime(tmp_path / f"test-{keys['b']}.npy", (0, 0))
+        _cached_array("test", Compute(value), key=keys["a"])
+
+        _cached_array("test", Compute(value), key=keys["c"])
+
+    expected = [
+        "my_results.npy",
+        f"results-{keys['a'][:-1]}.npy",
+        f"test-{keys['a']}.npy",
+        f"test-{keys['c']}.npy",
+    ]
+    assert sorted(f.name for f in tmp_path.iterdir()) == sorted(expected)
+
+    # results larger than the cache are not stored
+    with mesmer.set_options(disk_cache_dir=tmp_path, disk_cache_size=nbytes // 2):
+        result = _cached_array("test", Compute(value), key=keys["d"])
+
+    np.testing.assert_array_equal(result, value)
+    assert not (tmp_path / f"test-{keys['d']}.npy").exists()
+
+
+def test_cached_array_write_error(tmp_path, monkeypatch):
+
+    def save(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(np, "save", save)
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        with pytest.raises(OSError, match="disk full"):
+            _cached_array("test", Compute(np.arange(5.0)), key=_cache_key())
+
+    # the temporary file is removed
+    assert not list(tmp_path.iterdir())
+
+
+def _save(filename, value):
+    np.save(filename, value)
+    return filename
+
+
+@pytest.mark.parametrize("as_dataarray", [True, False])
+def test_geodist_exact_cached(tmp_path, as_dataarray):
+
+    lon, lat = np.arange(0, 31, 5.0), np.arange(-30, 1, 5.0)
+
+    if as_dataarray:
+        lon = xr.DataArray(lon, dims="gridpoint")
+        lat = xr.DataArray(lat, dims="gridpoint")
+
+    expected = mesmer.geospatial.geodist_exact(lon, lat)
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        mesmer.geospatial.geodist_exact(lon, lat)
+        result = mesmer.geospatial.geodist_exact(lon, lat)
+        mesmer.geospatial.geodist_exact(lon, lat, dtype="float32")
+
+    assert len(list(tmp_path.glob("geodist-*.npy"))) == 2
+
+    if as_dataarray:
+        xr.testing.assert_identical(result, expected)
+    else:
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_gaspari_cohn_correlation_matrices_cached(tmp_path):
+
+    lon = xr.DataArray(np.arange(0, 31, 5.0), dims="gridpoint")
+    lat = xr.DataArray(np.arange(-30, 1, 5.0), dims="gridpoint")
+
+    geodist = mesmer.geospatial.geodist_exact(lon, lat)
+    localisation_radii = [1000, 2000]
+
+    expected = mesmer.stats.gaspari_cohn_correlation_matrices(
+        geodist, localisation_radii
+    )
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        mesmer.stats.gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+        result = mesmer.stats.gaspari_cohn_correlation_matrices(
+            geodist, localisation_radii
+        )
+        lazy = mesmer.stats.GaspariCohnLocalizer(geodist, localisation_radii)
+        lazy = dict(lazy)
+
+    assert len(list(tmp_path.glob("gaspari_cohn-*.npy"))) == 2
+
+    for lr in localisation_radii:
+        xr.testing.assert_identical(result[lr], expected[lr])
+        xr.testing.assert_identical(lazy[lr], expected[lr])
+
+
+def test_mask_ocean_fraction_cached(tmp_path):
+
+    lon = np.arange(0.5, 10, 2)
+    lat = np.arange(10, -1, -2)
+
+    data = xr.DataArray(
+        np.ones((lat.size, lon.size)),
+        dims=("lat", "lon"),
+        coords={"lon": lon, "lat": lat},
+    )
+
+    # pre-populate the cache such that the land mask is not required
+    fraction = np.zeros((1, lat.size, lon.size))
+    fraction[0, :, :2] = 1
+
+    key = _cache_key(lon, lat, regions="natural_earth_v5_0_0.land_110")
+
+    with mesmer.set_options(disk_cache_dir=tmp_path):
+        _cached_array("land_fraction", lambda: fraction, key=key)
+
+        result = mesmer.mask.mask_ocean_fraction(data, threshold=0.5)
+
+    expected = data.where(data.lon < 4)
+    xr.testing.assert_identical(result, expected)
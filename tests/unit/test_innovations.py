@@ -0,0 +1,491 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import mesmer
+from mesmer._core.utils import LinAlgWarning
+from mesmer.stats import _banded, _innovations
+
+
+@pytest.fixture
+def cache():
+    cache = _innovations._COVARIANCE_FACTOR_CACHE
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def random_covariance(n, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=(n, n))
+    return a @ a.T + np.eye(n)
+
+
+def test_factorize_covariance_np_cholesky():
+
+    covariance = random_covariance(5)
+    factor = _innovations._factorize_covariance_np(covariance)
+
+    np.testing.assert_allclose(factor @ factor.T, covariance)
+    np.testing.assert_equal(factor, np.tril(factor))
+
+
+def test_factorize_covariance_np_eigh():
+
+    covariance = np.diag([2.0, 0.0, 1.0])
+
+    with pytest.warns(
+        LinAlgWarning, match="Covariance matrix is not positive definite"
+    ):
+        factor = _innovations._factorize_covariance_np(covariance)
+
+    np.testing.assert_allclose(factor @ factor.T, covariance)
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_factorize_covariance(ndim):
+
+    covariance = random_covariance(4)
+    dims = ("gridcell_i", "gridcell_j")
+
+    if ndim == 3:
+        covariance = np.stack([covariance, 2 * covariance])
+        dims = ("month",) + dims
+
+    coords = {"gridcell_i": np.arange(4), "gridcell_j": np.arange(4)}
+    covariance = xr.DataArray(covariance, dims=dims, coords=coords)
+
+    result = mesmer.stats.factorize_covariance(covariance)
+
+    assert result.name == "covariance_factor"
+    assert result.dims == covariance.dims
+    xr.testing.assert_equal(result.gridcell_i, covariance.gridcell_i)
+
+    factor = result.values
+    np.testing.assert_allclose(factor @ np.swapaxes(factor, -1, -2), covariance)
+
+
+def test_factorize_covariance_errors():
+
+    with pytest.raises(TypeError, match="Expected covariance to be an xr.DataArray"):
+        mesmer.stats.factorize_covariance(np.eye(2))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="'covariance' must be a square 2D array"):
+        mesmer.stats.factorize_covariance(xr.DataArray(np.ones((2, 3))))
+
+    with pytest.raises(ValueError, match="'covariance' must be a square 2D array"):
+        mesmer.stats.factorize_covariance(xr.DataArray(np.ones(2)))
+
+
+@pytest.mark.parametrize("explained_variance", [0.5, 0.9, 1.0])
+def test_factorize_covariance_low_rank(explained_variance):
+
+    covariance = random_covariance(6)
+    coords = {"gridcell_i": np.arange(6), "gridcell_j": np.arange(6)}
+    covariance = xr.DataArray(
+        covariance, dims=("gridcell_i", "gridcell_j"), coords=coords
+    )
+
+    result = mesmer.stats.factorize_covariance(
+        covariance, explained_variance=explained_variance
+    )
+
+    assert result.name == "covariance_factor"
+    assert result.dims == ("gridcell_i", "eof")
+    np.testing.assert_equal(result.gridcell_i.values, covariance.gridcell_i.values)
+
+    w = np.linalg.eigvalsh(covariance)[::-1]
+    n_eofs = result.sizes["eof"]
+
+    # the smallest number of eofs that explain explained_variance
+    explained = w[:n_eofs].sum() / w.sum()
+    assert explained >= explained_variance - 1e-12
+    assert n_eofs == 1 or w[: n_eofs - 1].sum() / w.sum() < explained_variance
+    np.testing.assert_allclose(result.attrs["explained_variance"], explained)
+
+    approx = result.values @ result.values.T + np.diag(result.residual_std.values**2)
+
+    # the variances are exact
+    np.testing.assert_allclose(np.diag(approx), np.diag(covariance))
+
+    error = np.linalg.norm(approx - covariance) / np.linalg.norm(covariance)
+    np.testing.assert_allclose(result.attrs["approximation_error"], error, atol=1e-12)
+
+    if explained_variance == 1.0:
+        np.testing.assert_allclose(approx, covariance)
+
+
+def test_factorize_covariance_low_rank_errors():
+
+    with pytest.raises(ValueError, match="'explained_variance' requires a square 2D"):
+        mesmer.stats.factorize_covariance(
+            xr.DataArray(np.ones((2, 2, 2))), explained_variance=0.9
+        )
+
+    for explained_variance in (0, 1.1):
+        with pytest.raises(ValueError, match="'explained_variance' must be in the"):
+            mesmer.stats.factorize_covariance(
+                xr.DataArray(np.eye(2)), explained_variance=explained_variance
+            )
+
+
+def test_draw_innovations_direct_np_low_rank():
+
+    covariance = random_covariance(5)
+    factor = _innovations._factorize_covariance_low_rank_np(covariance, 0.9)
+
+    out = np.empty((200_000, 5))
+    _innovations._draw_innovations_direct_np(factor, np.random.default_rng(0), out)
+
+    expected = factor.covariance()
+    np.testing.assert_allclose(np.cov(out, rowvar=False), expected, atol=0.2)
+    np.testing.assert_allclose(out.var(axis=0), np.diag(covariance), rtol=0.02)
+
+
+def test_covariance_factor_cache(cache):
+
+    covariance = random_covariance(5)
+
+    factor = _innovations._get_covariance_factor_np(covariance)
+    assert len(cache) == 1
+    assert not factor.flags.writeable
+
+    # cache hit returns the same object - also for an equal copy
+    assert _innovations._get_covariance_factor_np(covariance.copy()) is factor
+    assert len(cache) == 1
+
+    np.testing.assert_equal(factor, _innovations._factorize_covariance_np(covariance))
+
+    # different content, different entry
+    other = _innovations._get_covariance_factor_np(covariance * 2)
+    assert other is not factor
+    assert len(cache) == 2
+
+
+def test_covariance_factor_cache_lru(cache):
+
+    covariances = [random_covariance(5, seed) for seed in range(3)]
+    nbytes = covariances[0].nbytes
+
+    with mesmer.set_options(covariance_cache_size=2 * nbytes):
+        factor0 = _innovations._get_covariance_factor_np(covariances[0])
+        _innovations._get_covariance_factor_np(covariances[1])
+
+        # mark 0 as recently used, so that 1 is evicted
+        _innovations._get_covariance_factor_np(covariances[0])
+        _innovations._get_covariance_factor_np(covariances[2])
+
+        assert len(cache) == 2
+        assert _innovations._get_covariance_factor_np(covariances[0]) is factor0
+
+        keys = {cache._key(cov) for cov in covariances}
+        assert set(cache._cache) == keys - {cache._key(covariances[1])}
+
+
+def test_covariance_factor_cache_disabled(cache):
+
+    covariance = random_covariance(5)
+
+    with mesmer.set_options(covariance_cache_size=0):
+        factor = _innovations._get_covariance_factor_np(covariance)
+
+    assert len(cache) == 0
+    assert factor.flags.writeable
+
+
+def test_covariance_factor_cache_too_large(cache):
+
+    covariance = random_covariance(5)
+
+    with mesmer.set_options(covariance_cache_size=covariance.nbytes - 1):
+        _innovations._get_covariance_factor_np(covariance)
+
+    assert len(cache) == 0
+
+
+def test_covariance_factor_cache_warns_on_hit(cache):
+
+    covariance = np.diag([2.0, 0.0, 1.0])
+
+    for _ in range(2):
+        with pytest.warns(LinAlgWarning, match="not positive definite"):
+            _innovations._get_covariance_factor_np(covariance)
+
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("triangular", [True, False])
+def test_draw_innovations_direct_np(dtype, triangular):
+
+    covariance = random_covariance(4)
+    factor = np.linalg.cholesky(covariance)
+
+    if not triangular:
+        w, v = np.linalg.eigh(covariance)
+        factor = v * np.sqrt(w)
+
+    out = np.empty((3, 5, 4), dtype=dtype)
+    result = _innovations._draw_innovations_direct_np(
+        factor, np.random.default_rng(0), out
+    )
+
+    assert result is out
+    assert result.dtype == dtype
+
+    # same standard normal numbers, multiplied with the factor
+    expected = np.random.default_rng(0).standard_normal(size=(3, 5, 4), dtype=dtype)
+    expected = expected @ factor.astype(dtype).T
+
+    rtol = 1e-5 if dtype == np.float32 else 1e-12
+    np.testing.assert_allclose(result, expected, rtol=rtol)
+
+
+def test_is_lower_triangular():
+
+    factor = np.linalg.cholesky(random_covariance(5))
+    assert _innovations._is_lower_triangular(factor)
+
+    factor[1, 3] = 1e-300
+    assert not _innovations._is_lower_triangular(factor)
+
+    assert _innovations._is_lower_triangular(np.ones((1, 1)))
+
+
+def test_covariance_factor_cache_return_lower(cache):
+
+    covariance = random_covariance(5)
+
+    for _ in range(2):
+        factor, lower = _innovations._get_covariance_factor_np(
+            covariance, return_lower=True
+        )
+        assert lower is True
+
+    covariance = np.diag([2.0, 0.0, 1.0])
+
+    with pytest.warns(LinAlgWarning, match="not positive definite"):
+        factor, lower = _innovations._get_covariance_factor_np(
+            covariance, return_lower=True
+        )
+
+    assert lower is False
+
+    with mesmer.set_options(covariance_cache_size=0):
+        factor, lower = _innovations._get_covariance_factor_np(
+            random_covariance(5), return_lower=True
+        )
+
+    assert lower is True
+
+
+@pytest.mark.parametrize("lower", [None, True, False])
+def test_colorize_inplace_np_lower(lower):
+
+    factor = np.linalg.cholesky(random_covariance(4))
+    x = np.random.default_rng(0).standard_normal(size=(7, 4))
+
+    expected = x @ factor.T
+
+    # the flag selects the algorithm, the result is the same
+    _innovations._colorize_inplace_np(factor, x, block_size=3, lower=lower)
+
+    np.testing.assert_allclose(x, expected, rtol=1e-12)
+
+
+def test_draw_innovations_direct_np_covariance():
+
+    covariance = random_covariance(3)
+    factor = _innovations._factorize_covariance_np(covariance)
+
+    out = np.empty((100_000, 3))
+    _innovations._draw_innovations_direct_np(factor, np.random.default_rng(0), out)
+
+    np.testing.assert_allclose(np.cov(out, rowvar=False), covariance, rtol=0.02)
+
+
+def test_draw_innovations_direct_np_errors():
+
+    factor = np.eye(3)
+    rng = np.random.default_rng(0)
+
+    with pytest.raises(ValueError, match="'out' must be C-contiguous"):
+        _innovations._draw_innovations_direct_np(factor, rng, np.empty((2, 4)))
+
+    with pytest.raises(ValueError, match="'out' must be C-contiguous"):
+        _innovations._draw_innovations_direct_np(factor, rng, np.empty((3, 2)).T)
+
+
+def test_check_sampler_and_dtype():
+
+    assert _innovations._check_sampler_and_dtype("compat", "float64") == np.float64
+    assert _innovations._check_sampler_and_dtype("direct", "float32") == np.float32
+
+    with pytest.raises(ValueError, match="'sampler' must be one of"):
+        _innovations._check_sampler_and_dtype("foo", "float64")
+
+    with pytest.raises(ValueError, match="'dtype' must be float32 or float64"):
+        _innovations._check_sampler_and_dtype("direct", "int64")
+
+    with pytest.raises(ValueError, match="sampler='compat' only supports"):
+        _innovations._check_sampler_and_dtype("compat", "float32")
+
+
+@pytest.mark.parametrize("chunks", [[10], [1, 9], [3, 3, 4], [0, 7, 3]])
+@pytest.mark.parametrize("low_rank", [False, True])
+def test_tiled_innovations_chunks(chunks, low_rank):
+
+    covariance = random_covariance(3)
+
+    if low_rank:
+        factor = _innovations._factorize_covariance_low_rank_np(covariance, 0.8)
+    else:
+        factor = np.linalg.cholesky(covariance)
+
+    keys = [(0,), (5,)]
+
+    expected = np.empty((2, 10, 3))
+    _innovations._TiledInnovations(factor, 0, keys, np.float64, tile_size=4).fill(
+        expected
+    )
+
+    tiled = _innovations._TiledInnovations(factor, 0, keys, np.float64, tile_size=4)
+    result = np.concatenate(
+        [tiled.fill(np.empty((2, chunk, 3))) for chunk in chunks], axis=1
+    )
+
+    np.testing.assert_equal(result, expected)
+
+    # a realisation does not depend on the others
+    single = np.empty((1, 10, 3))
+    tiled = _innovations._TiledInnovations(factor, 0, keys[1:], np.float64, 4)
+    tiled.fill(single)
+
+    np.testing.assert_equal(single[0], expected[1])
+
+
+@pytest.mark.parametrize("start", [0, 3, 4, 9])
+def test_tiled_innovations_start(start):
+
+    factor = np.linalg.cholesky(random_covariance(3))
+    keys = [(0,), (5,)]
+
+    expected = np.empty((2, 12, 3))
+    _innovations._TiledInnovations(factor, 0, keys, np.float64, tile_size=4).fill(
+        expected
+    )
+
+    tiled = _innovations._TiledInnovations(
+        factor, 0, keys, np.float64, tile_size=4, start=start
+    )
+    result = tiled.fill(np.empty((2, 12 - start, 3)))
+
+    np.testing.assert_equal(result, expected[:, start:])
+
+
+@pytest.mark.parametrize("lower", [True, False])
+def test_tiled_innovations_memory(lower):
+
+    factor = np.linalg.cholesky(random_covariance(100))
+    if not lower:
+        factor = factor.T.copy()
+
+    keys = [(0,), (1,)]
+    out = np.empty((2, 10_000, 100))
+
+    tiled = _innovations._TiledInnovations(factor, 0, keys, np.float64)
+
+    tracemalloc.start()
+    try:
+        tiled.fill(out)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # the tiles are drawn directly into out, no buffer of the size of out is needed
+    assert peak < out.nbytes / 4
+
+
+def test_tiled_innovations_keys():
+
+    factor = np.eye(2)
+    keys = [(0,), (1,), (0, 0)]
+
+    out = np.empty((3, 8, 2))
+    _innovations._TiledInnovations(factor, 0, keys, np.float64, tile_size=4).fill(out)
+
+    # different keys and tiles yield different random numbers
+    assert np.not_equal(out[0], out[1]).all()
+    assert np.not_equal(out[0], out[2]).all()
+    assert np.not_equal(out[0, :4], out[0, 4:]).all()
+
+    # the streams are derived from the seed sequence
+    expected = np.random.default_rng(np.random.SeedSequence(0, spawn_key=(1, 1)))
+    np.testing.assert_equal(out[1, 4:], expected.standard_normal((4, 2)))
+
+
+def test_realisation_stream_keys():
+
+    np.testing.assert_equal(_innovations._realisation_stream_keys(3, 3), [0, 1, 2])
+
+    keys = _innovations._realisation_stream_keys(xr.DataArray([5, 2]), 2)
+    np.testing.assert_equal(keys, [5, 2])
+
+    with pytest.raises(ValueError, match="must be non-negative integers"):
+        _innovations._realisation_stream_keys(xr.DataArray([-1, 2]), 2)
+
+    with pytest.raises(ValueError, match="must be non-negative integers"):
+        _innovations._realisation_stream_keys(xr.DataArray([0.0, 2.0]), 2)
+
+
+def random_banded_covariance(seed=0):
+
+    localizer = mesmer.stats.gaspari_cohn_correlation_matrices(
+        mesmer.geospatial.geodist_sparse(
+            np.arange(0, 21, 5.0), np.zeros(5), max_distance=1200
+        ),
+        [600],
+    )[600]
+    permutation, n_bands = _banded._band_permutation(localizer)
+
+    covariance = localizer * random_covariance(5, seed)
+    covariance = _banded._sparse_to_banded(covariance, permutation, n_bands)
+
+    return _banded._banded_to_dataarray(covariance, "cells")
+
+
+def test_factorize_covariance_banded():
+
+    covariance = random_banded_covariance()
+
+    result = mesmer.stats.factorize_covariance(covariance)
+
+    assert result.name == "covariance_factor"
+    assert result.dims == covariance.dims
+    xr.testing.assert_equal(result.band_order, covariance.band_order)
+
+    factor = _banded._banded_from_dataarray(result, triangular=True).toarray()
+    expected = _banded._banded_from_dataarray(covariance).toarray()
+
+    np.testing.assert_allclose(factor @ factor.T, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_colorize_inplace_np_banded(dtype):
+
+    covariance = random_banded_covariance()
+    factor = _banded._banded_from_dataarray(covariance).cholesky()
+
+    x = np.random.default_rng(0).standard_normal(size=(7, 5)).astype(dtype)
+
+    # the standard normal numbers are used in the banded order
+    expected = np.empty_like(x)
+    expected[:, factor.permutation] = x
+    expected = expected @ factor.toarray().astype(dtype).T
+
+    _innovations._colorize_inplace_np(factor, x, block_size=3)
+
+    rtol = 1e-5 if dtype == np.float32 else 1e-12
+    np.testing.assert_allclose(x, expected, rtol=rtol)
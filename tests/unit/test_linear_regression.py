@@ -1,3 +1,4 @@
+import functools
 from unittest import mock
 
 import numpy as np
@@ -887,6 +888,30 @@ def test_linear_regression_weights(lr_method_or_function, intercept, data_type):
     xr.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("as_2D", [True, False])
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_linear_regression_method(as_2D, fit_intercept):
+
+    pred0 = trend_data_1D(slope=1, scale=0.5)
+    pred1 = trend_data_1D(slope=-0.5, scale=1)
+    tgt = trend_data_1D_or_2D(as_2D=as_2D, slope=2, scale=0.3, intercept=1)
+    weights = trend_data_1D(intercept=1, slope=0.1, scale=0)
+
+    predictors = {"pred0": pred0, "pred1": pred1}
+
+    result = LinearRegression_fit_wrapper(
+        predictors, tgt, "time", weights, fit_intercept, method="numpy"
+    )
+    expected = LinearRegression_fit_wrapper(
+        predictors, tgt, "time", weights, fit_intercept, method="sklearn"
+    )
+
+    xr.testing.assert_allclose(result, expected)
+
+    with pytest.raises(ValueError, match="'method' must be one of"):
+        LinearRegression_fit_wrapper(predictors, tgt, "time", method="foo")
+
+
 # TEST NUMPY FUNCTION
 
 
@@ -1088,3 +1113,119 @@ def test_linear_regression_np(predictors, target, weight, fit_intercept):
     intercepts = np.atleast_2d(mock_regressor.intercept_).T
     coefficients = np.atleast_2d(mock_regressor.coef_)
     npt.assert_allclose(res, np.hstack([intercepts, coefficients]))
+
+
+@pytest.mark.parametrize("target_shape", [(30,), (30, 1), (30, 5)])
+@pytest.mark.parametrize("with_weights", [True, False])
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_linear_regression_batched_np(target_shape, with_weights, fit_intercept):
+
+    rng = np.random.default_rng(0)
+
+    predictors = rng.normal(size=(30, 2)) + [10, -100]
+    target = rng.normal(size=target_shape)
+    weights = rng.uniform(0.5, 2, size=30) if with_weights else None
+
+    result = mesmer.stats._linear_regression._fit_linear_regression_batched_np(
+        predictors, target, weights, fit_intercept
+    )
+    expected = mesmer.stats._linear_regression._fit_linear_regression_np(
+        predictors, target, weights, fit_intercept
+    )
+
+    npt.assert_allclose(result, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("offset", [0, 1])
+def test_linear_regression_batched_np_collinear(offset):
+
+    rng = np.random.default_rng(0)
+
+    pred = rng.normal(size=(30, 1))
+    # affine collinear predictors are only collinear after centering
+    predictors = np.hstack([pred, 3 * pred + offset])
+    target = rng.normal(size=(30, 2)) + pred
+
+    result = mesmer.stats._linear_regression._fit_linear_regression_batched_np(
+        predictors, target
+    )
+    expected = mesmer.stats._linear_regression._fit_linear_regression_np(
+        predictors, target
+    )
+
+    npt.assert_allclose(result, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("noise", [1e-5, 1e-7, 1e-9])
+def test_linear_regression_batched_np_nearly_collinear(noise):
+
+    rng = np.random.default_rng(0)
+
+    pred = rng.normal(size=(500, 1))
+    predictors = np.hstack([pred, 3 * pred + 1 + noise * rng.normal(size=(500, 1))])
+    target = 288 + rng.normal(size=(500, 3)) + pred
+    weights = rng.uniform(0.5, 2, size=500)
+
+    result = mesmer.stats._linear_regression._fit_linear_regression_batched_np(
+        predictors, target, weights
+    )
+    expected = mesmer.stats._linear_regression._fit_linear_regression_np(
+        predictors, target, weights
+    )
+
+    def weighted_rss(params):
+        residuals = target - params[:, 0] - predictors @ params[:, 1:].T
+        return (weights[:, np.newaxis] * residuals**2).sum()
+
+    # the coefficients are ill-determined, but the fit must be as good as sklearn's
+    assert weighted_rss(result) <= weighted_rss(expected) * (1 + 1e-8)
+
+
+@pytest.mark.parametrize("block_size", [2, 4096])
+def test_linear_regression_batched_np_float32(block_size, monkeypatch):
+
+    rng = np.random.default_rng(0)
+
+    predictors = rng.normal(size=(30, 2))
+    target = (288 + rng.normal(size=(30, 5))).astype(np.float32)
+
+    func = mesmer.stats._linear_regression._matmul_float64
+    monkeypatch.setattr(
+        mesmer.stats._linear_regression,
+        "_matmul_float64",
+        functools.partial(func, block_size=block_size),
+    )
+
+    result = mesmer.stats._linear_regression._fit_linear_regression_batched_np(
+        predictors, target
+    )
+    expected = mesmer.stats._linear_regression._fit_linear_regression_np(
+        predictors, target.astype(float)
+    )
+
+    # the cross product is accumulated in float64
+    assert result.dtype == np.float64
+    npt.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_linear_regression_batched_np_errors():
+
+    func = mesmer.stats._linear_regression._fit_linear_regression_batched_np
+
+    with pytest.raises(ValueError, match="Expected 2D predictors, got 1D"):
+        func([1, 2, 3], [1, 2, 3])
+
+    with pytest.raises(ValueError, match="inconsistent numbers of samples: 3 vs. 2"):
+        func([[1], [2], [3]], [1, 2])
+
+    with pytest.raises(ValueError, match=r"weights have shape \(2,\), expected \(3,\)"):
+        func([[1], [2], [3]], [1, 2, 2], [1, 10])
+
+    with pytest.raises(ValueError, match="predictors and weights must not contain NaN"):
+        func([[1], [np.nan], [3]], [1, 2, 2])
+
+    with pytest.raises(ValueError, match="predictors and weights must not contain NaN"):
+        func([[1], [2], [3]], [1, 2, 2], [1, np.inf, 1])
+
+    with pytest.raises(ValueError, match="target must not contain NaN"):
+        func([[1], [2], [3]], [[1, 1], [2, np.nan], [2, 3]])
@@ -1,15 +1,28 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import pytest
+import scipy.stats
 import xarray as xr
 
 import mesmer
-from mesmer._core.utils import LinAlgWarning, _check_dataarray_form
+from mesmer._core.utils import LinAlgWarning, OptimizeWarning, _check_dataarray_form
+from mesmer.stats._banded import (
+    _band_permutation,
+    _banded_covariance_np,
+    _banded_from_dataarray,
+    _banded_to_dataarray,
+    _sparse_to_banded,
+)
 from mesmer.stats._localized_covariance import (
     _adjust_ecov_ar1_np,
     _ecov_crossvalidation,
     _find_localized_empirical_covariance_np,
+    _FoldCovariances,
     _get_neg_loglikelihood,
+    _get_neg_loglikelihood_banded,
 )
 
 
@@ -132,6 +145,205 @@ def test_find_localized_empirical_covariance():
     )
 
 
+@pytest.mark.filterwarnings("ignore:First element is local minimum.")
+@pytest.mark.parametrize("k_folds", [2, 3, 8])
+def test_find_localized_empirical_covariance_bracketing(k_folds):
+
+    data = get_random_data(20, 3)
+    localizer = get_localizer_dict(3, as_dataarray=True)
+    weights = get_weights(20)
+
+    expected = mesmer.stats.find_localized_empirical_covariance(
+        data, weights, localizer, dim="time", k_folds=k_folds
+    )
+    result = mesmer.stats.find_localized_empirical_covariance(
+        data,
+        weights,
+        localizer,
+        dim="time",
+        k_folds=k_folds,
+        radius_search="bracketing",
+    )
+
+    xr.testing.assert_allclose(result, expected)
+
+    attrs = result.localization_radius.attrs
+    n_evaluations_linear = min(int(expected.localization_radius) + 2, len(localizer))
+    assert attrs["n_evaluations"] + attrs["n_evaluations_saved"] == n_evaluations_linear
+
+
+@pytest.mark.parametrize("sparse", [True, False])
+@pytest.mark.parametrize("radius_search", ["linear", "bracketing"])
+def test_find_localized_empirical_covariance_lazy_localizer(sparse, radius_search):
+
+    localisation_radii = list(range(250, 2001, 250))
+
+    lon, lat = get_lon_lat()
+
+    if sparse:
+        max_distance = 2 * max(localisation_radii)
+        geodist = mesmer.geospatial.geodist_sparse(lon, lat, max_distance=max_distance)
+    else:
+        geodist = mesmer.geospatial.geodist_exact(lon, lat)
+
+    localizer = mesmer.stats.gaspari_cohn_correlation_matrices(
+        geodist, localisation_radii
+    )
+    lazy_localizer = mesmer.stats.GaspariCohnLocalizer(geodist, localisation_radii)
+
+    # record the computed matrices
+    computed = []
+    compute = lazy_localizer._compute
+
+    def _compute(localisation_radius):
+        computed.append(localisation_radius)
+        return compute(localisation_radius)
+
+    lazy_localizer._compute = _compute
+
+    data = get_random_data(40, lon.size)
+    weights = get_weights(40)
+
+    kwargs = dict(dim="time", k_folds=5, radius_search=radius_search)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", OptimizeWarning)
+        expected = mesmer.stats.find_localized_empirical_covariance(
+            data, weights, localizer, **kwargs
+        )
+        result = mesmer.stats.find_localized_empirical_covariance(
+            data, weights, lazy_localizer, **kwargs
+        )
+
+    xr.testing.assert_allclose(result, expected)
+
+    # not all matrices are computed, also not for the banded localizer
+    assert len(set(computed)) < len(localisation_radii)
+
+
+def test_find_localized_empirical_covariance_radius_search_error():
+
+    data = get_random_data(20, 3)
+    localizer = get_localizer_dict(3, as_dataarray=True)
+    weights = get_weights(20)
+
+    with pytest.raises(ValueError, match="'radius_search' must be 'linear' or"):
+        mesmer.stats.find_localized_empirical_covariance(
+            data, weights, localizer, dim="time", k_folds=2, radius_search="ternary"
+        )
+
+
+def get_lon_lat():
+
+    lon = np.arange(0, 21, 5)
+    lat = np.arange(-10, 11, 5)
+    lat, lon = np.meshgrid(lat, lon)
+
+    return lon.flatten(), lat.flatten()
+
+
+def get_gaspari_cohn_localizer(localisation_radii, sparse):
+
+    lon, lat = get_lon_lat()
+
+    if sparse:
+        max_distance = 2 * max(localisation_radii)
+        geodist = mesmer.geospatial.geodist_sparse(lon, lat, max_distance=max_distance)
+    else:
+        geodist = mesmer.geospatial.geodist_exact(lon, lat)
+
+    return mesmer.stats.gaspari_cohn_correlation_matrices(geodist, localisation_radii)
+
+
+@pytest.mark.filterwarnings("ignore:First element is local minimum.")
+@pytest.mark.filterwarnings("ignore:No local minimum found")
+@pytest.mark.parametrize("localisation_radii", ([500, 1000, 2000], [300]))
+def test_find_localized_empirical_covariance_sparse(localisation_radii):
+
+    localizer = get_gaspari_cohn_localizer(localisation_radii, sparse=False)
+    localizer_sparse = get_gaspari_cohn_localizer(localisation_radii, sparse=True)
+
+    n_gridpoints = localizer[localisation_radii[0]].shape[0]
+
+    data = get_random_data(30, n_gridpoints)
+    weights = get_weights(30)
+
+    expected = mesmer.stats.find_localized_empirical_covariance(
+        data, weights, localizer, dim="time", k_folds=5
+    )
+    result = mesmer.stats.find_localized_empirical_covariance(
+        data, weights, localizer_sparse, dim="time", k_folds=5
+    )
+
+    assert result.localization_radius == expected.localization_radius
+
+    for name in ("covariance", "localized_covariance"):
+        _check_dataarray_form(
+            result[name],
+            name,
+            ndim=2,
+            required_dims={"band", "cell"},
+            required_coords="band_order",
+        )
+
+    localized_covariance = _banded_from_dataarray(result.localized_covariance)
+    np.testing.assert_allclose(
+        localized_covariance.toarray(), expected.localized_covariance, atol=1e-14
+    )
+
+    # the empirical covariance is only computed within the bands
+    covariance = _banded_from_dataarray(result.covariance).toarray()
+    within_bands = covariance != 0
+    np.testing.assert_allclose(
+        covariance[within_bands], expected.covariance.values[within_bands]
+    )
+
+
+def test_banded_covariance_np():
+
+    localizer = get_gaspari_cohn_localizer([1000], sparse=True)[1000]
+    permutation, n_bands = _band_permutation(localizer)
+
+    data = get_random_data(20, localizer.shape[0]).values[:, permutation]
+    weights = np.random.default_rng(0).uniform(0.5, 1.5, 20)
+
+    result = _banded_covariance_np(data, weights, n_bands)
+
+    expected = np.cov(data, rowvar=False, aweights=weights)
+    for k in range(n_bands):
+        np.testing.assert_allclose(
+            result[k, : data.shape[1] - k], np.diag(expected, -k)
+        )
+
+
+@pytest.mark.parametrize("weights", (np.ones(5), np.array([0.5, 0.2, 0.3, 0.7, 1])))
+def test_get_neg_loglikelihood_banded(weights):
+
+    localizer = get_gaspari_cohn_localizer([1000], sparse=True)[1000]
+    permutation, n_bands = _band_permutation(localizer)
+
+    localizer = _sparse_to_banded(localizer, permutation, n_bands)
+    data = get_random_data(5, localizer.shape[0]).values[:, permutation]
+
+    bands = localizer.bands * _banded_covariance_np(data, np.ones(5), n_bands)
+    covariance = localizer._replace(bands=bands).toarray()
+
+    result = _get_neg_loglikelihood_banded(data, bands, weights)
+
+    data = data[:, np.argsort(permutation)]
+    expected = _get_neg_loglikelihood(data, covariance, weights)
+
+    np.testing.assert_allclose(result, expected)
+
+
+def test_get_neg_loglikelihood_banded_singular():
+
+    bands = np.array([[1.0, 1.0], [1.0, 0.0]])
+
+    with pytest.raises(np.linalg.LinAlgError):
+        _get_neg_loglikelihood_banded(np.ones((2, 2)), bands, np.ones(2))
+
+
 @pytest.mark.filterwarnings("ignore:First element is local minimum.")
 @pytest.mark.parametrize("stack", (False, True))
 def test_find_localized_empirical_covariance_monthly(stack):
@@ -179,6 +391,16 @@ def test_find_localized_empirical_covariance_monthly(stack):
         result.localized_covariance, "localized_covariance", **required_form
     )
 
+    # bracketing search reports the evaluations summed over all months
+    expected = result
+    result = mesmer.stats.find_localized_empirical_covariance_monthly(
+        data.T, weights, localizer, dim="time", k_folds=3, radius_search="bracketing"
+    )
+
+    xr.testing.assert_allclose(result, expected)
+    attrs = result.localization_radius.attrs
+    assert attrs["n_evaluations"] + attrs["n_evaluations_saved"] == 12 * 2
+
     # ensure can pass equal_dim_suffixes
     result = mesmer.stats.find_localized_empirical_covariance_monthly(
         data,
@@ -331,6 +553,107 @@ def test_ecov_crossvalidation_singular(random_data_5x3):
     np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("weights", [None, [0.5, 0.5, 0.5, 1, 1, 2, 1, 0.1]])
+@pytest.mark.parametrize("k_folds", [2, 3, 8])
+def test_fold_covariances(weights, k_folds):
+
+    data = get_random_data(8, 4).values
+    weights = np.ones(8) if weights is None else np.array(weights)
+
+    fold_covariances = _FoldCovariances(data, weights, k_folds, max_nbytes=2**20)
+
+    for it in range(k_folds):
+        sel = np.ones(8, dtype=bool)
+        sel[it::k_folds] = False
+
+        expected = np.cov(data[sel], rowvar=False, aweights=weights[sel])
+        np.testing.assert_allclose(fold_covariances[it], expected)
+
+    assert len(fold_covariances._cache) == k_folds
+
+
+def test_fold_covariances_banded():
+
+    data = get_random_data(8, 5).values
+    weights = get_weights(8).values
+
+    fold_covariances = _FoldCovariances(data, weights, 3, 2**20, n_bands=2)
+
+    sel = np.ones(8, dtype=bool)
+    sel[1::3] = False
+
+    expected = _banded_covariance_np(data[sel], weights[sel], 2)
+    np.testing.assert_allclose(fold_covariances[1], expected)
+
+
+def test_fold_covariances_budget():
+
+    data = get_random_data(8, 4).values
+    weights = np.ones(8)
+
+    # the scatter matrix and one covariance matrix
+    max_nbytes = 2 * 4 * 4 * data.itemsize
+    fold_covariances = _FoldCovariances(data, weights, 3, max_nbytes)
+
+    first = fold_covariances[0]
+    fold_covariances[1]
+
+    assert list(fold_covariances._cache) == [0]
+    assert fold_covariances[0] is first
+    np.testing.assert_allclose(fold_covariances[1], fold_covariances[1])
+
+    # not even one matrix fits
+    with mesmer.set_options(crossvalidation_cache_size=0):
+        assert _FoldCovariances.from_options(data, weights, 3) is None
+
+    with mesmer.set_options(crossvalidation_cache_size=max_nbytes):
+        assert _FoldCovariances.from_options(data, weights, 3) is not None
+
+
+@pytest.mark.parametrize("k_folds", [2, 5])
+def test_ecov_crossvalidation_fold_covariances(random_data_5x3, k_folds):
+
+    weights = np.array([0.5, 0.5, 0.5, 1, 1])
+
+    np.random.seed(0)
+    loc = np.random.uniform(size=(3, 3))
+    loc = loc * loc.T
+    loc[np.diag_indices(3)] = 1
+    localizer = {250: loc}
+
+    expected = _ecov_crossvalidation(
+        250, data=random_data_5x3, weights=weights, localizer=localizer, k_folds=k_folds
+    )
+
+    fold_covariances = _FoldCovariances(random_data_5x3, weights, k_folds, 2**20)
+    result = _ecov_crossvalidation(
+        250,
+        data=random_data_5x3,
+        weights=weights,
+        localizer=localizer,
+        k_folds=k_folds,
+        fold_covariances=fold_covariances,
+    )
+
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.filterwarnings("ignore:First element is local minimum.")
+@pytest.mark.parametrize("cache_size", [0, 2**30])
+def test_find_localized_empirical_covariance_np_cache_size(cache_size):
+
+    data = get_random_data(20, 3).values
+    localizer = get_localizer_dict(3, as_dataarray=False)
+    weights = get_weights(20).values
+
+    with mesmer.set_options(crossvalidation_cache_size=cache_size):
+        result, __, __ = _find_localized_empirical_covariance_np(
+            data, weights, localizer, k_folds=8
+        )
+
+    assert result == 6
+
+
 def test_get_neg_loglikelihood(random_data_5x3):
 
     covariance = np.cov(random_data_5x3, rowvar=False)
@@ -346,6 +669,137 @@ def test_get_neg_loglikelihood(random_data_5x3):
     np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("use_fold_covariances", [True, False])
+def test_ecov_crossvalidation_executor(use_fold_covariances):
+
+    data = get_random_data(20, 4).values
+    weights = get_weights(20).values
+    localizer = get_localizer_dict(4, as_dataarray=False)
+
+    fold_covariances = None
+    if use_fold_covariances:
+        fold_covariances = _FoldCovariances(data, weights, 6, max_nbytes=2**20)
+
+    kwargs = dict(
+        data=data,
+        weights=weights,
+        localizer=localizer,
+        k_folds=6,
+        fold_covariances=fold_covariances,
+    )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for radius in localizer:
+            expected = _ecov_crossvalidation(radius, **kwargs)
+            result = _ecov_crossvalidation(radius, executor=executor, **kwargs)
+
+            np.testing.assert_allclose(result, expected)
+
+
+def test_ecov_crossvalidation_executor_singular(random_data_5x3):
+
+    weights = np.array([1, 1, 1, 1, 1])
+    localizer = {250: np.ones((3, 3))}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.warns(LinAlgWarning, match="Singular matrix"):
+            result = _ecov_crossvalidation(
+                250,
+                data=random_data_5x3,
+                weights=weights,
+                localizer=localizer,
+                k_folds=2,
+                executor=executor,
+            )
+
+    assert result == float("inf")
+
+
+@pytest.mark.filterwarnings("ignore:First element is local minimum.")
+@pytest.mark.parametrize("radius_search", ["linear", "bracketing"])
+def test_find_localized_empirical_covariance_monthly_workers(radius_search):
+
+    n_samples = 10 * 12
+    time = pd.date_range("2000-01-01", periods=n_samples, freq="MS")
+
+    data = get_random_data(n_samples, 6).assign_coords({"time": time})
+    weights = get_weights(n_samples).assign_coords({"time": time})
+    localizer = get_localizer_dict(6, as_dataarray=False)
+
+    expected = mesmer.stats.find_localized_empirical_covariance_monthly(
+        data, weights, localizer, dim="time", k_folds=5, radius_search=radius_search
+    )
+
+    with mesmer.set_options(crossvalidation_workers=4):
+        result = mesmer.stats.find_localized_empirical_covariance_monthly(
+            data, weights, localizer, dim="time", k_folds=5, radius_search=radius_search
+        )
+
+    xr.testing.assert_allclose(result, expected)
+    assert result.localization_radius.attrs == expected.localization_radius.attrs
+
+    # the options are restored
+    assert mesmer._core.options.OPTIONS["crossvalidation_workers"] == 1
+    assert mesmer._core.options.OPTIONS["crossvalidation_cache_size"] == 2**30
+
+
+@pytest.mark.filterwarnings("ignore:First element is local minimum.")
+@pytest.mark.parametrize("k_folds", [3, 8])
+def test_find_localized_empirical_covariance_np_workers(k_folds):
+
+    data = get_random_data(20, 3).values
+    localizer = get_localizer_dict(3, as_dataarray=False)
+    weights = get_weights(20).values
+
+    expected = _find_localized_empirical_covariance_np(
+        data, weights, localizer, k_folds
+    )
+
+    with mesmer.set_options(crossvalidation_workers=3):
+        result = _find_localized_empirical_covariance_np(
+            data, weights, localizer, k_folds
+        )
+
+    assert result[0] == expected[0]
+    np.testing.assert_allclose(result[2], expected[2])
+
+
+def test_get_neg_loglikelihood_release_gil(random_data_5x3):
+
+    covariance = np.cov(random_data_5x3, rowvar=False)
+    weights = np.array([0.5, 0.2, 0.3, 0.7, 1])
+
+    result = _get_neg_loglikelihood(
+        random_data_5x3, covariance, weights, release_gil=True
+    )
+    expected = 340.387267
+    np.testing.assert_allclose(result, expected)
+
+    data = random_data_5x3[1::2]
+    covariance = np.cov(data, rowvar=False)
+
+    with pytest.raises(np.linalg.LinAlgError):
+        _get_neg_loglikelihood(random_data_5x3, covariance, None, release_gil=True)
+
+
+@pytest.mark.parametrize("n_samples", [1, 7])
+def test_get_neg_loglikelihood_logpdf(n_samples):
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(n_samples, 4))
+    weights = rng.uniform(0.1, 1, size=n_samples)
+
+    covariance = np.cov(rng.normal(size=(10, 4)), rowvar=False)
+
+    result = _get_neg_loglikelihood(data, covariance, weights)
+
+    log_likelihood = scipy.stats.multivariate_normal.logpdf(data, cov=covariance)
+    log_likelihood = np.atleast_1d(log_likelihood)
+    expected = -np.average(log_likelihood, weights=weights) * n_samples
+
+    np.testing.assert_allclose(result, expected)
+
+
 def test_get_neg_loglikelihood_singular(random_data_5x3):
 
     # select data that leads to singular covariance matrix
@@ -410,3 +864,93 @@ def test_adjust_covariance_ar1(random_data_5x3, shape, dims):
 
     expected = xr.DataArray(expected, dims=("cell_i", "cell_j"))
     xr.testing.assert_allclose(result, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("n_bands", [2, 4])
+def test_adjust_covariance_ar1_banded(n_bands):
+
+    rng = np.random.default_rng(0)
+
+    n = 4
+    cov = np.cov(rng.normal(size=(10, n)), rowvar=False)
+
+    # keep only the bands of a shuffled order
+    permutation = rng.permutation(n)
+    reordered = cov[np.ix_(permutation, permutation)]
+    reordered[np.abs(np.subtract.outer(np.arange(n), np.arange(n))) >= n_bands] = 0
+
+    cov = np.empty_like(cov)
+    cov[np.ix_(permutation, permutation)] = reordered
+
+    banded = _sparse_to_banded(scipy.sparse.csr_array(cov), permutation, n_bands)
+    banded = _banded_to_dataarray(banded, "cells")
+
+    ar_coefs = xr.DataArray(rng.uniform(-0.9, 0.9, size=n), dims="cells")
+
+    result = mesmer.stats.adjust_covariance_ar1(banded, ar_coefs)
+
+    assert result.dims == ("band", "cells")
+    xr.testing.assert_equal(result.band_order, banded.band_order)
+
+    expected = _adjust_ecov_ar1_np(cov, ar_coefs.values)
+    np.testing.assert_allclose(_banded_from_dataarray(result).toarray(), expected)
+
+    with pytest.raises(ValueError, match=".*have length equal"):
+        mesmer.stats.adjust_covariance_ar1(banded, ar_coefs[:3])
+
+
+def test_sparse_localized_covariance_draw():
+    # geodist_sparse -> find -> adjust -> draw
+
+    lon, lat = get_lon_lat()
+    localisation_radii = [250, 500]
+
+    # fewer bands than gridpoints
+    geodist = mesmer.geospatial.geodist_sparse(lon, lat, max_distance=1000)
+    localizer = mesmer.stats.gaspari_cohn_correlation_matrices(
+        geodist, localisation_radii
+    )
+
+    n_gridpoints = lon.size
+    data = get_random_data(30, n_gridpoints)
+    weights = get_weights(30)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "First element is local minimum.")
+        warnings.filterwarnings("ignore", "No local minimum found")
+        localized_ecov = mesmer.stats.find_localized_empirical_covariance(
+            data, weights, localizer, dim="time", k_folds=5
+        )
+
+    coeffs = np.random.default_rng(0).uniform(-0.5, 0.5, size=(1, n_gridpoints))
+    ar_params = xr.Dataset(
+        {
+            "intercept": ("cell", np.zeros(n_gridpoints)),
+            "coeffs": (("lags", "cell"), coeffs),
+        }
+    )
+
+    covariance = mesmer.stats.adjust_covariance_ar1(
+        localized_ecov.localized_covariance, ar_params.coeffs
+    )
+
+    assert covariance.sizes["band"] < n_gridpoints
+
+    expected = _adjust_ecov_ar1_np(
+        _banded_from_dataarray(localized_ecov.localized_covariance).toarray(),
+        ar_params.coeffs.values,
+    )
+    np.testing.assert_allclose(_banded_from_dataarray(covariance).toarray(), expected)
+
+    result = mesmer.stats.draw_auto_regression_correlated(
+        ar_params,
+        covariance,
+        time=5,
+        realisation=2,
+        seed=0,
+        buffer=3,
+        sampler="direct",
+    )
+
+    assert result.samples.shape == (5, n_gridpoints, 2)
+    assert np.isfinite(result.samples).all()
@@ -18,7 +18,16 @@ def test_option_invalid_error(invalid_option) -> None:
 def test_get_options():
 
     result = mesmer.get_options()
-    expected = {"threads": "default"}
+    expected = {
+        "threads": "default",
+        "covariance_cache_size": 2**30,
+        "draw_workers": 1,
+        "crossvalidation_cache_size": 2**30,
+        "crossvalidation_workers": 1,
+        "geodist_workers": 1,
+        "disk_cache_dir": None,
+        "disk_cache_size": 2**33,
+    }
     assert result == expected
 
 
@@ -69,3 +78,66 @@ def test_options_threads() -> None:
     # not something we can reliably detect
     with threadpoolctl.threadpool_limits(limits=os.cpu_count()):
         assert func() == expected_default
+
+
+@pytest.mark.parametrize("value", [-1, 1.5, None, True])
+def test_options_crossvalidation_cache_size_errors(value) -> None:
+
+    msg = "'crossvalidation_cache_size' must be a non-negative integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(crossvalidation_cache_size=value)
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, None, True])
+def test_options_crossvalidation_workers_errors(value) -> None:
+
+    msg = "'crossvalidation_workers' must be a positive integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(crossvalidation_workers=value)
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, None, True])
+def test_options_geodist_workers_errors(value) -> None:
+
+    msg = "'geodist_workers' must be a positive integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(geodist_workers=value)
+
+
+@pytest.mark.parametrize("value", [1, 1.5, True])
+def test_options_disk_cache_dir_errors(value) -> None:
+
+    msg = "'disk_cache_dir' must be a path or None"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(disk_cache_dir=value)
+
+
+@pytest.mark.parametrize("value", [-1, 1.5, None, True])
+def test_options_disk_cache_size_errors(value) -> None:
+
+    msg = "'disk_cache_size' must be a non-negative integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(disk_cache_size=value)
+
+
+@pytest.mark.parametrize("value", [-1, 1.5, None, True])
+def test_options_covariance_cache_size_errors(value) -> None:
+
+    msg = "'covariance_cache_size' must be a non-negative integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(covariance_cache_size=value)
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, None, True])
+def test_options_draw_workers_errors(value) -> None:
+
+    msg = "'draw_workers' must be a positive integer"
+
+    with pytest.raises(ValueError, match=msg):
+        mesmer.set_options(draw_workers=value)
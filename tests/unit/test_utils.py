@@ -3,9 +3,11 @@ import warnings
 import numpy as np
 import pandas as pd
 import pytest
+import threadpoolctl
 import xarray as xr
 from packaging.version import Version
 
+import mesmer
 import mesmer._core.utils
 from unit import assert_no_warnings
 
@@ -195,6 +197,69 @@ def test_minimize_local_discrete_valid_later():
     assert result == 1
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        (5, 4, 3, 2, 3, 0),
+        (1, 0, 1, 2),
+        (9, 8, 7, 6, 5, 4, 3, 2, 1, 1, 0, 1, 2, 3, 4, 5, 6),
+        (np.inf, np.inf, 4, 3, 3, 2, 3, np.inf, np.inf, np.inf),
+        (5, 2, np.inf, 3),
+    ],
+)
+def test_bracketing_search_like_linear(values):
+
+    def func(i):
+        return values[i]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", mesmer._core.utils.OptimizeWarning)
+        expected = mesmer._core.utils._minimize_local_discrete(func, range(len(values)))
+        result = mesmer._core.utils._BracketingSearch()(func, range(len(values)))
+
+    assert result == expected
+
+
+def test_bracketing_search_evaluations():
+
+    values = np.abs(np.arange(100) - 70)
+    evaluated = []
+
+    def func(i):
+        evaluated.append(i)
+        return values[i]
+
+    search = mesmer._core.utils._BracketingSearch()
+    result = search(func, range(100))
+
+    assert result == 70
+    # each element is evaluated at most once
+    assert len(evaluated) == len(set(evaluated)) == search.n_evaluations
+    assert search.n_evaluations < 20
+    assert search.n_evaluations_saved == 72 - search.n_evaluations
+
+
+def test_bracketing_search_warnings():
+
+    search = mesmer._core.utils._BracketingSearch()
+
+    with pytest.warns(mesmer._core.utils.OptimizeWarning, match="No local minimum"):
+        result = search(lambda i: -i, range(10))
+    assert result == 9
+
+    with pytest.warns(
+        mesmer._core.utils.OptimizeWarning, match="First element is local minimum."
+    ):
+        result = search(lambda i: i, range(10))
+    assert result == 0
+
+    with pytest.raises(ValueError, match=r"`fun` returned `inf` for all positions"):
+        search(lambda i: float("inf"), range(10))
+
+    with pytest.raises(ValueError, match=r"`fun` returned `\-inf` at position '0'"):
+        search(lambda i: float("-inf"), range(10))
+
+
 def test_create_equal_dim_names():
 
     with pytest.raises(ValueError, match="must provide exactly two suffixes"):
@@ -539,3 +604,22 @@ def test_ignore_warnings():
 
     with pytest.warns(match="bar"):
         func2()
+
+
+@pytest.mark.parametrize(
+    "threads, workers, expected", [(8, 3, 2), (2, 4, 1), (None, 2, None)]
+)
+def test_divide_threads_between_workers(threads, workers, expected):
+
+    with mesmer.set_options(threads=threads):
+        with mesmer._core.utils._divide_threads_between_workers(
+            workers, crossvalidation_workers=1
+        ):
+            assert mesmer.get_options()["threads"] is None
+            assert mesmer.get_options()["crossvalidation_workers"] == 1
+
+            if expected is not None:
+                info = threadpoolctl.threadpool_info()
+                assert all(lib["num_threads"] == expected for lib in info)
+
+        assert mesmer.get_options()["threads"] == threads